@@ -1,25 +1,31 @@
 """Main ECL calculation engine - orchestrates PD, LGD, and EAD calculations."""
 
+import logging
+import math
 from datetime import date
-from decimal import Decimal
-from typing import List, Optional
-from collections import defaultdict
+from typing import Dict, List, Optional
 
+import numpy as np
+
+from models.portfolio_array import PortfolioArray
 from models.portfolio_item import PortfolioItem
 from models.calculation_results import ECLResult, PortfolioECLResult
 from models.scenario_config import ScenarioConfig
-from models.enums import Stage
+from models.enums import Stage, STAGE_CODES
 
 from core.probability_of_default import PDCalculator
 from core.loss_given_default import LGDCalculator
 from core.exposure import EADCalculator
 from core.staging_framework import StagingFramework
+from core._kernels import _period_ecl_kernel, _portfolio_ecl_kernel
 
 from utils.config import get_config
-from utils.logger import get_logger
+from utils.logger import get_logger, is_enabled_for
 
 logger = get_logger(__name__)
 
+_STAGES = list(Stage)
+
 
 class ECLCalculationEngine:
     """Main engine for calculating Expected Credit Loss (ECL).
@@ -61,62 +67,59 @@ class ECLCalculationEngine:
         Returns:
             ECL calculation result
         """
+        # 12-month PD is shared by staging and the stage calculations
+        pd_12m = self.pd_calculator.calculate_12m_pd(item)
+
         # Reclassify stage if requested
         if apply_staging:
             original_stage = item.current_stage
-            pd_12m = self.pd_calculator.calculate_12m_pd(item)
             item.current_stage = self.staging_framework.classify_stage(item, pd_12m)
 
             if item.current_stage != original_stage:
-                logger.debug(
-                    "Stage reclassified",
-                    item_id=item.item_id,
-                    from_stage=str(original_stage),
-                    to_stage=str(item.current_stage)
-                )
+                if is_enabled_for(logging.DEBUG):
+                    logger.debug(
+                        "Stage reclassified",
+                        item_id=item.item_id,
+                        from_stage=str(original_stage),
+                        to_stage=str(item.current_stage)
+                    )
 
         # Determine if Stage 1 (12-month) or Stage 2/3 (lifetime)
         if item.current_stage == Stage.STAGE_1:
-            return self.calculate_stage_1_ecl(item, scenario)
+            return self.calculate_stage_1_ecl(item, scenario, pd_12m)
         else:
-            return self.calculate_stage_2_3_ecl(item, scenario)
+            return self.calculate_stage_2_3_ecl(item, scenario, pd_12m)
 
     def calculate_stage_1_ecl(
         self,
         item: PortfolioItem,
-        scenario: Optional[ScenarioConfig] = None
+        scenario: Optional[ScenarioConfig] = None,
+        pd_12m: Optional[float] = None
     ) -> ECLResult:
         """Calculate 12-month ECL for Stage 1 item.
 
         Args:
             item: Portfolio item (must be Stage 1)
             scenario: Optional scenario configuration
+            pd_12m: Optional precomputed 12-month PD
 
         Returns:
             ECL calculation result
         """
-        # Calculate 12-month PD
-        pd = self.pd_calculator.calculate_12m_pd(item)
+        # Calculate 12-month PD and EAD
+        pd = pd_12m if pd_12m is not None else self.pd_calculator.calculate_12m_pd(item)
+        ead = self.ead_calculator.calculate_current_ead_float(item)
 
-        # Apply scenario adjustment to PD
+        # Apply scenario adjustments to PD and EAD
         if scenario:
             pd = self.pd_calculator.apply_scenario_adjustment(
                 pd,
                 scenario.pd_multiplier
             )
-
-        # Calculate EAD
-        ead = self.ead_calculator.calculate_current_ead(item)
-
-        # Apply scenario adjustment to EAD
-        if scenario:
-            ead = self.ead_calculator.calculate_ead_with_scenario_adjustment(
-                item,
-                scenario.ead_multiplier
-            )
+            ead *= scenario.ead_multiplier
 
         # Calculate LGD
-        lgd = self.lgd_calculator.calculate_lgd(item, ead)
+        lgd, unsecured_exposure = self.lgd_calculator.calculate_lgd_and_unsecured(item, ead)
 
         # Apply scenario adjustment to LGD
         if scenario:
@@ -127,7 +130,7 @@ class ECLCalculationEngine:
             )
 
         # Calculate ECL
-        ecl_amount = ead * Decimal(str(pd)) * Decimal(str(lgd))
+        ecl_amount = ead * pd * lgd
 
         # Create result
         result = ECLResult(
@@ -140,57 +143,63 @@ class ECLCalculationEngine:
             time_horizon_months=12,
             scenario_name=scenario.name if scenario else None,
             scenario_type=scenario.scenario_type if scenario else None,
-            collateral_value=item.collateral_value,
-            unsecured_exposure=self.lgd_calculator._calculate_unsecured_exposure(item, ead),
+            collateral_value=item.collateral_f,
+            unsecured_exposure=unsecured_exposure,
         )
 
-        logger.debug(
-            "Calculated Stage 1 ECL",
-            item_id=item.item_id,
-            pd=pd,
-            lgd=lgd,
-            ead=float(ead),
-            ecl=float(ecl_amount)
-        )
+        if is_enabled_for(logging.DEBUG):
+            logger.debug(
+                "Calculated Stage 1 ECL",
+                item_id=item.item_id,
+                pd=pd,
+                lgd=lgd,
+                ead=ead,
+                ecl=ecl_amount
+            )
 
         return result
 
     def calculate_stage_2_3_ecl(
         self,
         item: PortfolioItem,
-        scenario: Optional[ScenarioConfig] = None
+        scenario: Optional[ScenarioConfig] = None,
+        pd_12m: Optional[float] = None
     ) -> ECLResult:
         """Calculate lifetime ECL for Stage 2/3 item.
 
         Args:
             item: Portfolio item (must be Stage 2 or 3)
             scenario: Optional scenario configuration
+            pd_12m: Optional precomputed 12-month PD
 
         Returns:
             ECL calculation result
         """
-        # Calculate lifetime PD
-        lifetime_pd = self.pd_calculator.calculate_lifetime_pd(item)
+        if pd_12m is None:
+            pd_12m = self.pd_calculator.calculate_12m_pd(item)
 
-        # Apply scenario adjustment to PD
-        if scenario:
-            lifetime_pd = self.pd_calculator.apply_scenario_adjustment(
-                lifetime_pd,
-                scenario.pd_multiplier
-            )
+        # Marginal PD curve is computed once and reused for lifetime PD and period ECL
+        remaining_months = item.remaining_term_months
+        marginal_pds = self.pd_calculator.get_marginal_pd_curve(item, pd_12m, remaining_months)
+        lifetime_pd = self.pd_calculator.calculate_lifetime_pd(
+            item,
+            pd_12m=pd_12m,
+            marginal_pds=marginal_pds
+        )
 
         # Calculate EAD
-        ead = self.ead_calculator.calculate_current_ead(item)
+        ead = self.ead_calculator.calculate_current_ead_float(item)
 
-        # Apply scenario adjustment to EAD
+        # Apply scenario adjustments to PD and EAD
         if scenario:
-            ead = self.ead_calculator.calculate_ead_with_scenario_adjustment(
-                item,
-                scenario.ead_multiplier
+            lifetime_pd = self.pd_calculator.apply_scenario_adjustment(
+                lifetime_pd,
+                scenario.pd_multiplier
             )
+            ead *= scenario.ead_multiplier
 
         # Calculate LGD with downturn adjustment for Stage 2/3
-        lgd = self.lgd_calculator.calculate_lgd(
+        lgd, unsecured_exposure = self.lgd_calculator.calculate_lgd_and_unsecured(
             item,
             ead,
             apply_downturn=(item.current_stage == Stage.STAGE_2)
@@ -204,22 +213,16 @@ class ECLCalculationEngine:
                 scenario.lgd_downturn_factor
             )
 
-        # For detailed lifetime ECL, get marginal PDs
-        remaining_months = item.remaining_term_months
-        marginal_pds, cumulative_pds = self.pd_calculator.get_lifetime_pd_curve(item)
+        # Calculate period ECL (simplified - same EAD and LGD for all periods)
+        pd_multiplier = scenario.pd_multiplier if scenario else 1.0
+        period_ecl = _period_ecl_kernel(ead, lgd, marginal_pds, pd_multiplier)
 
-        # Apply scenario adjustment to marginal PDs if needed
+        # Scenario adjustment applied to marginal PDs (in place, curve is not reused)
         if scenario:
-            marginal_pds = [pd * scenario.pd_multiplier for pd in marginal_pds]
-
-        # Calculate period ECL (simplified - same EAD and LGD for all periods)
-        period_ecl = [
-            ead * Decimal(str(mpd)) * Decimal(str(lgd))
-            for mpd in marginal_pds
-        ]
+            marginal_pds *= pd_multiplier
 
-        # Total lifetime ECL
-        ecl_amount = sum(period_ecl) if period_ecl else Decimal('0')
+        # Total lifetime ECL (single float reduction)
+        ecl_amount = float(period_ecl.sum())
 
         # Create result
         result = ECLResult(
@@ -232,21 +235,22 @@ class ECLCalculationEngine:
             time_horizon_months=remaining_months,
             scenario_name=scenario.name if scenario else None,
             scenario_type=scenario.scenario_type if scenario else None,
-            collateral_value=item.collateral_value,
-            unsecured_exposure=self.lgd_calculator._calculate_unsecured_exposure(item, ead),
-            period_ecl=period_ecl if period_ecl else None,
-            period_pd=marginal_pds if marginal_pds else None,
+            collateral_value=item.collateral_f,
+            unsecured_exposure=unsecured_exposure,
+            period_ecl=period_ecl if period_ecl.size else None,
+            period_pd=marginal_pds if marginal_pds.size else None,
         )
 
-        logger.debug(
-            "Calculated Stage 2/3 ECL",
-            item_id=item.item_id,
-            stage=str(item.current_stage),
-            lifetime_pd=lifetime_pd,
-            lgd=lgd,
-            ead=float(ead),
-            ecl=float(ecl_amount)
-        )
+        if is_enabled_for(logging.DEBUG):
+            logger.debug(
+                "Calculated Stage 2/3 ECL",
+                item_id=item.item_id,
+                stage=str(item.current_stage),
+                lifetime_pd=lifetime_pd,
+                lgd=lgd,
+                ead=ead,
+                ecl=ecl_amount
+            )
 
         return result
 
@@ -272,25 +276,113 @@ class ECLCalculationEngine:
             scenario=scenario.name if scenario else "base"
         )
 
-        # Calculate ECL for each item
+        # Calculate ECL for each item that passes the up-front checks (keeping
+        # the items that succeeded in step; anything the checks miss is
+        # logged and skipped the same way)
         item_results = []
-        for item in items:
+        calculated_items = []
+        for item in self._filter_calculable_items(items):
             try:
                 result = self.calculate_ecl(item, scenario, apply_staging)
-                item_results.append(result)
             except Exception as e:
                 logger.error(
                     "Failed to calculate ECL for item",
                     item_id=item.item_id,
                     error=str(e)
                 )
-                # Continue with other items
+                continue
+            item_results.append(result)
+            calculated_items.append(item)
 
         # Aggregate results
         portfolio_result = self._aggregate_results(
             item_results,
             scenario,
-            items
+            calculated_items
+        )
+
+        logger.info(
+            "Portfolio ECL calculated",
+            total_ecl=float(portfolio_result.total_ecl),
+            total_exposure=float(portfolio_result.total_exposure),
+            coverage_ratio=portfolio_result.coverage_ratio
+        )
+
+        return portfolio_result
+
+    def calculate_portfolio_ecl_vectorized(
+        self,
+        items: List[PortfolioItem],
+        scenario: Optional[ScenarioConfig] = None,
+        apply_staging: bool = True
+    ) -> PortfolioECLResult:
+        """Calculate ECL for entire portfolio using array arithmetic.
+
+        Produces the same figures as ``calculate_portfolio_ecl`` but builds
+        struct-of-arrays columns once and evaluates PD × LGD × EAD as NumPy
+        expressions over the whole portfolio. Per-period breakdowns
+        (``period_ecl``/``period_pd``) are not populated.
+
+        Args:
+            items: List of portfolio items
+            scenario: Optional scenario configuration
+            apply_staging: Whether to reclassify stages before calculation
+
+        Returns:
+            Portfolio ECL result
+        """
+        logger.info(
+            "Calculating portfolio ECL (vectorized)",
+            item_count=len(items),
+            scenario=scenario.name if scenario else "base"
+        )
+
+        items = self._filter_calculable_items(items)
+        columns = self._build_portfolio_columns(items, apply_staging)
+        stage_codes = columns['stage_codes']
+        is_lifetime = stage_codes != STAGE_CODES[Stage.STAGE_1]
+
+        # EAD = Outstanding + (CCF × Undrawn)
+        ead = columns['ead']
+        if scenario:
+            ead = ead * scenario.ead_multiplier
+
+        # LGD (downturn adjustment applies to Stage 2 only)
+        unsecured = self.lgd_calculator.calculate_unsecured_exposure_batch(
+            ead,
+            columns['collateral'],
+            columns['haircut']
+        )
+        lgd = self.lgd_calculator.calculate_lgd_batch(
+            ead,
+            unsecured,
+            apply_downturn=(stage_codes == STAGE_CODES[Stage.STAGE_2])
+        )
+        if scenario:
+            lgd = self.lgd_calculator.apply_scenario_adjustment_batch(
+                lgd,
+                scenario.lgd_multiplier,
+                scenario.lgd_downturn_factor
+            )
+
+        # ECL = PD × LGD × EAD, evaluated across items in parallel
+        pd, ecl = _portfolio_ecl_kernel(
+            ead,
+            lgd,
+            columns['pd_12m'],
+            columns['cumulative_pd'],
+            columns['remaining_months'],
+            is_lifetime,
+            scenario.pd_multiplier if scenario else 1.0,
+            self.pd_calculator.floor,
+            self.pd_calculator.ceiling,
+            scenario is not None
+        )
+
+        time_horizon = np.where(is_lifetime, columns['remaining_months'], 12)
+
+        portfolio_result = self._build_portfolio_result(
+            items, scenario, pd, lgd, ead, unsecured, ecl, time_horizon
         )
 
         logger.info(
@@ -302,6 +394,275 @@ class ECLCalculationEngine:
 
         return portfolio_result
 
+    def calculate_portfolio_ecl_scenarios(
+        self,
+        items: List[PortfolioItem],
+        scenarios: List[ScenarioConfig],
+        apply_staging: bool = True
+    ) -> Dict[str, PortfolioECLResult]:
+        """Calculate portfolio ECL under several scenarios in one pass.
+
+        Item columns are built once; scenario multipliers are broadcast as
+        ``(scenarios, 1)`` against ``(1, items)`` vectors so every scenario
+        is evaluated as a single ``(scenarios, items)`` array expression.
+
+        Args:
+            items: List of portfolio items
+            scenarios: Scenario configurations to evaluate
+            apply_staging: Whether to reclassify stages before calculation
+
+        Returns:
+            Dictionary mapping scenario name to portfolio ECL result
+        """
+        logger.info(
+            "Calculating portfolio ECL for scenarios",
+            item_count=len(items),
+            scenario_count=len(scenarios)
+        )
+
+        if not scenarios:
+            return {}
+
+        items = self._filter_calculable_items(items)
+        columns = self._build_portfolio_columns(items, apply_staging)
+        stage_codes = columns['stage_codes']
+        remaining_months = columns['remaining_months']
+        is_lifetime = stage_codes != STAGE_CODES[Stage.STAGE_1]
+
+        # Scenario multipliers as column vectors, shape (S, 1)
+        ead_multiplier = np.array([[s.ead_multiplier] for s in scenarios], dtype=np.float64)
+        lgd_multiplier = np.array([[s.lgd_multiplier] for s in scenarios], dtype=np.float64)
+        lgd_downturn_factor = np.array([[s.lgd_downturn_factor] for s in scenarios], dtype=np.float64)
+        pd_multiplier = np.array([[s.pd_multiplier] for s in scenarios], dtype=np.float64)
+
+        # EAD and LGD, shape (S, N)
+        ead = columns['ead'] * ead_multiplier
+        unsecured = self.lgd_calculator.calculate_unsecured_exposure_batch(
+            ead,
+            columns['collateral'],
+            columns['haircut']
+        )
+        lgd = self.lgd_calculator.calculate_lgd_batch(
+            ead,
+            unsecured,
+            apply_downturn=(stage_codes == STAGE_CODES[Stage.STAGE_2])
+        )
+        lgd = self.lgd_calculator.apply_scenario_adjustment_batch(
+            lgd,
+            lgd_multiplier,
+            lgd_downturn_factor
+        )
+
+        # PD: 12-month for Stage 1, lifetime for Stage 2/3
+        cumulative_pd = columns['cumulative_pd']
+        base_pd = np.where(is_lifetime & (remaining_months > 12), cumulative_pd, columns['pd_12m'])
+        pd = self.pd_calculator.apply_scenario_adjustment_batch(base_pd, pd_multiplier)
+
+        # ECL = PD × LGD × EAD (lifetime ECL scales the unbounded cumulative PD)
+        ecl = ead * lgd * np.where(is_lifetime, cumulative_pd * pd_multiplier, pd)
+
+        time_horizon = np.where(is_lifetime, remaining_months, 12)
+
+        results = {
+            scenario.name: self._build_portfolio_result(
+                items, scenario, pd[s], lgd[s], ead[s], unsecured[s], ecl[s], time_horizon
+            )
+            for s, scenario in enumerate(scenarios)
+        }
+
+        logger.info(
+            "Scenario portfolio ECL calculated",
+            total_ecl={name: float(result.total_ecl) for name, result in results.items()}
+        )
+
+        return results
+
+    def _filter_calculable_items(self, items: List[PortfolioItem]) -> List[PortfolioItem]:
+        """Drop items whose data cannot be used in an ECL calculation.
+
+        Invalid items are logged and excluded before calculation, so the
+        vectorized calculations, which cannot skip a single item, only see
+        usable data.
+
+        Args:
+            items: List of portfolio items
+
+        Returns:
+            Items that can be calculated, in their original order
+        """
+        valid_items = []
+        for item in items:
+            error = self._get_calculation_error(item)
+            if error is None:
+                valid_items.append(item)
+            else:
+                logger.error(
+                    "Failed to calculate ECL for item",
+                    item_id=item.item_id,
+                    error=error
+                )
+
+        return valid_items
+
+    @staticmethod
+    def _get_calculation_error(item: PortfolioItem) -> Optional[str]:
+        """Check that an item has the inputs required for ECL calculation.
+
+        Args:
+            item: Portfolio item
+
+        Returns:
+            Error message, or None if the item can be calculated
+        """
+        dates = (
+            ('origination_date', item.origination_date),
+            ('maturity_date', item.maturity_date),
+            ('reporting_date', item.reporting_date),
+        )
+        for name, value in dates:
+            if not isinstance(value, date):
+                return f"{name} must be a date"
+
+        amounts = (
+            ('outstanding_amount', item.outstanding_amount),
+            ('undrawn_commitment', item.undrawn_commitment),
+            ('collateral_value', item.collateral_value),
+        )
+        for name, amount in amounts:
+            if not amount.is_finite() or amount < 0:
+                return f"{name} must be a non-negative amount, got {amount}"
+
+        numerics = (
+            ('credit_score', item.credit_score),
+            ('days_past_due', item.days_past_due),
+            ('times_past_due_12m', item.times_past_due_12m),
+        )
+        for name, value in numerics:
+            if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value):
+                return f"{name} must be numeric, got {value!r}"
+
+        optional_numerics = (
+            ('interest_rate', item.interest_rate),
+            ('origination_pd', item.origination_pd),
+            ('previous_pd', item.previous_pd),
+        )
+        for name, value in optional_numerics:
+            if value is not None and (isinstance(value, bool) or not isinstance(value, (int, float))):
+                return f"{name} must be numeric, got {value!r}"
+
+        if not isinstance(item.current_stage, Stage):
+            return f"current_stage must be a Stage, got {item.current_stage!r}"
+
+        return None
+
+    def _build_portfolio_columns(
+        self,
+        items: List[PortfolioItem],
+        apply_staging: bool
+    ) -> Dict[str, np.ndarray]:
+        """Build scenario-independent struct-of-arrays columns for items.
+
+        Amounts, PD inputs and stages come from one ``PortfolioArray``;
+        only CCF, haircut and remaining term are read per item here.
+
+        Args:
+            items: List of portfolio items
+            apply_staging: Whether to reclassify stages (updates items in place)
+
+        Returns:
+            Dictionary of column name to array: ``ead`` (unadjusted),
+            ``collateral``, ``haircut``, ``pd_12m``, ``cumulative_pd``,
+            ``remaining_months`` and ``stage_codes``
+        """
+        n = len(items)
+        portfolio = PortfolioArray.from_items(items)
+        pd_12m = self.pd_calculator.calculate_12m_pd_batch(items, portfolio=portfolio)
+
+        # Reclassify all stages at once if requested
+        if apply_staging:
+            portfolio.stage_code = self.staging_framework.classify_stage_batch(items, pd_12m, portfolio=portfolio)
+            for item, code in zip(items, portfolio.stage_code.tolist()):
+                item.current_stage = _STAGES[code]
+
+        # Fields the shared columns do not carry, in a single pass over the items
+        ccf = np.empty(n, dtype=np.float64)
+        haircut = np.empty(n, dtype=np.float64)
+        remaining_months = np.empty(n, dtype=np.int64)
+        for i, item in enumerate(items):
+            ccf[i] = self.ead_calculator._get_ccf(item)
+            haircut[i] = self.lgd_calculator._get_collateral_haircut(item.collateral_key)
+            remaining_months[i] = item.remaining_term_months
+
+        return {
+            'ead': portfolio.outstanding + ccf * portfolio.undrawn,
+            'collateral': portfolio.collateral,
+            'haircut': haircut,
+            'pd_12m': pd_12m,
+            'cumulative_pd': self.pd_calculator.calculate_cumulative_pd_batch(
+                pd_12m,
+                portfolio.stage_code,
+                remaining_months
+            ),
+            'remaining_months': remaining_months,
+            'stage_codes': portfolio.stage_code,
+        }
+
+    def _build_portfolio_result(
+        self,
+        items: List[PortfolioItem],
+        scenario: Optional[ScenarioConfig],
+        pd: np.ndarray,
+        lgd: np.ndarray,
+        ead: np.ndarray,
+        unsecured: np.ndarray,
+        ecl: np.ndarray,
+        time_horizon: np.ndarray
+    ) -> PortfolioECLResult:
+        """Materialize per-item results from arrays and aggregate them.
+
+        Args:
+            items: List of portfolio items
+            scenario: Scenario configuration (if any)
+            pd: Reported PD per item
+            lgd: LGD per item
+            ead: EAD per item
+            unsecured: Unsecured exposure per item
+            ecl: ECL per item
+            time_horizon: Time horizon in months per item
+
+        Returns:
+            Aggregated portfolio ECL result
+        """
+        scenario_name = scenario.name if scenario else None
+        scenario_type = scenario.scenario_type if scenario else None
+
+        item_results = [
+            ECLResult(
+                item_id=item.item_id,
+                stage=item.current_stage,
+                probability_of_default=item_pd,
+                loss_given_default=item_lgd,
+                exposure_at_default=item_ead,
+                ecl_amount=item_ecl,
+                time_horizon_months=item_horizon,
+                scenario_name=scenario_name,
+                scenario_type=scenario_type,
+                collateral_value=item.collateral_f,
+                unsecured_exposure=item_unsecured,
+            )
+            for item, item_pd, item_lgd, item_ead, item_ecl, item_horizon, item_unsecured in zip(
+                items,
+                pd.tolist(),
+                lgd.tolist(),
+                ead.tolist(),
+                ecl.tolist(),
+                time_horizon.tolist(),
+                unsecured.tolist()
+            )
+        ]
+
+        return self._aggregate_results(item_results, scenario, items)
+
     def _aggregate_results(
         self,
         item_results: List[ECLResult],
@@ -313,61 +674,18 @@ class ECLCalculationEngine:
         Args:
             item_results: List of individual ECL results
             scenario: Scenario configuration (if any)
-            items: Original portfolio items
+            items: Portfolio items, in the same order as ``item_results``
 
         Returns:
             Aggregated portfolio ECL result
         """
-        # Initialize aggregations
-        total_ecl = Decimal('0')
-        total_exposure = Decimal('0')
-
-        stage_ecl = {Stage.STAGE_1: Decimal('0'), Stage.STAGE_2: Decimal('0'), Stage.STAGE_3: Decimal('0')}
-        stage_exposure = {Stage.STAGE_1: Decimal('0'), Stage.STAGE_2: Decimal('0'), Stage.STAGE_3: Decimal('0')}
-        stage_count = {Stage.STAGE_1: 0, Stage.STAGE_2: 0, Stage.STAGE_3: 0}
-
-        ecl_by_sector = defaultdict(Decimal)
-        ecl_by_product = defaultdict(Decimal)
-
-        # Create item lookup
-        item_lookup = {item.item_id: item for item in items}
-
-        # Aggregate
-        for result in item_results:
-            total_ecl += result.ecl_amount
-            total_exposure += result.exposure_at_default
-
-            stage_ecl[result.stage] += result.ecl_amount
-            stage_exposure[result.stage] += result.exposure_at_default
-            stage_count[result.stage] += 1
-
-            # Get item for sector/product
-            item = item_lookup.get(result.item_id)
-            if item:
-                ecl_by_sector[item.sector] += result.ecl_amount
-                ecl_by_product[item.product_type] += result.ecl_amount
-
-        # Create portfolio result
-        portfolio_result = PortfolioECLResult(
-            total_ecl=total_ecl,
-            total_exposure=total_exposure,
-            total_items=len(item_results),
-            stage_1_ecl=stage_ecl[Stage.STAGE_1],
-            stage_2_ecl=stage_ecl[Stage.STAGE_2],
-            stage_3_ecl=stage_ecl[Stage.STAGE_3],
-            stage_1_exposure=stage_exposure[Stage.STAGE_1],
-            stage_2_exposure=stage_exposure[Stage.STAGE_2],
-            stage_3_exposure=stage_exposure[Stage.STAGE_3],
-            stage_1_count=stage_count[Stage.STAGE_1],
-            stage_2_count=stage_count[Stage.STAGE_2],
-            stage_3_count=stage_count[Stage.STAGE_3],
-            item_results=item_results,
-            ecl_by_sector=dict(ecl_by_sector),
-            ecl_by_product=dict(ecl_by_product),
+        return PortfolioECLResult.from_item_results(
+            item_results,
+            sectors=[item.sector for item in items],
+            products=[item.product_type for item in items],
+            ratings=[item.internal_rating for item in items],
             scenario_name=scenario.name if scenario else None,
             scenario_type=scenario.scenario_type if scenario else None,
             scenario_probability=scenario.probability if scenario else None,
             calculation_date=date.today().isoformat(),
         )
-
-        return portfolio_result
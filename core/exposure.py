@@ -1,11 +1,13 @@
 """Exposure at Default (EAD) calculations."""
 
+import logging
+import math
 from decimal import Decimal
 from typing import Optional
 
 from models.portfolio_item import PortfolioItem
 from utils.config import get_config
-from utils.logger import get_logger
+from utils.logger import get_logger, is_enabled_for
 
 logger = get_logger(__name__)
 
@@ -21,6 +23,10 @@ class EADCalculator:
         """
         self.config = config or get_config().get_section('ead')
 
+        # Credit conversion factors
+        self.ccf_by_product = dict(self.config.get('ccf_by_product', {}))
+        self.default_ccf = self.config.get('ccf', 0.75)
+
     def calculate_current_ead(
         self,
         item: PortfolioItem,
@@ -40,18 +46,43 @@ class EADCalculator:
         # Get credit conversion factor
         ccf = self._get_ccf(item, ccf_override)
 
+        # Calculate EAD exactly in Decimal
+        return item.outstanding_amount + item.undrawn_commitment * Decimal(str(ccf))
+
+    def calculate_current_ead_float(
+        self,
+        item: PortfolioItem,
+        ccf_override: Optional[float] = None
+    ) -> float:
+        """Calculate current EAD as a float.
+
+        Float counterpart of ``calculate_current_ead`` used by the ECL engine,
+        which only converts to Decimal when building results.
+
+        Args:
+            item: Portfolio item
+            ccf_override: Optional CCF override (otherwise uses config)
+
+        Returns:
+            Current EAD
+        """
+        # Get credit conversion factor
+        ccf = self._get_ccf(item, ccf_override)
+
         # Calculate EAD
-        undrawn_exposure = item.undrawn_commitment * Decimal(str(ccf))
-        ead = item.outstanding_amount + undrawn_exposure
-
-        logger.debug(
-            "Calculated current EAD",
-            item_id=item.item_id,
-            outstanding=float(item.outstanding_amount),
-            undrawn=float(item.undrawn_commitment),
-            ccf=ccf,
-            ead=float(ead)
-        )
+        outstanding = item.outstanding_f
+        undrawn = item.undrawn_f
+        ead = outstanding + ccf * undrawn
+
+        if is_enabled_for(logging.DEBUG):
+            logger.debug(
+                "Calculated current EAD",
+                item_id=item.item_id,
+                outstanding=outstanding,
+                undrawn=undrawn,
+                ccf=ccf,
+                ead=ead
+            )
 
         return ead
 
@@ -76,18 +107,26 @@ class EADCalculator:
             Projected EAD
         """
         # Start with current amounts
-        outstanding = float(item.outstanding_amount)
-        undrawn = float(item.undrawn_commitment)
-
-        # Project forward month by month
-        for _ in range(months_ahead):
-            # Apply prepayments
-            outstanding = outstanding * (1 - prepayment_rate)
-
-            # Apply drawdowns
-            drawdown = undrawn * drawdown_rate
-            outstanding += drawdown
-            undrawn -= drawdown
+        outstanding = item.outstanding_f
+        undrawn = item.undrawn_f
+        months = max(months_ahead, 0)
+
+        # Closed-form solution of the monthly recurrence:
+        #   outstanding[t+1] = outstanding[t] * (1 - prepayment) + undrawn[t] * drawdown
+        #   undrawn[t+1] = undrawn[t] * (1 - drawdown)
+        if months > 0:
+            a = 1 - prepayment_rate
+            b = 1 - drawdown_rate
+            a_t = math.pow(a, months)
+            b_t = math.pow(b, months)
+
+            if a == b:
+                drawn = drawdown_rate * undrawn * months * math.pow(a, months - 1)
+            else:
+                drawn = drawdown_rate * undrawn * (a_t - b_t) / (a - b)
+
+            outstanding = outstanding * a_t + drawn
+            undrawn = undrawn * b_t
 
         # Get CCF
         ccf = self._get_ccf(item, ccf_override)
@@ -110,15 +149,8 @@ class EADCalculator:
         if ccf_override is not None:
             return ccf_override
 
-        # Try product-specific CCF
-        ccf_by_product = self.config.get('ccf_by_product', {})
-        product_type_lower = item.product_type.lower().replace(' ', '_')
-
-        if product_type_lower in ccf_by_product:
-            return ccf_by_product[product_type_lower]
-
-        # Use default CCF
-        return self.config.get('ccf', 0.75)
+        # Product-specific CCF, falling back to default CCF
+        return self.ccf_by_product.get(item.product_key, self.default_ccf)
 
     def calculate_ead_with_scenario_adjustment(
         self,
@@ -139,12 +171,13 @@ class EADCalculator:
         base_ead = self.calculate_current_ead(item)
         adjusted_ead = base_ead * Decimal(str(scenario_multiplier))
 
-        logger.debug(
-            "Applied scenario adjustment to EAD",
-            item_id=item.item_id,
-            base_ead=float(base_ead),
-            multiplier=scenario_multiplier,
-            adjusted_ead=float(adjusted_ead)
-        )
+        if is_enabled_for(logging.DEBUG):
+            logger.debug(
+                "Applied scenario adjustment to EAD",
+                item_id=item.item_id,
+                base_ead=float(base_ead),
+                multiplier=scenario_multiplier,
+                adjusted_ead=float(adjusted_ead)
+            )
 
         return adjusted_ead
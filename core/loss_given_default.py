@@ -1,11 +1,13 @@
 """Loss Given Default (LGD) calculations."""
 
-from decimal import Decimal
-from typing import Optional
+import logging
+from typing import Dict, Optional, Tuple
+
+import numpy as np
 
 from models.portfolio_item import PortfolioItem
 from utils.config import get_config
-from utils.logger import get_logger
+from utils.logger import get_logger, is_enabled_for
 
 logger = get_logger(__name__)
 
@@ -21,10 +23,21 @@ class LGDCalculator:
         """
         self.config = config or get_config().get_section('lgd')
 
+        # LGD parameters
+        self.unsecured_base = self.config.get('unsecured_base', 0.45)
+        self.secured_base = self.config.get('secured_base', 0.25)
+        self.downturn_multiplier = self.config.get('downturn_multiplier', 1.25)
+        self.floor = self.config.get('floor', 0.01)
+        self.ceiling = self.config.get('ceiling', 1.00)
+
+        # Collateral haircuts, memoized per collateral type
+        self.collateral_haircuts = dict(self.config.get('collateral_haircuts', {}))
+        self._haircut_cache: Dict[str, float] = {}
+
     def calculate_lgd(
         self,
         item: PortfolioItem,
-        exposure: Decimal,
+        exposure: float,
         apply_downturn: bool = False
     ) -> float:
         """Calculate LGD for an exposure.
@@ -39,22 +52,35 @@ class LGDCalculator:
         Returns:
             LGD as percentage (0-1, e.g., 0.45 = 45%)
         """
+        lgd, _ = self.calculate_lgd_and_unsecured(item, exposure, apply_downturn)
+
+        return lgd
+
+    def calculate_lgd_and_unsecured(
+        self,
+        item: PortfolioItem,
+        exposure: float,
+        apply_downturn: bool = False
+    ) -> Tuple[float, float]:
+        """Calculate LGD together with the unsecured exposure it is based on.
+
+        Args:
+            item: Portfolio item
+            exposure: Exposure at default
+            apply_downturn: Whether to apply downturn adjustment
+
+        Returns:
+            Tuple of (LGD, unsecured exposure)
+        """
+        exposure = float(exposure)
+
         # Calculate unsecured exposure
         unsecured_exposure = self._calculate_unsecured_exposure(item, exposure)
 
-        # Get base LGD
-        if unsecured_exposure >= exposure:
-            # Fully unsecured
-            base_lgd = self.config.get('unsecured_base', 0.45)
-        elif unsecured_exposure == 0:
-            # Fully secured
-            base_lgd = self.config.get('secured_base', 0.25)
-        else:
-            # Partially secured - blend based on unsecured portion
-            unsecured_lgd = self.config.get('unsecured_base', 0.45)
-            secured_lgd = self.config.get('secured_base', 0.25)
-            unsecured_ratio = float(unsecured_exposure / exposure)
-            base_lgd = unsecured_ratio * unsecured_lgd + (1 - unsecured_ratio) * secured_lgd
+        # Get base LGD - blend based on unsecured portion (ratio 1 = fully
+        # unsecured, 0 = fully secured; zero exposure counts as unsecured)
+        unsecured_ratio = min(unsecured_exposure / exposure, 1.0) if exposure > 0 else 1.0
+        base_lgd = unsecured_ratio * self.unsecured_base + (1 - unsecured_ratio) * self.secured_base
 
         # Apply downturn adjustment if requested
         if apply_downturn:
@@ -63,17 +89,47 @@ class LGDCalculator:
         # Apply bounds
         lgd = self._apply_bounds(base_lgd)
 
-        logger.debug(
-            "Calculated LGD",
-            item_id=item.item_id,
-            exposure=float(exposure),
-            collateral=float(item.collateral_value),
-            unsecured=float(unsecured_exposure),
-            lgd=lgd,
-            downturn=apply_downturn
-        )
+        if is_enabled_for(logging.DEBUG):
+            logger.debug(
+                "Calculated LGD",
+                item_id=item.item_id,
+                exposure=exposure,
+                collateral=item.collateral_f,
+                unsecured=unsecured_exposure,
+                lgd=lgd,
+                downturn=apply_downturn
+            )
 
-        return lgd
+        return lgd, unsecured_exposure
+
+    def calculate_lgd_batch(
+        self,
+        exposure: np.ndarray,
+        unsecured_exposure: np.ndarray,
+        apply_downturn: np.ndarray
+    ) -> np.ndarray:
+        """Calculate LGD for many exposures at once.
+
+        Vectorized equivalent of ``calculate_lgd`` operating on parallel
+        arrays of exposure and unsecured exposure.
+
+        Args:
+            exposure: Exposures at default
+            unsecured_exposure: Unsecured portions of the exposures
+            apply_downturn: Boolean mask of items receiving downturn adjustment
+
+        Returns:
+            Array of LGDs
+        """
+        # Blend based on unsecured portion (zero exposure counts as unsecured)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            unsecured_ratio = np.where(exposure > 0, np.minimum(unsecured_exposure / exposure, 1.0), 1.0)
+        base_lgd = unsecured_ratio * self.unsecured_base + (1 - unsecured_ratio) * self.secured_base
+
+        base_lgd *= np.where(apply_downturn, self.downturn_multiplier, 1.0)
+
+        # Apply bounds in place
+        return np.clip(base_lgd, self.floor, self.ceiling, out=base_lgd)
 
     def apply_downturn_adjustment(
         self,
@@ -90,23 +146,24 @@ class LGDCalculator:
             Adjusted LGD
         """
         if downturn_multiplier is None:
-            downturn_multiplier = self.config.get('downturn_multiplier', 1.25)
+            downturn_multiplier = self.downturn_multiplier
 
         adjusted_lgd = base_lgd * downturn_multiplier
 
-        logger.debug(
-            "Applied downturn adjustment",
-            base_lgd=base_lgd,
-            multiplier=downturn_multiplier,
-            adjusted_lgd=adjusted_lgd
-        )
+        if is_enabled_for(logging.DEBUG):
+            logger.debug(
+                "Applied downturn adjustment",
+                base_lgd=base_lgd,
+                multiplier=downturn_multiplier,
+                adjusted_lgd=adjusted_lgd
+            )
 
         return adjusted_lgd
 
     def calculate_lgd_with_cure_rate(
         self,
         item: PortfolioItem,
-        exposure: Decimal,
+        exposure: float,
         cure_rate: float = 0.0
     ) -> float:
         """Calculate LGD considering cure rate.
@@ -130,8 +187,8 @@ class LGDCalculator:
     def _calculate_unsecured_exposure(
         self,
         item: PortfolioItem,
-        exposure: Decimal
-    ) -> Decimal:
+        exposure: float
+    ) -> float:
         """Calculate unsecured portion of exposure.
 
         Args:
@@ -141,23 +198,43 @@ class LGDCalculator:
         Returns:
             Unsecured exposure
         """
-        if item.collateral_value == 0:
+        exposure = float(exposure)
+
+        if item.collateral_f == 0:
             return exposure
 
         # Apply collateral haircut
-        haircut = self._get_collateral_haircut(item.collateral_type)
-        effective_collateral = item.collateral_value * Decimal(str(1 - haircut))
+        haircut = self._get_collateral_haircut(item.collateral_key)
+        effective_collateral = item.collateral_f * (1 - haircut)
 
         # Calculate unsecured portion
         unsecured = exposure - effective_collateral
 
-        return max(Decimal('0'), unsecured)
+        return max(0.0, unsecured)
+
+    def calculate_unsecured_exposure_batch(
+        self,
+        exposure: np.ndarray,
+        collateral: np.ndarray,
+        haircut: np.ndarray
+    ) -> np.ndarray:
+        """Calculate unsecured portion of many exposures at once.
+
+        Args:
+            exposure: Exposures at default
+            collateral: Collateral values
+            haircut: Collateral haircuts (as decimal)
+
+        Returns:
+            Array of unsecured exposures
+        """
+        return np.maximum(0.0, exposure - collateral * (1 - haircut))
 
     def _get_collateral_haircut(self, collateral_type: Optional[str]) -> float:
         """Get haircut for collateral type.
 
         Args:
-            collateral_type: Type of collateral
+            collateral_type: Type of collateral (label or normalized key)
 
         Returns:
             Haircut as decimal (e.g., 0.20 = 20%)
@@ -165,10 +242,13 @@ class LGDCalculator:
         if not collateral_type:
             return 0.0
 
-        haircuts = self.config.get('collateral_haircuts', {})
-        collateral_type_lower = collateral_type.lower().replace(' ', '_')
+        haircut = self._haircut_cache.get(collateral_type)
+        if haircut is None:
+            collateral_type_lower = collateral_type.lower().replace(' ', '_')
+            haircut = self.collateral_haircuts.get(collateral_type_lower, 0.30)  # Default 30% haircut
+            self._haircut_cache[collateral_type] = haircut
 
-        return haircuts.get(collateral_type_lower, 0.30)  # Default 30% haircut
+        return haircut
 
     def _apply_bounds(self, lgd: float) -> float:
         """Apply floor and ceiling to LGD.
@@ -179,10 +259,7 @@ class LGDCalculator:
         Returns:
             Bounded LGD
         """
-        floor = self.config.get('floor', 0.01)
-        ceiling = self.config.get('ceiling', 1.00)
-
-        return max(floor, min(ceiling, lgd))
+        return max(self.floor, min(self.ceiling, lgd))
 
     def apply_scenario_adjustment(
         self,
@@ -203,12 +280,35 @@ class LGDCalculator:
         adjusted_lgd = base_lgd * scenario_multiplier * downturn_factor
         adjusted_lgd = self._apply_bounds(adjusted_lgd)
 
-        logger.debug(
-            "Applied scenario adjustment to LGD",
-            base_lgd=base_lgd,
-            multiplier=scenario_multiplier,
-            downturn_factor=downturn_factor,
-            adjusted_lgd=adjusted_lgd
-        )
+        if is_enabled_for(logging.DEBUG):
+            logger.debug(
+                "Applied scenario adjustment to LGD",
+                base_lgd=base_lgd,
+                multiplier=scenario_multiplier,
+                downturn_factor=downturn_factor,
+                adjusted_lgd=adjusted_lgd
+            )
 
         return adjusted_lgd
+
+    def apply_scenario_adjustment_batch(
+        self,
+        base_lgd: np.ndarray,
+        scenario_multiplier: float,
+        downturn_factor: float = 1.0
+    ) -> np.ndarray:
+        """Apply scenario-specific adjustments to an array of LGDs.
+
+        Args:
+            base_lgd: Base LGDs
+            scenario_multiplier: Scenario multiplier (e.g., 1.2 for pessimistic)
+            downturn_factor: Additional downturn factor
+
+        Returns:
+            Adjusted LGDs
+        """
+        adjusted_lgd = base_lgd * scenario_multiplier
+        adjusted_lgd *= downturn_factor
+
+        # Apply bounds in place
+        return np.clip(adjusted_lgd, self.floor, self.ceiling, out=adjusted_lgd)
@@ -2,196 +2,197 @@
 
 from datetime import date
 from decimal import Decimal
-from typing import List, Optional, Dict, Callable
-from collections import defaultdict
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
+import numpy as np
+
+from models.portfolio_array import PortfolioArray, encode_categories
 from models.portfolio_item import PortfolioItem
-from models.enums import Stage
+from models.enums import Stage, STAGE_CODES
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+_STAGES = list(Stage)
 
-class Portfolio:
-    """Manages a collection of portfolio items with filtering and aggregation."""
-
-    def __init__(self, items: Optional[List[PortfolioItem]] = None):
-        """Initialize portfolio.
-
-        Args:
-            items: Initial list of portfolio items
-        """
-        self._items: List[PortfolioItem] = items or []
-        self._index: Dict[str, PortfolioItem] = {}
-        self._rebuild_index()
-
-    def _rebuild_index(self):
-        """Rebuild item ID index."""
-        self._index = {item.item_id: item for item in self._items}
-
-    def add(self, item: PortfolioItem):
-        """Add item to portfolio.
-
-        Args:
-            item: Portfolio item to add
-        """
-        if item.item_id in self._index:
-            logger.warning("Replacing existing item", item_id=item.item_id)
-            self.remove(item.item_id)
 
-        self._items.append(item)
-        self._index[item.item_id] = item
+class _PortfolioAggregations:
+    """Aggregation and column-filter API shared by Portfolio and PortfolioView.
 
-    def add_many(self, items: List[PortfolioItem]):
-        """Add multiple items to portfolio.
+    Subclasses provide ``_items``, ``_columns()``, ``_label_ids``,
+    ``_total_exposure_decimal`` (cache, reset when columns change) and
+    ``_view()``, and may override ``_stage_columns()``.
+    """
 
-        Args:
-            items: List of portfolio items to add
-        """
-        for item in items:
-            self.add(item)
-
-    def remove(self, item_id: str) -> bool:
-        """Remove item from portfolio.
+    def items(self) -> List[PortfolioItem]:
+        """Get a copy of the item list.
 
-        Args:
-            item_id: ID of item to remove
+        Use ``iter_items()`` when only iterating, to avoid copying.
 
         Returns:
-            True if item was removed, False if not found
+            List of items
         """
-        if item_id not in self._index:
-            return False
-
-        item = self._index[item_id]
-        self._items.remove(item)
-        del self._index[item_id]
-        return True
+        return self._items.copy()
 
-    def get(self, item_id: str) -> Optional[PortfolioItem]:
-        """Get item by ID.
-
-        Args:
-            item_id: Item ID
+    def iter_items(self) -> Iterator[PortfolioItem]:
+        """Iterate over items without copying the item list.
 
         Returns:
-            PortfolioItem or None if not found
+            Iterator over items
         """
-        return self._index.get(item_id)
-
-    def filter(self, condition: Callable[[PortfolioItem], bool]) -> 'Portfolio':
-        """Filter portfolio by condition.
+        return iter(self._items)
 
-        Args:
-            condition: Function that returns True for items to keep
+    def __len__(self) -> int:
+        """Get number of items."""
+        return len(self._items)
 
-        Returns:
-            New Portfolio with filtered items
-        """
-        filtered_items = [item for item in self._items if condition(item)]
-        return Portfolio(filtered_items)
+    def __iter__(self) -> Iterator[PortfolioItem]:
+        """Iterate over items."""
+        return iter(self._items)
 
-    def filter_by_stage(self, stage: Stage) -> 'Portfolio':
+    def filter_by_stage(self, stage: Stage) -> 'PortfolioView':
         """Filter portfolio by stage.
 
         Args:
             stage: Stage to filter by
 
         Returns:
-            New Portfolio with items in specified stage
+            PortfolioView of items in specified stage
         """
-        return self.filter(lambda item: item.current_stage == stage)
+        return self._view(self._stage_columns()['stage'] == STAGE_CODES[stage])
 
-    def filter_by_sector(self, sector: str) -> 'Portfolio':
+    def filter_by_sector(self, sector: str) -> 'PortfolioView':
         """Filter portfolio by sector.
 
         Args:
             sector: Sector to filter by
 
         Returns:
-            New Portfolio with items in specified sector
+            PortfolioView of items in specified sector
         """
-        return self.filter(lambda item: item.sector == sector)
+        return self._view(self._category_mask('sector', sector))
 
-    def filter_by_product(self, product_type: str) -> 'Portfolio':
+    def filter_by_product(self, product_type: str) -> 'PortfolioView':
         """Filter portfolio by product type.
 
         Args:
             product_type: Product type to filter by
 
         Returns:
-            New Portfolio with items of specified product type
+            PortfolioView of items of specified product type
         """
-        return self.filter(lambda item: item.product_type == product_type)
+        return self._view(self._category_mask('product', product_type))
 
-    def filter_by_rating(self, internal_rating: str) -> 'Portfolio':
+    def filter_by_rating(self, internal_rating: str) -> 'PortfolioView':
         """Filter portfolio by internal rating.
 
         Args:
             internal_rating: Internal rating to filter by
 
         Returns:
-            New Portfolio with items of specified rating
+            PortfolioView of items of specified rating
         """
-        return self.filter(lambda item: item.internal_rating == internal_rating)
+        return self._view(self._category_mask('rating', internal_rating))
 
-    def items(self) -> List[PortfolioItem]:
-        """Get all items in portfolio.
+    def _stage_columns(self) -> Dict[str, np.ndarray]:
+        """Get the columns with current 'stage' and 'is_defaulted' values.
 
         Returns:
-            List of all portfolio items
+            Dictionary mapping column name to NumPy array
         """
-        return self._items.copy()
+        return self._columns()
 
-    def __len__(self) -> int:
-        """Get number of items in portfolio."""
-        return len(self._items)
+    def _category_mask(self, column: str, label: Any) -> np.ndarray:
+        """Build a boolean mask of items whose category equals a label.
 
-    def __iter__(self):
-        """Iterate over portfolio items."""
-        return iter(self._items)
+        Args:
+            column: Category column name ('sector', 'product' or 'rating')
+            label: Category label to match
 
-    def __getitem__(self, item_id: str) -> PortfolioItem:
-        """Get item by ID using bracket notation."""
-        item = self.get(item_id)
-        if item is None:
-            raise KeyError(f"Item not found: {item_id}")
-        return item
+        Returns:
+            Boolean mask over the items
+        """
+        ids = self._columns()[f'{column}_id']
+        label_id = self._label_ids[column].get(label)
+        if label_id is None:
+            return np.zeros(len(ids), dtype=bool)
+        return ids == label_id
+
+    def _category_counts(self, column: str, weights: Optional[np.ndarray] = None) -> Dict[Any, Any]:
+        """Count (or sum weights) per label of a dictionary-encoded column.
+
+        Args:
+            column: Category column name ('sector', 'product' or 'rating')
+            weights: Optional per-item weights to sum instead of counting
+
+        Returns:
+            Dictionary mapping category label to count or weighted sum
+        """
+        ids = self._columns()[f'{column}_id']
+        labels = self._label_ids[column]
+        counts = np.bincount(ids, minlength=len(labels))
+        totals = counts if weights is None else np.bincount(ids, weights=weights, minlength=len(labels))
+        return {label: total for label, total, count in zip(labels, totals.tolist(), counts) if count}
 
     # Summary statistics
 
-    def total_exposure(self) -> Decimal:
+    def total_exposure(self) -> float:
         """Calculate total exposure (outstanding + undrawn)."""
-        return sum(item.total_exposure for item in self._items)
-
-    def total_outstanding(self) -> Decimal:
+        return float(self._columns()['total_exposure'].sum())
+
+    def total_exposure_decimal(self) -> Decimal:
+        """Calculate total exposure exactly in Decimal (for regulatory reporting)."""
+        # Summed from the same snapshot as the float columns, cached until
+        # they change
+        cols = self._columns()
+        if self._total_exposure_decimal is None:
+            self._total_exposure_decimal = sum(cols['total_exposure_decimal'].tolist(), Decimal('0'))
+        return self._total_exposure_decimal
+
+    def total_outstanding(self) -> float:
         """Calculate total outstanding amount."""
-        return sum(item.outstanding_amount for item in self._items)
+        return float(self._columns()['outstanding'].sum())
 
-    def total_undrawn(self) -> Decimal:
+    def total_undrawn(self) -> float:
         """Calculate total undrawn commitments."""
-        return sum(item.undrawn_commitment for item in self._items)
+        return float(self._columns()['undrawn'].sum())
 
-    def total_collateral(self) -> Decimal:
+    def total_collateral(self) -> float:
         """Calculate total collateral value."""
-        return sum(item.collateral_value for item in self._items)
+        return float(self._columns()['collateral'].sum())
 
     def average_credit_score(self) -> float:
         """Calculate average credit score."""
-        if not self._items:
+        if not len(self):
             return 0.0
-        return sum(item.credit_score for item in self._items) / len(self._items)
+        return float(self._columns()['credit_score'].mean())
 
     def average_ltv(self) -> float:
         """Calculate average loan-to-value ratio (excluding infinite values)."""
-        if not self._items:
+        if not len(self):
             return 0.0
 
-        ltvs = [item.loan_to_value for item in self._items if item.loan_to_value != float('inf')]
-        if not ltvs:
+        ltv = self._columns()['ltv']
+        ltvs = ltv[np.isfinite(ltv)]
+        if not ltvs.size:
             return 0.0
 
-        return sum(ltvs) / len(ltvs)
+        return float(ltvs.mean())
+
+    @staticmethod
+    def _stage_totals(cols: Dict[str, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+        """Count items and sum exposure per stage.
+
+        Args:
+            cols: Columns from ``_stage_columns()``
+
+        Returns:
+            Tuple of (item count, total exposure) arrays indexed by stage code
+        """
+        stage = cols['stage']
+        counts = np.bincount(stage, minlength=len(_STAGES))
+        exposure = np.bincount(stage, weights=cols['total_exposure'], minlength=len(_STAGES))
+        return counts, exposure
 
     def stage_distribution(self) -> Dict[Stage, int]:
         """Get distribution of items by stage.
@@ -199,21 +200,17 @@ class Portfolio:
         Returns:
             Dictionary mapping Stage to count
         """
-        distribution = defaultdict(int)
-        for item in self._items:
-            distribution[item.current_stage] += 1
-        return dict(distribution)
+        counts, _ = self._stage_totals(self._stage_columns())
+        return {stage: int(count) for stage, count in zip(_STAGES, counts) if count}
 
-    def stage_exposure(self) -> Dict[Stage, Decimal]:
+    def stage_exposure(self) -> Dict[Stage, float]:
         """Get exposure by stage.
 
         Returns:
             Dictionary mapping Stage to total exposure
         """
-        exposure = defaultdict(Decimal)
-        for item in self._items:
-            exposure[item.current_stage] += item.total_exposure
-        return dict(exposure)
+        counts, exposure = self._stage_totals(self._stage_columns())
+        return {stage: float(exp) for stage, exp, count in zip(_STAGES, exposure, counts) if count}
 
     def sector_distribution(self) -> Dict[str, int]:
         """Get distribution of items by sector.
@@ -221,21 +218,15 @@ class Portfolio:
         Returns:
             Dictionary mapping sector to count
         """
-        distribution = defaultdict(int)
-        for item in self._items:
-            distribution[item.sector] += 1
-        return dict(distribution)
+        return self._category_counts('sector')
 
-    def sector_exposure(self) -> Dict[str, Decimal]:
+    def sector_exposure(self) -> Dict[str, float]:
         """Get exposure by sector.
 
         Returns:
             Dictionary mapping sector to total exposure
         """
-        exposure = defaultdict(Decimal)
-        for item in self._items:
-            exposure[item.sector] += item.total_exposure
-        return dict(exposure)
+        return self._category_counts('sector', self._columns()['total_exposure'])
 
     def product_distribution(self) -> Dict[str, int]:
         """Get distribution of items by product type.
@@ -243,29 +234,23 @@ class Portfolio:
         Returns:
             Dictionary mapping product type to count
         """
-        distribution = defaultdict(int)
-        for item in self._items:
-            distribution[item.product_type] += 1
-        return dict(distribution)
+        return self._category_counts('product')
 
-    def product_exposure(self) -> Dict[str, Decimal]:
+    def product_exposure(self) -> Dict[str, float]:
         """Get exposure by product type.
 
         Returns:
             Dictionary mapping product type to total exposure
         """
-        exposure = defaultdict(Decimal)
-        for item in self._items:
-            exposure[item.product_type] += item.total_exposure
-        return dict(exposure)
+        return self._category_counts('product', self._columns()['total_exposure'])
 
     def past_due_count(self) -> int:
         """Count items with any days past due."""
-        return sum(1 for item in self._items if item.is_past_due)
+        return int(np.count_nonzero(self._columns()['is_past_due']))
 
     def defaulted_count(self) -> int:
         """Count defaulted items."""
-        return sum(1 for item in self._items if item.is_defaulted)
+        return int(np.count_nonzero(self._stage_columns()['is_defaulted']))
 
     def get_summary(self) -> Dict:
         """Get comprehensive portfolio summary.
@@ -273,26 +258,314 @@ class Portfolio:
         Returns:
             Dictionary with portfolio statistics
         """
-        stage_dist = self.stage_distribution()
-        stage_exp = self.stage_exposure()
-
-        return {
-            'total_items': len(self._items),
-            'total_exposure': float(self.total_exposure()),
-            'total_outstanding': float(self.total_outstanding()),
-            'total_undrawn': float(self.total_undrawn()),
-            'total_collateral': float(self.total_collateral()),
+        # Stage counts and exposures come from one shared bincount pass
+        cols = self._stage_columns()
+        stage_counts, stage_exposure = self._stage_totals(cols)
+        total_exposure = self.total_exposure()
+        present = [
+            (str(stage), int(count), float(exp))
+            for stage, count, exp in zip(_STAGES, stage_counts, stage_exposure) if count
+        ]
+
+        summary = {
+            'total_items': len(self),
+            'total_exposure': total_exposure,
+            'total_outstanding': self.total_outstanding(),
+            'total_undrawn': self.total_undrawn(),
+            'total_collateral': self.total_collateral(),
             'average_credit_score': self.average_credit_score(),
             'average_ltv': self.average_ltv(),
             'past_due_count': self.past_due_count(),
-            'defaulted_count': self.defaulted_count(),
-            'stage_distribution': {
-                str(stage): count for stage, count in stage_dist.items()
-            },
-            'stage_exposure': {
-                str(stage): float(exp) for stage, exp in stage_exp.items()
-            },
-            'stage_1_ratio': float(stage_exp.get(Stage.STAGE_1, Decimal('0')) / self.total_exposure()) if self.total_exposure() > 0 else 0,
-            'stage_2_ratio': float(stage_exp.get(Stage.STAGE_2, Decimal('0')) / self.total_exposure()) if self.total_exposure() > 0 else 0,
-            'stage_3_ratio': float(stage_exp.get(Stage.STAGE_3, Decimal('0')) / self.total_exposure()) if self.total_exposure() > 0 else 0,
+            'defaulted_count': int(np.count_nonzero(cols['is_defaulted'])),
+            'stage_distribution': {stage: count for stage, count, _ in present},
+            'stage_exposure': {stage: exp for stage, _, exp in present},
+        }
+        for code, exp in enumerate(stage_exposure.tolist(), start=1):
+            summary[f'stage_{code}_ratio'] = exp / total_exposure if total_exposure > 0 else 0
+
+        return summary
+
+
+class Portfolio(_PortfolioAggregations):
+    """Manages a collection of portfolio items with filtering and aggregation.
+
+    Aggregations and filters read NumPy columns captured from the items,
+    rebuilt after ``add`` and ``remove``. Item stages are re-read on every
+    stage-based aggregation, because the ECL engine and staging framework
+    change them in place. Other in-place edits (amounts, days past due,
+    sector, product, rating) are not seen until ``refresh()`` is called.
+    """
+
+    def __init__(self, items: Optional[List[PortfolioItem]] = None):
+        """Initialize portfolio.
+
+        Args:
+            items: Initial list of portfolio items
+        """
+        self._items: List[PortfolioItem] = items or []
+        self._index: Dict[str, PortfolioItem] = {}
+        self._pos: Dict[str, int] = {}
+
+        # Columnar (struct-of-arrays) copy of the item attributes used by the
+        # aggregations, rebuilt lazily after the item list changes
+        self._cols: Dict[str, np.ndarray] = {}
+        self._label_ids: Dict[str, Dict[Any, int]] = {}
+        self._total_exposure_decimal: Optional[Decimal] = None
+        self._dirty = True
+        self._rebuild_index()
+
+    def _rebuild_index(self):
+        """Rebuild item ID and position indexes and columnar storage."""
+        self._index = {item.item_id: item for item in self._items}
+        self._pos = {item.item_id: i for i, item in enumerate(self._items)}
+        self._rebuild_columns()
+
+    def _rebuild_columns(self):
+        """Rebuild the per-attribute NumPy columns from the item list."""
+        items = self._items
+        n = len(items)
+        array = PortfolioArray.from_items(items)
+
+        outstanding = array.outstanding
+        collateral = array.collateral
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ltv = np.where(collateral > 0, outstanding / collateral, np.inf)
+
+        dpd = array.days_past_due
+        stage = array.stage_code
+
+        self._cols = {
+            'outstanding': outstanding,
+            'undrawn': array.undrawn,
+            'total_exposure': array.total_exposure,
+            'total_exposure_decimal': np.array(
+                [item.outstanding_amount + item.undrawn_commitment for item in items], dtype=object
+            ),
+            'collateral': collateral,
+            'credit_score': array.credit_score,
+            'ltv': ltv,
+            'dpd': dpd,
+            'times_past_due_12m': array.times_past_due_12m,
+            'stage': stage,
+            # Status flags, same rules as PortfolioItem.is_past_due / is_defaulted
+            'is_past_due': dpd > 0,
+            'is_defaulted': (dpd > 90) | (stage == STAGE_CODES[Stage.STAGE_3]),
+            'sector_id': array.sector_code,
         }
+
+        # Replace (not update) labels so existing views keep a consistent snapshot
+        self._label_ids = {'sector': {label: code for code, label in enumerate(array.sectors)}}
+        categories = (
+            ('product', (item.product_type for item in items)),
+            ('rating', (item.internal_rating for item in items)),
+        )
+        for column, values in categories:
+            codes, label_ids = encode_categories(values, n)
+            self._cols[f'{column}_id'] = codes
+            self._label_ids[column] = label_ids
+
+        self._total_exposure_decimal = None
+        self._dirty = False
+
+    def _columns(self) -> Dict[str, np.ndarray]:
+        """Get columnar storage, rebuilding it if the item list has changed.
+
+        Returns:
+            Dictionary mapping column name to NumPy array
+        """
+        if self._dirty:
+            self._rebuild_columns()
+        return self._cols
+
+    def _stage_columns(self) -> Dict[str, np.ndarray]:
+        """Get the columns with 'stage' and 'is_defaulted' re-read from the items.
+
+        The ECL engine and staging framework set ``current_stage`` in place,
+        so stages are read again rather than taken from the cached columns.
+        Changed stage columns replace the column dict, leaving existing
+        views on their snapshot.
+
+        Returns:
+            Dictionary mapping column name to NumPy array
+        """
+        cols = self._columns()
+        items = self._items
+        stage = np.fromiter((STAGE_CODES[item.current_stage] for item in items), np.int32, len(items))
+        if not np.array_equal(stage, cols['stage']):
+            self._cols = cols = {
+                **cols,
+                'stage': stage,
+                'is_defaulted': (cols['dpd'] > 90) | (stage == STAGE_CODES[Stage.STAGE_3]),
+            }
+        return cols
+
+    def refresh(self):
+        """Rebuild columnar storage after items were modified in place.
+
+        Aggregations read from columns captured when items were added; stage
+        changes are picked up automatically, but call this after changing
+        any other item attribute (amounts, days past due, categories).
+        """
+        self._rebuild_columns()
+
+    def _view(self, mask: np.ndarray) -> 'PortfolioView':
+        """Create a view of the items selected by a mask.
+
+        Args:
+            mask: Boolean mask over the items
+
+        Returns:
+            PortfolioView of the selected items
+        """
+        index = np.flatnonzero(mask)
+        items = [self._items[i] for i in index.tolist()]
+        return PortfolioView(items, self._columns(), self._label_ids, index)
+
+    def add(self, item: PortfolioItem):
+        """Add item to portfolio.
+
+        Args:
+            item: Portfolio item to add
+        """
+        if item.item_id in self._index:
+            logger.warning("Replacing existing item", item_id=item.item_id)
+            self.remove(item.item_id)
+
+        self._pos[item.item_id] = len(self._items)
+        self._items.append(item)
+        self._index[item.item_id] = item
+        self._dirty = True
+
+    def add_many(self, items: List[PortfolioItem]):
+        """Add multiple items to portfolio.
+
+        Args:
+            items: List of portfolio items to add
+        """
+        for item in items:
+            self.add(item)
+
+    def remove(self, item_id: str, stable: bool = False) -> bool:
+        """Remove item from portfolio.
+
+        By default the last item is moved into the removed item's slot
+        (O(1)), so item order is not preserved. Pass ``stable=True`` to keep
+        the remaining items in order at O(N) cost.
+
+        Args:
+            item_id: ID of item to remove
+            stable: Whether to preserve the order of remaining items
+
+        Returns:
+            True if item was removed, False if not found
+        """
+        if item_id not in self._index:
+            return False
+
+        i = self._pos.pop(item_id)
+        del self._index[item_id]
+
+        if stable:
+            del self._items[i]
+            for j in range(i, len(self._items)):
+                self._pos[self._items[j].item_id] = j
+        else:
+            last = self._items.pop()
+            if i < len(self._items):
+                self._items[i] = last
+                self._pos[last.item_id] = i
+
+        self._dirty = True
+        return True
+
+    def get(self, item_id: str) -> Optional[PortfolioItem]:
+        """Get item by ID.
+
+        Args:
+            item_id: Item ID
+
+        Returns:
+            PortfolioItem or None if not found
+        """
+        return self._index.get(item_id)
+
+    def filter(self, condition: Callable[[PortfolioItem], bool]) -> 'Portfolio':
+        """Filter portfolio by condition.
+
+        Args:
+            condition: Function that returns True for items to keep
+
+        Returns:
+            New Portfolio with filtered items
+        """
+        filtered_items = [item for item in self._items if condition(item)]
+        return Portfolio(filtered_items)
+
+    def __getitem__(self, item_id: str) -> PortfolioItem:
+        """Get item by ID using bracket notation."""
+        item = self.get(item_id)
+        if item is None:
+            raise KeyError(f"Item not found: {item_id}")
+        return item
+
+
+class PortfolioView(_PortfolioAggregations):
+    """Read-only subset of a portfolio backed by the parent's columns.
+
+    Created by the ``filter_by_*`` methods. Aggregations index into the
+    parent's column arrays instead of copying items into a new Portfolio.
+    The view is a snapshot: it does not follow later changes to the parent.
+    Use ``to_portfolio()`` to get a mutable Portfolio of the subset.
+    """
+
+    def __init__(
+        self,
+        items: List[PortfolioItem],
+        columns: Dict[str, np.ndarray],
+        label_ids: Dict[str, Dict[Any, int]],
+        index: np.ndarray
+    ):
+        """Initialize view.
+
+        Args:
+            items: Selected items, in index order
+            columns: Parent portfolio's columns
+            label_ids: Parent portfolio's category label -> id maps
+            index: Positions of the selected items in the parent columns
+        """
+        self._items = items
+        self._parent_cols = columns
+        self._label_ids = label_ids
+        self._index = index
+        self._cols: Optional[Dict[str, np.ndarray]] = None
+        self._total_exposure_decimal: Optional[Decimal] = None
+
+    def _columns(self) -> Dict[str, np.ndarray]:
+        """Get the parent's columns restricted to the view's items.
+
+        Returns:
+            Dictionary mapping column name to NumPy array
+        """
+        if self._cols is None:
+            self._cols = {name: column[self._index] for name, column in self._parent_cols.items()}
+        return self._cols
+
+    def _view(self, mask: np.ndarray) -> 'PortfolioView':
+        """Create a view of a subset of this view's items.
+
+        Args:
+            mask: Boolean mask over this view's items
+
+        Returns:
+            PortfolioView of the selected items
+        """
+        items = [item for item, keep in zip(self._items, mask.tolist()) if keep]
+        return PortfolioView(items, self._parent_cols, self._label_ids, self._index[mask])
+
+    def to_portfolio(self) -> Portfolio:
+        """Materialize the view as an independent Portfolio.
+
+        Returns:
+            New Portfolio with the view's items
+        """
+        return Portfolio(list(self._items))
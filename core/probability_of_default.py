@@ -1,15 +1,27 @@
 """Probability of Default (PD) calculations."""
 
+import bisect
+import logging
 import math
-from typing import List, Optional, Tuple
+from typing import Optional, Sequence, Tuple
 
+import numpy as np
+
+from models.portfolio_array import PortfolioArray
 from models.portfolio_item import PortfolioItem
 from models.enums import Stage
 from utils.config import get_config
-from utils.logger import get_logger
+from utils.logger import get_logger, is_enabled_for
 
 logger = get_logger(__name__)
 
+# Days-past-due buckets (upper bounds, inclusive) and their PD multipliers:
+# current, 1-30, 31-60, 61-90, >90
+_DPD_BUCKET_EDGES = (0, 30, 60, 90)
+_DPD_MULTIPLIERS = (1.0, 1.5, 2.0, 3.0, 5.0)
+_DPD_BUCKET_EDGES_ARRAY = np.array(_DPD_BUCKET_EDGES)
+_DPD_MULTIPLIERS_ARRAY = np.array(_DPD_MULTIPLIERS)
+
 
 class PDCalculator:
     """Calculate Probability of Default (PD) for credit exposures."""
@@ -22,6 +34,24 @@ class PDCalculator:
         """
         self.config = config or get_config().get_section('pd')
 
+        # PD parameters
+        self.floor = self.config.get('floor', 0.0001)
+        self.ceiling = self.config.get('ceiling', 0.99)
+        self.credit_score_min = self.config.get('credit_score_min', 300)
+        self.credit_score_max = self.config.get('credit_score_max', 850)
+
+        # Monthly marginal default rates by stage
+        term_structure = self.config.get('term_structure', {})
+        self.monthly_rates = {
+            Stage.STAGE_1: term_structure.get('stage_1_monthly_rate', 0.08),
+            Stage.STAGE_2: term_structure.get('stage_2_monthly_rate', 0.12),
+            Stage.STAGE_3: term_structure.get('stage_3_monthly_rate', 0.20),
+        }
+
+        # Credit score -> PD lookup table, built lazily for the score range
+        self._pd_table: Optional[np.ndarray] = None
+        self._pd_table_range: Optional[Tuple[int, int]] = None
+
     def calculate_12m_pd(
         self,
         item: PortfolioItem,
@@ -47,48 +77,106 @@ class PDCalculator:
         # Apply floor and ceiling
         pd = self._apply_bounds(pd)
 
-        logger.debug(
-            "Calculated 12-month PD",
-            item_id=item.item_id,
-            credit_score=item.credit_score,
-            pd=pd
-        )
+        if is_enabled_for(logging.DEBUG):
+            logger.debug(
+                "Calculated 12-month PD",
+                item_id=item.item_id,
+                credit_score=item.credit_score,
+                pd=pd
+            )
 
         return pd
 
+    def calculate_12m_pd_batch(
+        self,
+        items: Sequence[PortfolioItem],
+        base_pd_override: Optional[float] = None,
+        portfolio: Optional[PortfolioArray] = None
+    ) -> np.ndarray:
+        """Calculate 12-month PD for many items at once.
+
+        Vectorized equivalent of ``calculate_12m_pd`` operating on columns
+        extracted from the items in a single pass.
+
+        Args:
+            items: Portfolio items
+            base_pd_override: Optional base PD override applied to all items
+            portfolio: Optional portfolio columns (aligned with ``items``)
+                to read instead of extracting them from the items
+
+        Returns:
+            Array of 12-month PDs
+        """
+        n = len(items)
+
+        if base_pd_override is not None:
+            pd = np.full(n, base_pd_override, dtype=np.float64)
+        elif portfolio is not None:
+            pd = self._credit_score_to_pd_batch(portfolio.credit_score)
+        else:
+            credit_score = np.fromiter((item.credit_score for item in items), np.float64, n)
+            pd = self._credit_score_to_pd_batch(credit_score)
+
+        # Apply adjustments based on performance
+        if portfolio is not None:
+            pd *= self._performance_adjustment_batch(
+                portfolio.days_past_due,
+                portfolio.times_past_due_12m,
+                portfolio.is_forborne | portfolio.is_restructured
+            )
+        else:
+            pd *= self._performance_adjustment_batch(
+                np.fromiter((item.days_past_due for item in items), np.int64, n),
+                np.fromiter((item.times_past_due_12m for item in items), np.int64, n),
+                np.fromiter((item.is_forborne or item.is_restructured for item in items), np.bool_, n)
+            )
+
+        # Apply floor and ceiling in place
+        return np.clip(pd, self.floor, self.ceiling, out=pd)
+
     def calculate_lifetime_pd(
         self,
         item: PortfolioItem,
-        base_pd_override: Optional[float] = None
+        base_pd_override: Optional[float] = None,
+        pd_12m: Optional[float] = None,
+        marginal_pds: Optional[Sequence[float]] = None
     ) -> float:
         """Calculate lifetime PD (cumulative PD to maturity).
 
         Args:
             item: Portfolio item
             base_pd_override: Optional base PD override
+            pd_12m: Optional precomputed 12-month PD (skips recalculation)
+            marginal_pds: Optional precomputed marginal PD curve to maturity
 
         Returns:
             Lifetime cumulative PD
         """
         # Get 12-month PD
-        pd_12m = self.calculate_12m_pd(item, base_pd_override)
+        if pd_12m is None:
+            pd_12m = self.calculate_12m_pd(item, base_pd_override)
 
         # Get remaining term
         remaining_months = item.remaining_term_months
         if remaining_months <= 12:
             return pd_12m
 
-        # Calculate cumulative PD using marginal PDs
-        marginal_pds = self.get_marginal_pd_curve(item, pd_12m, remaining_months)
-        cumulative_pd = self._calculate_cumulative_pd(marginal_pds)
+        # Calculate cumulative PD from the marginal PDs if given, otherwise in
+        # closed form (the marginal curve is a geometric series)
+        if marginal_pds is None:
+            _, survival_factor, months = self._marginal_curve_params(item, pd_12m, remaining_months)
+            cumulative_pd = 1.0 - math.pow(survival_factor, months)
+        else:
+            cumulative_pd = self._calculate_cumulative_pd(marginal_pds)
 
-        logger.debug(
-            "Calculated lifetime PD",
-            item_id=item.item_id,
-            pd_12m=pd_12m,
-            remaining_months=remaining_months,
-            lifetime_pd=cumulative_pd
-        )
+        if is_enabled_for(logging.DEBUG):
+            logger.debug(
+                "Calculated lifetime PD",
+                item_id=item.item_id,
+                pd_12m=pd_12m,
+                remaining_months=remaining_months,
+                lifetime_pd=cumulative_pd
+            )
 
         return cumulative_pd
 
@@ -97,7 +185,7 @@ class PDCalculator:
         item: PortfolioItem,
         pd_12m: float,
         horizon_months: int
-    ) -> List[float]:
+    ) -> np.ndarray:
         """Get marginal PD for each month in horizon.
 
         Args:
@@ -106,67 +194,155 @@ class PDCalculator:
             horizon_months: Projection horizon in months
 
         Returns:
-            List of monthly marginal PDs
+            Array of monthly marginal PDs
+        """
+        step, survival_factor, months = self._marginal_curve_params(item, pd_12m, horizon_months)
+
+        return step * np.power(survival_factor, np.arange(months, dtype=np.float64))
+
+    def _marginal_curve_params(
+        self,
+        item: PortfolioItem,
+        pd_12m: float,
+        horizon_months: int
+    ) -> Tuple[float, float, int]:
+        """Get the parameters of the geometric marginal PD curve.
+
+        Args:
+            item: Portfolio item
+            pd_12m: 12-month PD
+            horizon_months: Projection horizon in months
+
+        Returns:
+            Tuple of (first-month marginal PD, monthly survival factor, number of months)
         """
         # Get monthly default rate from config
-        term_structure = self.config.get('term_structure', {})
+        monthly_rate = self._get_monthly_rate(item.current_stage)
 
-        if item.current_stage == Stage.STAGE_1:
-            monthly_rate = term_structure.get('stage_1_monthly_rate', 0.08)
-        elif item.current_stage == Stage.STAGE_2:
-            monthly_rate = term_structure.get('stage_2_monthly_rate', 0.12)
-        else:  # Stage 3
-            monthly_rate = term_structure.get('stage_3_monthly_rate', 0.20)
+        # Marginal PD = survival_prob × monthly_rate, scaled by PD level and
+        # capped at survival_prob, so survival decays geometrically
+        step = min(monthly_rate * pd_12m / 0.01, 1.0)
+        survival_factor = 1.0 - step
 
-        # Calculate marginal PDs
-        marginal_pds = []
-        survival_prob = 1.0
+        months = min(horizon_months, item.remaining_term_months)
 
-        for month in range(min(horizon_months, item.remaining_term_months)):
-            # Marginal PD = survival_prob × monthly_rate
-            marginal_pd = survival_prob * monthly_rate * pd_12m / 0.01  # Scale by PD level
+        # Stop once survival probability falls below 1%
+        if survival_factor <= 0.0:
+            months = min(months, 1)
+        elif survival_factor < 1.0:
+            months = min(months, math.floor(math.log(0.01) / math.log(survival_factor)) + 1)
 
-            # Cap marginal PD
-            marginal_pd = min(marginal_pd, survival_prob)
+        return step, survival_factor, max(months, 0)
 
-            marginal_pds.append(marginal_pd)
+    def calculate_cumulative_pd_batch(
+        self,
+        pd_12m: np.ndarray,
+        stage_codes: np.ndarray,
+        horizon_months: np.ndarray
+    ) -> np.ndarray:
+        """Calculate cumulative PD over the horizon for many items at once.
 
-            # Update survival probability
-            survival_prob -= marginal_pd
+        Closed-form equivalent of summing ``get_marginal_pd_curve``: survival
+        decays geometrically by the scaled monthly rate until the horizon is
+        reached or survival drops below 1%.
 
-            # Stop if survival probability becomes too low
-            if survival_prob < 0.01:
-                break
+        Args:
+            pd_12m: 12-month PDs
+            stage_codes: Integer stage codes (see ``models.enums.STAGE_CODES``)
+            horizon_months: Projection horizon in months per item
 
-        return marginal_pds
+        Returns:
+            Array of cumulative PDs
+        """
+        _, survival_factor, months = self._marginal_curve_params_batch(pd_12m, stage_codes, horizon_months)
+
+        return 1.0 - np.power(survival_factor, months)
+
+    def get_marginal_pd_curves_batch(
+        self,
+        pd_12m: np.ndarray,
+        stage_codes: np.ndarray,
+        horizon_months: np.ndarray
+    ) -> np.ndarray:
+        """Get marginal PD curves for many items at once.
+
+        Vectorized equivalent of ``get_marginal_pd_curve``. Curves are
+        truncated per item and returned as rows of a zero-padded matrix.
+
+        Args:
+            pd_12m: 12-month PDs
+            stage_codes: Integer stage codes (see ``models.enums.STAGE_CODES``)
+            horizon_months: Projection horizon in months per item
+
+        Returns:
+            Array of shape (items, longest curve) of monthly marginal PDs
+        """
+        step, survival_factor, months = self._marginal_curve_params_batch(pd_12m, stage_codes, horizon_months)
+
+        periods = np.arange(int(months.max()) if months.size else 0, dtype=np.float64)
+        curves = np.power.outer(survival_factor, periods)
+        curves *= step[:, np.newaxis]
+        curves[periods >= months[:, np.newaxis]] = 0.0
+
+        return curves
+
+    def _marginal_curve_params_batch(
+        self,
+        pd_12m: np.ndarray,
+        stage_codes: np.ndarray,
+        horizon_months: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Get the geometric marginal PD curve parameters for many items.
+
+        Vectorized equivalent of ``_marginal_curve_params``.
+
+        Args:
+            pd_12m: 12-month PDs
+            stage_codes: Integer stage codes (see ``models.enums.STAGE_CODES``)
+            horizon_months: Projection horizon in months per item
+
+        Returns:
+            Tuple of (first-month marginal PDs, survival factors, month counts)
+        """
+        rate_table = np.array([self._get_monthly_rate(stage) for stage in Stage])
+        step = np.minimum(rate_table[stage_codes] * pd_12m / 0.01, 1.0)  # Scale by PD level
+        survival_factor = 1.0 - step
+
+        # Number of months until survival falls below 1% (inclusive)
+        with np.errstate(divide='ignore'):
+            cutoff = np.where(
+                survival_factor < 1.0,
+                np.floor(np.log(0.01) / np.log(survival_factor)) + 1,
+                np.inf
+            )
+        months = np.maximum(np.minimum(horizon_months, cutoff), 0)
+
+        return step, survival_factor, months
 
     def get_lifetime_pd_curve(
         self,
         item: PortfolioItem,
-        base_pd_override: Optional[float] = None
-    ) -> Tuple[List[float], List[float]]:
+        base_pd_override: Optional[float] = None,
+        pd_12m: Optional[float] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
         """Get full PD curve (marginal and cumulative) to maturity.
 
         Args:
             item: Portfolio item
             base_pd_override: Optional base PD override
+            pd_12m: Optional precomputed 12-month PD (skips recalculation)
 
         Returns:
             Tuple of (marginal_pds, cumulative_pds)
         """
-        pd_12m = self.calculate_12m_pd(item, base_pd_override)
+        if pd_12m is None:
+            pd_12m = self.calculate_12m_pd(item, base_pd_override)
         remaining_months = item.remaining_term_months
 
         marginal_pds = self.get_marginal_pd_curve(item, pd_12m, remaining_months)
 
         # Calculate cumulative PDs
-        cumulative_pds = []
-        survival_prob = 1.0
-
-        for marginal_pd in marginal_pds:
-            survival_prob -= marginal_pd
-            cumulative_pd = 1.0 - survival_prob
-            cumulative_pds.append(cumulative_pd)
+        cumulative_pds = np.cumsum(marginal_pds)
 
         return marginal_pds, cumulative_pds
 
@@ -189,7 +365,8 @@ class PDCalculator:
     def _credit_score_to_pd(self, credit_score: int) -> float:
         """Convert credit score to 12-month PD.
 
-        Uses a logistic function to map credit scores to PD.
+        Uses a logistic function to map credit scores to PD. Integer scores
+        are looked up in a precomputed table covering the score range.
 
         Args:
             credit_score: Credit score (300-850)
@@ -197,9 +374,14 @@ class PDCalculator:
         Returns:
             12-month PD
         """
+        if isinstance(credit_score, (int, np.integer)) and not isinstance(credit_score, bool):
+            table = self._get_pd_table()
+            score_min, score_max = self._pd_table_range
+            return float(table[max(score_min, min(score_max, credit_score)) - score_min])
+
         # Normalize credit score to 0-1 range
-        score_min = self.config.get('credit_score_min', 300)
-        score_max = self.config.get('credit_score_max', 850)
+        score_min = self.credit_score_min
+        score_max = self.credit_score_max
 
         normalized_score = (credit_score - score_min) / (score_max - score_min)
         normalized_score = max(0, min(1, normalized_score))
@@ -214,6 +396,49 @@ class PDCalculator:
 
         return pd
 
+    def _get_pd_table(self) -> np.ndarray:
+        """Get the PD for every integer credit score in the configured range.
+
+        The table is rebuilt if the score range has changed since it was built.
+
+        Returns:
+            Array of PDs indexed by ``credit_score - credit_score_min``
+        """
+        score_range = (int(self.credit_score_min), int(self.credit_score_max))
+        if self._pd_table is None or self._pd_table_range != score_range:
+            scores = np.arange(score_range[0], score_range[1] + 1, dtype=np.float64)
+            self._pd_table = self._credit_score_to_pd_batch(scores)
+            self._pd_table_range = score_range
+        return self._pd_table
+
+    def _credit_score_to_pd_batch(self, credit_score: np.ndarray) -> np.ndarray:
+        """Convert an array of credit scores to 12-month PDs.
+
+        Args:
+            credit_score: Credit scores (300-850)
+
+        Returns:
+            Array of 12-month PDs
+        """
+        score_min = self.credit_score_min
+        score_max = self.credit_score_max
+
+        normalized_score = np.clip((credit_score - score_min) / (score_max - score_min), 0, 1)
+
+        # Same logistic mapping as _credit_score_to_pd
+        return 0.20 / (1 + np.exp(10 * (normalized_score - 0.5)))
+
+    def _get_monthly_rate(self, stage: Stage) -> float:
+        """Get monthly marginal default rate for a stage.
+
+        Args:
+            stage: IFRS 9 stage
+
+        Returns:
+            Monthly default rate from the term structure config
+        """
+        return self.monthly_rates[stage]
+
     def _adjust_pd_for_performance(self, pd: float, item: PortfolioItem) -> float:
         """Adjust PD based on performance indicators.
 
@@ -224,18 +449,8 @@ class PDCalculator:
         Returns:
             Adjusted PD
         """
-        adjustment = 1.0
-
-        # Days past due adjustment
-        if item.days_past_due > 0:
-            if item.days_past_due <= 30:
-                adjustment *= 1.5  # 50% increase
-            elif item.days_past_due <= 60:
-                adjustment *= 2.0  # 100% increase
-            elif item.days_past_due <= 90:
-                adjustment *= 3.0  # 200% increase
-            else:
-                adjustment *= 5.0  # 400% increase
+        # Days past due adjustment (+50% / +100% / +200% / +400% by bucket)
+        adjustment = _DPD_MULTIPLIERS[bisect.bisect_left(_DPD_BUCKET_EDGES, item.days_past_due)]
 
         # Times past due in last 12 months
         if item.times_past_due_12m > 0:
@@ -247,6 +462,33 @@ class PDCalculator:
 
         return pd * adjustment
 
+    def _performance_adjustment_batch(
+        self,
+        days_past_due: np.ndarray,
+        times_past_due_12m: np.ndarray,
+        is_forborne_or_restructured: np.ndarray
+    ) -> np.ndarray:
+        """Calculate performance-based PD multipliers for many items.
+
+        Vectorized equivalent of ``_adjust_pd_for_performance``.
+
+        Args:
+            days_past_due: Days past due per item
+            times_past_due_12m: Past due events in the last 12 months per item
+            is_forborne_or_restructured: Forbearance/restructuring flag per item
+
+        Returns:
+            Array of PD multipliers
+        """
+        # Days past due multiplier as a single bucket lookup
+        adjustment = _DPD_MULTIPLIERS_ARRAY[
+            np.searchsorted(_DPD_BUCKET_EDGES_ARRAY, days_past_due, side='left')
+        ]
+        adjustment *= np.where(times_past_due_12m > 0, 1 + 0.2 * times_past_due_12m, 1.0)
+        adjustment *= np.where(is_forborne_or_restructured, 1.5, 1.0)
+
+        return adjustment
+
     def _apply_bounds(self, pd: float) -> float:
         """Apply floor and ceiling to PD.
 
@@ -256,26 +498,18 @@ class PDCalculator:
         Returns:
             Bounded PD
         """
-        floor = self.config.get('floor', 0.0001)
-        ceiling = self.config.get('ceiling', 0.99)
-
-        return max(floor, min(ceiling, pd))
+        return max(self.floor, min(self.ceiling, pd))
 
-    def _calculate_cumulative_pd(self, marginal_pds: List[float]) -> float:
+    def _calculate_cumulative_pd(self, marginal_pds: Sequence[float]) -> float:
         """Calculate cumulative PD from marginal PDs.
 
         Args:
-            marginal_pds: List of monthly marginal PDs
+            marginal_pds: Monthly marginal PDs
 
         Returns:
             Cumulative PD
         """
-        survival_prob = 1.0
-
-        for marginal_pd in marginal_pds:
-            survival_prob -= marginal_pd
-
-        return 1.0 - survival_prob
+        return float(np.sum(marginal_pds))
 
     def apply_scenario_adjustment(
         self,
@@ -295,3 +529,22 @@ class PDCalculator:
         adjusted_pd = self._apply_bounds(adjusted_pd)
 
         return adjusted_pd
+
+    def apply_scenario_adjustment_batch(
+        self,
+        base_pd: np.ndarray,
+        scenario_multiplier: float
+    ) -> np.ndarray:
+        """Apply scenario-specific adjustment to an array of PDs.
+
+        Args:
+            base_pd: Base PDs
+            scenario_multiplier: Scenario multiplier (e.g., 1.3 for pessimistic)
+
+        Returns:
+            Adjusted PDs
+        """
+        adjusted_pd = base_pd * scenario_multiplier
+
+        # Apply bounds in place
+        return np.clip(adjusted_pd, self.floor, self.ceiling, out=adjusted_pd)
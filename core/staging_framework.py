@@ -1,15 +1,37 @@
 """IFRS 9 staging framework for credit risk classification."""
 
-from typing import List, Optional, Tuple, Dict
-from collections import defaultdict
+import logging
+from collections.abc import Sized
+from typing import Collection, Dict, Iterable, List, Optional, Tuple
 
+import numpy as np
+
+from core._kernels import _stage_migrate_kernel
+from models.portfolio_array import PortfolioArray
 from models.portfolio_item import PortfolioItem
-from models.enums import Stage
+from models.enums import Stage, STAGE_CODES
 from utils.config import get_config
-from utils.logger import get_logger
+from utils.logger import get_logger, is_enabled_for
 
 logger = get_logger(__name__)
 
+_STAGES = list(Stage)
+
+
+def _as_collection(items: Iterable[PortfolioItem]) -> Collection[PortfolioItem]:
+    """Return items as a sized, re-iterable collection.
+
+    Lists and Portfolio objects are used as-is; only one-shot iterators
+    (e.g. generators) are materialized into a list.
+
+    Args:
+        items: Portfolio items
+
+    Returns:
+        The items themselves if sized, otherwise a list of them
+    """
+    return items if isinstance(items, Sized) else list(items)
+
 
 class StagingFramework:
     """IFRS 9 staging classification framework.
@@ -25,8 +47,9 @@ class StagingFramework:
         Args:
             config: Optional configuration dictionary
         """
-        staging_config = config or get_config().get_section('staging')
-        ecl_config = get_config().get_section('ecl')
+        global_config = get_config()
+        staging_config = config or global_config.get_section('staging')
+        ecl_config = global_config.get_section('ecl')
 
         self.dpd_stage_2_threshold = staging_config.get('days_past_due_threshold', 30)
         self.dpd_stage_3_threshold = staging_config.get('days_past_due_default', 90)
@@ -54,16 +77,19 @@ class StagingFramework:
         """
         # Check Stage 3 criteria first (credit-impaired)
         if self.is_credit_impaired(item):
-            logger.debug("Item classified as Stage 3", item_id=item.item_id)
+            if is_enabled_for(logging.DEBUG):
+                logger.debug("Item classified as Stage 3", item_id=item.item_id)
             return Stage.STAGE_3
 
         # Check Stage 2 criteria (SICR)
         if self.detect_significant_increase_in_credit_risk(item, current_pd):
-            logger.debug("Item classified as Stage 2", item_id=item.item_id)
+            if is_enabled_for(logging.DEBUG):
+                logger.debug("Item classified as Stage 2", item_id=item.item_id)
             return Stage.STAGE_2
 
         # Default to Stage 1 (performing)
-        logger.debug("Item classified as Stage 1", item_id=item.item_id)
+        if is_enabled_for(logging.DEBUG):
+            logger.debug("Item classified as Stage 1", item_id=item.item_id)
         return Stage.STAGE_1
 
     def is_credit_impaired(self, item: PortfolioItem) -> bool:
@@ -82,27 +108,30 @@ class StagingFramework:
         """
         # DPD-based impairment
         if item.days_past_due > self.dpd_stage_3_threshold:
-            logger.debug(
-                "Credit impairment: DPD > threshold",
-                item_id=item.item_id,
-                dpd=item.days_past_due,
-                threshold=self.dpd_stage_3_threshold
-            )
+            if is_enabled_for(logging.DEBUG):
+                logger.debug(
+                    "Credit impairment: DPD > threshold",
+                    item_id=item.item_id,
+                    dpd=item.days_past_due,
+                    threshold=self.dpd_stage_3_threshold
+                )
             return True
 
         # Forbearance/restructuring (if significant)
         if item.is_forborne and item.days_past_due > 0:
-            logger.debug(
-                "Credit impairment: Forborne with DPD",
-                item_id=item.item_id
-            )
+            if is_enabled_for(logging.DEBUG):
+                logger.debug(
+                    "Credit impairment: Forborne with DPD",
+                    item_id=item.item_id
+                )
             return True
 
         if item.is_restructured and item.days_past_due > self.dpd_stage_2_threshold:
-            logger.debug(
-                "Credit impairment: Restructured with significant DPD",
-                item_id=item.item_id
-            )
+            if is_enabled_for(logging.DEBUG):
+                logger.debug(
+                    "Credit impairment: Restructured with significant DPD",
+                    item_id=item.item_id
+                )
             return True
 
         return False
@@ -129,21 +158,23 @@ class StagingFramework:
         """
         # Days past due check
         if item.days_past_due > self.dpd_sicr_threshold:
-            logger.debug(
-                "SICR detected: DPD > threshold",
-                item_id=item.item_id,
-                dpd=item.days_past_due,
-                threshold=self.dpd_sicr_threshold
-            )
+            if is_enabled_for(logging.DEBUG):
+                logger.debug(
+                    "SICR detected: DPD > threshold",
+                    item_id=item.item_id,
+                    dpd=item.days_past_due,
+                    threshold=self.dpd_sicr_threshold
+                )
             return True
 
         # Multiple past due events
         if item.times_past_due_12m >= 2:
-            logger.debug(
-                "SICR detected: Multiple past due events",
-                item_id=item.item_id,
-                times_past_due=item.times_past_due_12m
-            )
+            if is_enabled_for(logging.DEBUG):
+                logger.debug(
+                    "SICR detected: Multiple past due events",
+                    item_id=item.item_id,
+                    times_past_due=item.times_past_due_12m
+                )
             return True
 
         # PD-based SICR detection (if PD data available)
@@ -158,10 +189,11 @@ class StagingFramework:
 
         # Forbearance indicator
         if item.is_forborne or item.is_restructured:
-            logger.debug(
-                "SICR detected: Forbearance or restructuring",
-                item_id=item.item_id
-            )
+            if is_enabled_for(logging.DEBUG):
+                logger.debug(
+                    "SICR detected: Forbearance or restructuring",
+                    item_id=item.item_id
+                )
             return True
 
         return False
@@ -186,14 +218,15 @@ class StagingFramework:
         pd_increase_bps = (current_pd - origination_pd) * 10000
 
         if pd_increase_bps >= self.pd_increase_bps:
-            logger.debug(
-                "SICR detected: Absolute PD increase",
-                item_id=item_id,
-                current_pd=current_pd,
-                origination_pd=origination_pd,
-                increase_bps=pd_increase_bps,
-                threshold_bps=self.pd_increase_bps
-            )
+            if is_enabled_for(logging.DEBUG):
+                logger.debug(
+                    "SICR detected: Absolute PD increase",
+                    item_id=item_id,
+                    current_pd=current_pd,
+                    origination_pd=origination_pd,
+                    increase_bps=pd_increase_bps,
+                    threshold_bps=self.pd_increase_bps
+                )
             return True
 
         # Relative PD increase as percentage
@@ -201,79 +234,150 @@ class StagingFramework:
             relative_increase_pct = ((current_pd / origination_pd) - 1) * 100
 
             if relative_increase_pct >= self.relative_increase_pct:
-                logger.debug(
-                    "SICR detected: Relative PD increase",
-                    item_id=item_id,
-                    current_pd=current_pd,
-                    origination_pd=origination_pd,
-                    increase_pct=relative_increase_pct,
-                    threshold_pct=self.relative_increase_pct
-                )
+                if is_enabled_for(logging.DEBUG):
+                    logger.debug(
+                        "SICR detected: Relative PD increase",
+                        item_id=item_id,
+                        current_pd=current_pd,
+                        origination_pd=origination_pd,
+                        increase_pct=relative_increase_pct,
+                        threshold_pct=self.relative_increase_pct
+                    )
                 return True
 
         return False
 
     def perform_stage_migration(
         self,
-        items: List[PortfolioItem],
+        items: Iterable[PortfolioItem],
         pd_calculator=None
     ) -> Tuple[List[PortfolioItem], Dict[str, int]]:
         """Perform stage migration for entire portfolio.
 
         Args:
-            items: List of portfolio items
+            items: Portfolio items (a list, a Portfolio or any
+                iterable)
             pd_calculator: Optional PD calculator for SICR detection
 
         Returns:
             Tuple of (updated items, migration statistics)
         """
-        migration_stats = defaultdict(int)
-        updated_items = []
-
-        for item in items:
-            # Store previous stage
+        items = _as_collection(items)
+        n = len(items)
+        n_stages = len(_STAGES)
+        previous_codes = np.fromiter((STAGE_CODES[item.current_stage] for item in items), np.int32, n)
+
+        # Calculate current PDs if calculator provided
+        current_pds = None
+        if pd_calculator is not None:
+            current_pds = pd_calculator.calculate_12m_pd_batch(items)
+
+        # Classify all items in one compiled, parallel pass
+        stage_codes = self.classify_stage_batch(items, current_pds)
+
+        log_migrations = is_enabled_for(logging.DEBUG)
+        for item, code in zip(items, stage_codes.tolist()):
+            # Store previous stage and update item
             previous_stage = item.current_stage
-
-            # Calculate current PD if calculator provided
-            current_pd = None
-            if pd_calculator is not None:
-                current_pd = pd_calculator.calculate_12m_pd(item)
-
-            # Classify stage
-            new_stage = self.classify_stage(item, current_pd)
-
-            # Update item
+            new_stage = _STAGES[code]
             item.previous_stage = previous_stage
             item.current_stage = new_stage
 
-            # Track migration
-            migration_key = f"{previous_stage}_to_{new_stage}"
-            migration_stats[migration_key] += 1
-
-            if previous_stage != new_stage:
-                logger.info(
+            # Per-item detail only at debug level; the summary below is logged at info
+            if log_migrations and previous_stage != new_stage:
+                logger.debug(
                     "Stage migration",
                     item_id=item.item_id,
                     from_stage=str(previous_stage),
                     to_stage=str(new_stage)
                 )
 
-            updated_items.append(item)
-
-        # Log summary
-        total_migrations = sum(
-            count for key, count in migration_stats.items()
-            if '_to_' in key and key.split('_to_')[0] != key.split('_to_')[1]
-        )
+        # Count transitions as a flattened (from, to) stage matrix
+        transitions = np.bincount(previous_codes * n_stages + stage_codes, minlength=n_stages * n_stages)
+        migration_stats = {
+            f"{_STAGES[key // n_stages]}_to_{_STAGES[key % n_stages]}": count
+            for key, count in enumerate(transitions.tolist()) if count
+        }
+        total_migrations = n - int(np.trace(transitions.reshape(n_stages, n_stages)))
 
         logger.info(
             "Stage migration complete",
-            total_items=len(items),
+            total_items=n,
             total_migrations=total_migrations,
-            stats=dict(migration_stats)
+            stats=migration_stats
         )
 
-        return updated_items, dict(migration_stats)
+        return list(items), migration_stats
+
+    def classify_stage_batch(
+        self,
+        items: Collection[PortfolioItem],
+        current_pds: Optional[np.ndarray] = None,
+        portfolio: Optional[PortfolioArray] = None
+    ) -> np.ndarray:
+        """Classify many items into IFRS 9 stages at once.
+
+        Vectorized equivalent of ``classify_stage`` using the compiled
+        staging kernel. Items are not modified.
+
+        Args:
+            items: Portfolio items
+            current_pds: Optional current PD per item, parallel to items
+                (for SICR detection)
+            portfolio: Optional portfolio columns (aligned with ``items``)
+                to read instead of extracting them from the items
+
+        Returns:
+            Array of int32 stage codes (see ``models.enums.STAGE_CODES``)
+        """
+        n = len(items)
+        nan = float('nan')
+
+        if current_pds is None:
+            current_pd = np.full(n, np.nan)
+        else:
+            current_pd = np.asarray(current_pds, dtype=np.float64)
+
+        if portfolio is None:
+            days_past_due = np.fromiter((item.days_past_due for item in items), np.int64, n)
+            times_past_due = np.fromiter((item.times_past_due_12m for item in items), np.int64, n)
+            is_forborne = np.fromiter((item.is_forborne for item in items), np.bool_, n)
+            is_restructured = np.fromiter((item.is_restructured for item in items), np.bool_, n)
+            origination_pd = np.fromiter(
+                (nan if item.origination_pd is None else item.origination_pd for item in items),
+                np.float64,
+                n
+            )
+        else:
+            days_past_due = portfolio.days_past_due
+            times_past_due = portfolio.times_past_due_12m
+            is_forborne = portfolio.is_forborne
+            is_restructured = portfolio.is_restructured
+            origination_pd = portfolio.origination_pd
+
+        stage_codes = _stage_migrate_kernel(
+            days_past_due,
+            times_past_due,
+            is_forborne,
+            is_restructured,
+            current_pd,
+            origination_pd,
+            float(self.dpd_stage_2_threshold),
+            float(self.dpd_stage_3_threshold),
+            float(self.dpd_sicr_threshold),
+            float(self.pd_increase_bps),
+            float(self.relative_increase_pct),
+        )
+
+        if is_enabled_for(logging.DEBUG):
+            counts = np.bincount(stage_codes, minlength=len(_STAGES))
+            logger.debug(
+                "Classified stages",
+                total_items=n,
+                **{str(stage): int(count) for stage, count in zip(_STAGES, counts)}
+            )
+
+        return stage_codes
 
     def check_cure_eligibility(
         self,
@@ -307,46 +411,35 @@ class StagingFramework:
 
         return True
 
-    def get_stage_summary(self, items: List[PortfolioItem]) -> Dict:
+    def get_stage_summary(self, items: Iterable[PortfolioItem]) -> Dict:
         """Get summary statistics by stage.
 
         Args:
-            items: List of portfolio items
+            items: Portfolio items (a list, a Portfolio or any
+                iterable)
 
         Returns:
             Dictionary with stage statistics
         """
-        from decimal import Decimal
-
-        stage_counts = defaultdict(int)
-        stage_exposure = defaultdict(Decimal)
-
-        for item in items:
-            stage_counts[item.current_stage] += 1
-            stage_exposure[item.current_stage] += item.total_exposure
-
-        total_exposure = sum(stage_exposure.values())
-
-        summary = {
-            'stage_1': {
-                'count': stage_counts[Stage.STAGE_1],
-                'exposure': float(stage_exposure[Stage.STAGE_1]),
-                'exposure_pct': float(stage_exposure[Stage.STAGE_1] / total_exposure * 100) if total_exposure > 0 else 0,
-            },
-            'stage_2': {
-                'count': stage_counts[Stage.STAGE_2],
-                'exposure': float(stage_exposure[Stage.STAGE_2]),
-                'exposure_pct': float(stage_exposure[Stage.STAGE_2] / total_exposure * 100) if total_exposure > 0 else 0,
-            },
-            'stage_3': {
-                'count': stage_counts[Stage.STAGE_3],
-                'exposure': float(stage_exposure[Stage.STAGE_3]),
-                'exposure_pct': float(stage_exposure[Stage.STAGE_3] / total_exposure * 100) if total_exposure > 0 else 0,
-            },
-            'total': {
-                'count': len(items),
-                'exposure': float(total_exposure),
+        items = _as_collection(items)
+        n = len(items)
+        stage_codes = np.fromiter((STAGE_CODES[item.current_stage] for item in items), np.int32, n)
+        exposure = np.fromiter((item.outstanding_f + item.undrawn_f for item in items), np.float64, n)
+
+        counts = np.bincount(stage_codes, minlength=len(_STAGES))
+        exposures = np.bincount(stage_codes, weights=exposure, minlength=len(_STAGES))
+        total_exposure = float(exposures.sum())
+
+        summary = {}
+        for code, (count, exposure_amount) in enumerate(zip(counts.tolist(), exposures.tolist()), start=1):
+            summary[f'stage_{code}'] = {
+                'count': count,
+                'exposure': exposure_amount,
+                'exposure_pct': exposure_amount / total_exposure * 100 if total_exposure > 0 else 0,
             }
+        summary['total'] = {
+            'count': n,
+            'exposure': total_exposure,
         }
 
         return summary
@@ -0,0 +1,102 @@
+"""Compiled numerical kernels for portfolio validation.
+
+Kernels operate on float64 arrays only; fields are extracted from the
+items in the calling code. Explicit signatures compile the kernels eagerly
+at import, and ``cache=True`` persists the machine code (set
+``NUMBA_CACHE_DIR`` to control where).
+"""
+
+import math
+
+import numpy as np
+
+from utils.jit import njit, prange
+
+
+@njit(
+    "boolean[:](float64[:, ::1], float64, float64, float64, float64, float64, float64, float64, float64, float64)",
+    parallel=True,
+    nogil=True,
+    cache=True,
+)
+def _flag_invalid_kernel(
+    fields,
+    today,
+    min_credit_score,
+    max_credit_score,
+    min_pd,
+    max_pd,
+    max_interest_rate,
+    stage_3_days_past_due,
+    stage_1,
+    stage_3
+):
+    """Flag items breaking any validation rule, one row per item.
+
+    Rows hold, in order: outstanding amount, undrawn commitment, collateral
+    value, interest rate, credit score, origination PD, previous PD, days
+    past due, times past due in 12 months, origination, maturity and
+    reporting date ordinals, stage code, and the forborne-or-restructured,
+    missing-identifier and missing-collateral-type flags (0 or 1). Range
+    checks are negated so NaN values are flagged, and negative zero amounts
+    are flagged too. Items are processed in parallel.
+
+    Args:
+        fields: Field matrix of shape (items, 16)
+        today: Ordinal of the date origination dates may not be after
+        min_credit_score: Lowest valid credit score
+        max_credit_score: Highest valid credit score
+        min_pd: Lowest valid PD
+        max_pd: Highest valid PD
+        max_interest_rate: Highest reasonable interest rate
+        stage_3_days_past_due: Days past due above which items must be Stage 3
+        stage_1: Stage code of Stage 1
+        stage_3: Stage code of Stage 3
+
+    Returns:
+        Boolean array, True where an item may be invalid
+    """
+    n = fields.shape[0]
+    flags = np.empty(n, dtype=np.bool_)
+
+    for i in prange(n):
+        outstanding = fields[i, 0]
+        undrawn = fields[i, 1]
+        collateral = fields[i, 2]
+        interest_rate = fields[i, 3]
+        credit_score = fields[i, 4]
+        origination_pd = fields[i, 5]
+        previous_pd = fields[i, 6]
+        dpd = fields[i, 7]
+        origination = fields[i, 9]
+        maturity = fields[i, 10]
+        reporting = fields[i, 11]
+        stage = fields[i, 12]
+
+        flags[i] = (
+            fields[i, 14] != 0
+            # Amounts
+            or math.copysign(1.0, outstanding) < 0
+            or math.copysign(1.0, undrawn) < 0
+            or math.copysign(1.0, collateral) < 0
+            or interest_rate < 0
+            or interest_rate > max_interest_rate
+            # Dates
+            or origination >= maturity
+            or origination > today
+            or reporting < origination
+            # Credit metrics
+            or not (min_credit_score <= credit_score <= max_credit_score)
+            or not (min_pd <= origination_pd <= max_pd)
+            or not (min_pd <= previous_pd <= max_pd)
+            # Performance metrics
+            or dpd < 0
+            or fields[i, 8] < 0
+            # Business rules
+            or (dpd > stage_3_days_past_due and stage != stage_3)
+            or (fields[i, 13] != 0 and stage == stage_1)
+            or (collateral > 0 and fields[i, 15] != 0)
+            or reporting > maturity
+        )
+
+    return flags
@@ -1,17 +1,179 @@
 """Portfolio data export to various formats."""
 
+import csv
 import json
+from itertools import islice
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
 import pandas as pd
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on environment
+    ORJSON_AVAILABLE = False
+
 from models.portfolio_item import PortfolioItem
 from models.calculation_results import ECLResult, PortfolioECLResult
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Row count above which single-sheet Excel exports stream through xlsxwriter
+EXCEL_STREAMING_THRESHOLD = 5000
+
+# Write buffer for streamed CSV exports (fewer write syscalls on large files)
+CSV_BUFFER_SIZE = 4 * 1024 * 1024
+
+# Items encoded per write when streaming a JSON list
+JSON_ITEM_BATCH_SIZE = 1024
+
+
+def _output_path(file_path: str) -> Path:
+    """Resolve an export file path, creating its directory if needed.
+
+    Args:
+        file_path: Output file path
+
+    Returns:
+        Output path
+    """
+    path = Path(file_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize types the JSON encoder does not handle natively.
+
+    Args:
+        obj: Object to serialize
+
+    Returns:
+        JSON-serializable representation (string for anything exotic)
+    """
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    return str(obj)
+
+
+def _write_json(data: Any, path: Path, indent: Optional[int]):
+    """Write data to a JSON file, using orjson when it is installed.
+
+    orjson only supports two-space indentation, so other indent widths
+    fall back to the standard library encoder.
+
+    Args:
+        data: JSON-serializable data
+        path: Output file path
+        indent: JSON indentation (0 or None for compact output)
+    """
+    if ORJSON_AVAILABLE and indent in (0, 2, None):
+        option = orjson.OPT_INDENT_2 if indent else 0
+        path.write_bytes(orjson.dumps(data, default=_json_default, option=option))
+        return
+
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=indent or None, default=_json_default)
+
+
+def _write_json_with_items(data: Dict[str, Any], key: str, items: Iterable[Any], path: Path,
+                           indent: Optional[int]):
+    """Write a JSON object with one list member streamed item by item.
+
+    For a non-empty ``items`` this produces the same text as ``_write_json``
+    on ``{**data, key: list(items)}`` without building that list: each item
+    is encoded and written on its own, with nested lines shifted to the
+    list's indentation.
+
+    Args:
+        data: JSON-serializable members written before the list
+        key: Name of the list member
+        items: JSON-serializable list elements, consumed lazily
+        path: Output file path
+        indent: JSON indentation (0 or None for compact output)
+    """
+    if ORJSON_AVAILABLE and indent in (0, 2, None):
+        option = orjson.OPT_INDENT_2 if indent else 0
+
+        def dumps(obj: Any) -> bytes:
+            return orjson.dumps(obj, default=_json_default, option=option)
+        item_separator, key_separator = (b',', b': ') if indent else (b',', b':')
+    else:
+        def dumps(obj: Any) -> bytes:
+            return json.dumps(obj, indent=indent or None, default=_json_default).encode()
+        item_separator, key_separator = (b',', b': ') if indent else (b', ', b': ')
+
+    member_break = b'\n' + b' ' * indent if indent else b''
+    item_break = member_break + b' ' * indent if indent else b''
+
+    # Reopen the encoded object before its closing brace to append the list
+    head = dumps(data).rstrip()[:-1].rstrip()
+    with open(path, 'wb') as f:
+        f.write(head + item_separator if data else head)
+        f.write(member_break + dumps(key) + key_separator + b'[')
+
+        # Encode in fixed-size batches: one write per batch, bounded memory
+        items = iter(items)
+        batch_separator = b''
+        while True:
+            batch = [dumps(item) for item in islice(items, JSON_ITEM_BATCH_SIZE)]
+            if not batch:
+                break
+            if indent:
+                encoded = (b'\n' + (item_separator + b'\n').join(batch)).replace(b'\n', item_break)
+            else:
+                encoded = item_separator.join(batch)
+            f.write(batch_separator + encoded)
+            batch_separator = item_separator
+        f.write(member_break + b']' + (b'\n}' if indent else b'}'))
+
+
+def _write_csv_rows(path: Path, header: Sequence[str], rows: Iterable[tuple]):
+    """Stream rows to a CSV file under a header.
+
+    Rows are consumed lazily, so memory use does not grow with the number
+    of rows.
+
+    Args:
+        path: Output CSV file path
+        header: Column names
+        rows: Row tuples in header order
+    """
+    with open(path, 'w', newline='', buffering=CSV_BUFFER_SIZE) as f:
+        writer = csv.writer(f, lineterminator='\n')
+        writer.writerow(header)
+        writer.writerows(rows)
+
+
+def _write_excel_streaming(path: Path, sheets: Dict[str, Tuple[Sequence[str], Iterable[tuple]]]):
+    """Write rows to an Excel file with xlsxwriter in constant-memory mode.
+
+    Each row is flushed to a temporary file once the next row starts, so
+    memory stays flat however many rows are written, and rows go straight
+    to the writer without pandas' per-cell ``to_excel`` dispatch.
+
+    Args:
+        path: Output Excel file path
+        sheets: (header, rows) to write, keyed by sheet name (in sheet order);
+            rows must hold Excel-compatible values with None for blanks
+    """
+    import xlsxwriter
+
+    workbook = xlsxwriter.Workbook(str(path), {'constant_memory': True, 'strings_to_urls': False})
+    header_format = workbook.add_format({'bold': True, 'border': 1, 'align': 'center', 'valign': 'top'})
+
+    try:
+        for sheet_name, (header, rows) in sheets.items():
+            worksheet = workbook.add_worksheet(sheet_name)
+            worksheet.write_row(0, 0, header, header_format)
+            for row_index, row in enumerate(rows, start=1):
+                worksheet.write_row(row_index, 0, row)
+    finally:
+        workbook.close()
+
 
 class PortfolioExporter:
     """Export portfolio and ECL results to various formats."""
@@ -29,16 +191,9 @@ class PortfolioExporter:
         """
         logger.info("Exporting portfolio to CSV", file_path=file_path, item_count=len(items))
 
-        # Convert items to dictionaries
-        data = [item.to_dict() for item in items]
-
-        # Create DataFrame
-        df = pd.DataFrame(data)
-
-        # Save to CSV
-        path = Path(file_path)
-        path.parent.mkdir(parents=True, exist_ok=True)
-        df.to_csv(path, index=False)
+        # Save to CSV, streaming rows without building a DataFrame
+        path = _output_path(file_path)
+        _write_csv_rows(path, PortfolioItem.FIELDS, (item.to_record_tuple() for item in items))
 
         logger.info("Portfolio exported to CSV", file_path=file_path)
 
@@ -57,16 +212,16 @@ class PortfolioExporter:
         """
         logger.info("Exporting portfolio to Excel", file_path=file_path, item_count=len(items))
 
-        # Convert items to dictionaries
-        data = [item.to_dict() for item in items]
+        path = _output_path(file_path)
 
-        # Create DataFrame
-        df = pd.DataFrame(data)
+        rows = [item.to_record_tuple() for item in items]
 
-        # Save to Excel
-        path = Path(file_path)
-        path.parent.mkdir(parents=True, exist_ok=True)
-        df.to_excel(path, sheet_name=sheet_name, index=False)
+        # Save to Excel, streaming large exports straight from the records
+        if len(rows) > EXCEL_STREAMING_THRESHOLD:
+            _write_excel_streaming(path, {sheet_name: (PortfolioItem.FIELDS, rows)})
+        else:
+            df = pd.DataFrame.from_records(rows, columns=PortfolioItem.FIELDS)
+            df.to_excel(path, sheet_name=sheet_name, index=False)
 
         logger.info("Portfolio exported to Excel", file_path=file_path)
 
@@ -89,11 +244,8 @@ class PortfolioExporter:
         data = [item.to_dict() for item in items]
 
         # Save to JSON
-        path = Path(file_path)
-        path.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(path, 'w') as f:
-            json.dump(data, f, indent=indent, default=str)
+        path = _output_path(file_path)
+        _write_json(data, path, indent)
 
         logger.info("Portfolio exported to JSON", file_path=file_path)
 
@@ -110,16 +262,9 @@ class PortfolioExporter:
         """
         logger.info("Exporting ECL results to CSV", file_path=file_path, result_count=len(results))
 
-        # Convert results to dictionaries
-        data = [result.to_dict() for result in results]
-
-        # Create DataFrame
-        df = pd.DataFrame(data)
-
-        # Save to CSV
-        path = Path(file_path)
-        path.parent.mkdir(parents=True, exist_ok=True)
-        df.to_csv(path, index=False)
+        # Save to CSV, streaming rows without building a DataFrame
+        path = _output_path(file_path)
+        _write_csv_rows(path, ECLResult.FIELDS, (result.to_record_tuple() for result in results))
 
         logger.info("ECL results exported to CSV", file_path=file_path)
 
@@ -138,16 +283,16 @@ class PortfolioExporter:
         """
         logger.info("Exporting ECL results to Excel", file_path=file_path, result_count=len(results))
 
-        # Convert results to dictionaries
-        data = [result.to_dict() for result in results]
+        path = _output_path(file_path)
 
-        # Create DataFrame
-        df = pd.DataFrame(data)
+        rows = [result.to_record_tuple() for result in results]
 
-        # Save to Excel
-        path = Path(file_path)
-        path.parent.mkdir(parents=True, exist_ok=True)
-        df.to_excel(path, sheet_name=sheet_name, index=False)
+        # Save to Excel, streaming large exports straight from the records
+        if len(rows) > EXCEL_STREAMING_THRESHOLD:
+            _write_excel_streaming(path, {sheet_name: (ECLResult.FIELDS, rows)})
+        else:
+            df = pd.DataFrame.from_records(rows, columns=ECLResult.FIELDS)
+            df.to_excel(path, sheet_name=sheet_name, index=False)
 
         logger.info("ECL results exported to Excel", file_path=file_path)
 
@@ -164,65 +309,42 @@ class PortfolioExporter:
         """
         logger.info("Exporting portfolio ECL to Excel", file_path=file_path)
 
-        path = Path(file_path)
-        path.parent.mkdir(parents=True, exist_ok=True)
-
-        with pd.ExcelWriter(path, engine='xlsxwriter') as writer:
-            # Summary sheet
-            summary = portfolio_result.get_summary()
-            summary_df = pd.DataFrame([summary])
-            summary_df.to_excel(writer, sheet_name='Summary', index=False)
-
-            # Stage breakdown
-            stage_data = [
-                {
-                    'Stage': 'Stage 1',
-                    'ECL': float(portfolio_result.stage_1_ecl),
-                    'Exposure': float(portfolio_result.stage_1_exposure),
-                    'Count': portfolio_result.stage_1_count,
-                    'Coverage': portfolio_result.stage_1_coverage,
-                },
-                {
-                    'Stage': 'Stage 2',
-                    'ECL': float(portfolio_result.stage_2_ecl),
-                    'Exposure': float(portfolio_result.stage_2_exposure),
-                    'Count': portfolio_result.stage_2_count,
-                    'Coverage': portfolio_result.stage_2_coverage,
-                },
-                {
-                    'Stage': 'Stage 3',
-                    'ECL': float(portfolio_result.stage_3_ecl),
-                    'Exposure': float(portfolio_result.stage_3_exposure),
-                    'Count': portfolio_result.stage_3_count,
-                    'Coverage': portfolio_result.stage_3_coverage,
-                },
+        path = _output_path(file_path)
+
+        # Summary sheet (nested stage figures written as text)
+        summary = portfolio_result.get_summary()
+        sheets = {'Summary': (
+            list(summary),
+            [tuple(str(value) if isinstance(value, dict) else value for value in summary.values())]
+        )}
+
+        # Stage breakdown
+        sheets['Stage Breakdown'] = (
+            ('Stage', 'ECL', 'Exposure', 'Count', 'Coverage'),
+            [
+                ('Stage 1', portfolio_result.stage_1_ecl, portfolio_result.stage_1_exposure,
+                 portfolio_result.stage_1_count, portfolio_result.stage_1_coverage),
+                ('Stage 2', portfolio_result.stage_2_ecl, portfolio_result.stage_2_exposure,
+                 portfolio_result.stage_2_count, portfolio_result.stage_2_coverage),
+                ('Stage 3', portfolio_result.stage_3_ecl, portfolio_result.stage_3_exposure,
+                 portfolio_result.stage_3_count, portfolio_result.stage_3_coverage),
             ]
-            stage_df = pd.DataFrame(stage_data)
-            stage_df.to_excel(writer, sheet_name='Stage Breakdown', index=False)
-
-            # Sector breakdown
-            if portfolio_result.ecl_by_sector:
-                sector_data = [
-                    {'Sector': sector, 'ECL': float(ecl)}
-                    for sector, ecl in portfolio_result.ecl_by_sector.items()
-                ]
-                sector_df = pd.DataFrame(sector_data)
-                sector_df.to_excel(writer, sheet_name='By Sector', index=False)
-
-            # Product breakdown
-            if portfolio_result.ecl_by_product:
-                product_data = [
-                    {'Product': product, 'ECL': float(ecl)}
-                    for product, ecl in portfolio_result.ecl_by_product.items()
-                ]
-                product_df = pd.DataFrame(product_data)
-                product_df.to_excel(writer, sheet_name='By Product', index=False)
-
-            # Individual results
-            if portfolio_result.item_results:
-                results_data = [result.to_dict() for result in portfolio_result.item_results]
-                results_df = pd.DataFrame(results_data)
-                results_df.to_excel(writer, sheet_name='Detailed Results', index=False)
+        )
+
+        # Sector and product breakdowns
+        if portfolio_result.ecl_by_sector:
+            sheets['By Sector'] = (('Sector', 'ECL'), portfolio_result.ecl_by_sector.items())
+        if portfolio_result.ecl_by_product:
+            sheets['By Product'] = (('Product', 'ECL'), portfolio_result.ecl_by_product.items())
+
+        # Individual results, written straight from the records
+        if portfolio_result.item_results:
+            sheets['Detailed Results'] = (
+                ECLResult.FIELDS,
+                (result.to_record_tuple() for result in portfolio_result.item_results)
+            )
+
+        _write_excel_streaming(path, sheets)
 
         logger.info("Portfolio ECL exported to Excel", file_path=file_path)
 
@@ -245,11 +367,8 @@ class PortfolioExporter:
         data = [result.to_dict() for result in results]
 
         # Save to JSON
-        path = Path(file_path)
-        path.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(path, 'w') as f:
-            json.dump(data, f, indent=indent, default=str)
+        path = _output_path(file_path)
+        _write_json(data, path, indent)
 
         logger.info("ECL results exported to JSON", file_path=file_path)
 
@@ -271,17 +390,15 @@ class PortfolioExporter:
         # Convert to dictionary
         data = portfolio_result.to_dict()
 
-        # Add detailed results
+        # Save to JSON, streaming detailed results one at a time
+        path = _output_path(file_path)
         if portfolio_result.item_results:
-            data['detailed_results'] = [
-                result.to_dict() for result in portfolio_result.item_results
-            ]
-
-        # Save to JSON
-        path = Path(file_path)
-        path.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(path, 'w') as f:
-            json.dump(data, f, indent=indent, default=str)
+            _write_json_with_items(
+                data, 'detailed_results',
+                (result.to_dict() for result in portfolio_result.item_results),
+                path, indent
+            )
+        else:
+            _write_json(data, path, indent)
 
         logger.info("Portfolio ECL exported to JSON", file_path=file_path)
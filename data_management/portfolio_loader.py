@@ -1,19 +1,51 @@
 """Portfolio data loading from various sources."""
 
-from datetime import date
+import importlib.util
+import logging
+from datetime import date, datetime
 from decimal import Decimal
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 from models.portfolio_item import PortfolioItem
 from models.enums import Stage
-from utils.logger import get_logger
+from utils.logger import get_logger, is_enabled_for
 
 logger = get_logger(__name__)
 
 
+def _pandas_supports_calamine(version: str) -> bool:
+    """Check whether a pandas version has the 'calamine' read_excel engine (added in 2.2).
+
+    Args:
+        version: pandas version string
+
+    Returns:
+        True for pandas 2.2 or newer
+    """
+    major, minor = version.split('.')[:2]
+    return (int(major), int(minor)) >= (2, 2)
+
+
+# Rust-based Excel reader used by pandas when installed (optional)
+CALAMINE_AVAILABLE = (
+    importlib.util.find_spec('python_calamine') is not None and _pandas_supports_calamine(pd.__version__)
+)
+
+# Normalized (stripped, upper-case) stage labels mapped to stages
+_STAGE_ALIASES: Dict[str, Stage] = {
+    alias: stage
+    for number, stage in enumerate(Stage, start=1)
+    for alias in (str(number), f'STAGE {number}', f'STAGE{number}', f'STAGE_{number}')
+}
+
+# Generated row builder factories, keyed by (loader class, columns present)
+_ROW_BUILDER_FACTORIES: Dict[Tuple[type, FrozenSet[str]], Callable] = {}
+
+
 class PortfolioLoader:
     """Load portfolio data from CSV, Excel, or other sources."""
 
@@ -47,6 +79,13 @@ class PortfolioLoader:
         'currency': ['currency', 'ccy'],
     }
 
+    # Inverted COLUMN_MAPPING: alias -> (standard column, alias priority)
+    _ALIAS_TO_STANDARD = {
+        alias: (standard_col, priority)
+        for standard_col, possible_cols in COLUMN_MAPPING.items()
+        for priority, alias in enumerate(possible_cols)
+    }
+
     @classmethod
     def load_from_csv(
         cls,
@@ -70,9 +109,11 @@ class PortfolioLoader:
         if not path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
 
-        # Read CSV
-        df = pd.read_csv(file_path, **kwargs)
-        logger.info("CSV loaded", rows=len(df), columns=list(df.columns))
+        # Read CSV, letting the parser convert dates and identifiers
+        read_options = {**cls._read_csv_hints(file_path, column_mapping, kwargs), **kwargs}
+        df = pd.read_csv(file_path, **read_options)
+        if is_enabled_for(logging.INFO):
+            logger.info("CSV loaded", rows=len(df), columns=list(df.columns))
 
         # Apply column mapping
         df = cls._apply_column_mapping(df, column_mapping)
@@ -83,12 +124,48 @@ class PortfolioLoader:
         logger.info("Portfolio loaded successfully", item_count=len(items))
         return items
 
+    @classmethod
+    def _read_csv_hints(
+        cls,
+        file_path: str,
+        column_mapping: Optional[Dict[str, str]],
+        read_kwargs: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Build read_csv type hints from the file's mapped header.
+
+        Date columns are parsed by the CSV parser and identifier columns are
+        read as text, so IDs such as '00123' keep their leading zeros.
+        Hints the caller passed explicitly are left to the caller.
+
+        Args:
+            file_path: Path to CSV file
+            column_mapping: Custom column name mapping
+            read_kwargs: Caller's read_csv arguments
+
+        Returns:
+            Dictionary of read_csv arguments ('parse_dates' and 'dtype')
+        """
+        header_kwargs = {k: v for k, v in read_kwargs.items() if k not in ('nrows', 'skipfooter')}
+        header = pd.read_csv(file_path, nrows=0, **header_kwargs)
+        mapped = cls._apply_column_mapping(header, column_mapping)
+        standard = dict(zip(header.columns, mapped.columns))
+
+        hints = {}
+        if 'parse_dates' not in read_kwargs:
+            hints['parse_dates'] = [col for col, std in standard.items() if std in cls.DATE_FIELDS]
+        if 'dtype' not in read_kwargs:
+            hints['dtype'] = {col: str for col, std in standard.items() if std in cls.ID_FIELDS}
+
+        return hints
+
     @classmethod
     def load_from_excel(
         cls,
         file_path: str,
         sheet_name: str = 0,
         column_mapping: Optional[Dict[str, str]] = None,
+        engine: Optional[str] = None,
+        cache_parquet: bool = False,
         **kwargs
     ) -> List[PortfolioItem]:
         """Load portfolio from Excel file.
@@ -97,6 +174,12 @@ class PortfolioLoader:
             file_path: Path to Excel file
             sheet_name: Sheet name or index to load
             column_mapping: Custom column name mapping
+            engine: pandas Excel engine (defaults to 'calamine' when
+                python-calamine is installed and pandas is 2.2 or newer,
+                otherwise the pandas default)
+            cache_parquet: Keep a parquet copy of the sheet next to the Excel
+                file and read it instead while it is newer than the workbook.
+                The cache ignores ``**kwargs``, so use it with fixed read options.
             **kwargs: Additional arguments passed to pandas read_excel
 
         Returns:
@@ -108,9 +191,60 @@ class PortfolioLoader:
         if not path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
 
-        # Read Excel
-        df = pd.read_excel(file_path, sheet_name=sheet_name, **kwargs)
-        logger.info("Excel loaded", rows=len(df), columns=list(df.columns))
+        if engine is None and CALAMINE_AVAILABLE:
+            engine = 'calamine'
+
+        cache_path = path.with_name(f"{path.stem}.{sheet_name}.parquet") if cache_parquet else None
+
+        if cache_path is not None and cache_path.exists() and cache_path.stat().st_mtime >= path.stat().st_mtime:
+            # Read the cached copy of the sheet
+            df = pd.read_parquet(cache_path)
+            logger.info("Excel loaded from parquet cache", cache_path=str(cache_path), rows=len(df))
+        else:
+            # Read Excel
+            df = pd.read_excel(file_path, sheet_name=sheet_name, engine=engine, **kwargs)
+            if is_enabled_for(logging.INFO):
+                logger.info("Excel loaded", rows=len(df), columns=list(df.columns))
+
+            if cache_path is not None:
+                cls._write_parquet_cache(df, cache_path)
+
+        # Apply column mapping
+        df = cls._apply_column_mapping(df, column_mapping)
+
+        # Convert to PortfolioItem objects
+        items = cls._dataframe_to_items(df)
+
+        logger.info("Portfolio loaded successfully", item_count=len(items))
+        return items
+
+    @classmethod
+    def load_from_parquet(
+        cls,
+        file_path: str,
+        column_mapping: Optional[Dict[str, str]] = None,
+        **kwargs
+    ) -> List[PortfolioItem]:
+        """Load portfolio from Parquet file.
+
+        Args:
+            file_path: Path to Parquet file
+            column_mapping: Custom column name mapping
+            **kwargs: Additional arguments passed to pandas read_parquet
+
+        Returns:
+            List of PortfolioItem objects
+        """
+        logger.info("Loading portfolio from Parquet", file_path=file_path)
+
+        path = Path(file_path)
+        if not path.exists():
+            raise FileNotFoundError(f"File not found: {file_path}")
+
+        # Read Parquet
+        df = pd.read_parquet(file_path, **kwargs)
+        if is_enabled_for(logging.INFO):
+            logger.info("Parquet loaded", rows=len(df), columns=list(df.columns))
 
         # Apply column mapping
         df = cls._apply_column_mapping(df, column_mapping)
@@ -121,6 +255,21 @@ class PortfolioLoader:
         logger.info("Portfolio loaded successfully", item_count=len(items))
         return items
 
+    @staticmethod
+    def _write_parquet_cache(df: pd.DataFrame, cache_path: Path):
+        """Write a parquet copy of a loaded sheet, logging instead of failing.
+
+        Args:
+            df: Sheet as read from Excel
+            cache_path: Parquet file to write
+        """
+        try:
+            df.to_parquet(cache_path, index=False)
+        except Exception as e:
+            # e.g. mixed-type columns parquet cannot store; loading still succeeds
+            logger.warning("Failed to write parquet cache", cache_path=str(cache_path), error=str(e))
+            cache_path.unlink(missing_ok=True)
+
     @classmethod
     def load_from_dataframe(
         cls,
@@ -155,6 +304,9 @@ class PortfolioLoader:
     ) -> pd.DataFrame:
         """Apply column name mapping to standardize DataFrame.
 
+        Only the column labels are replaced: the result shares its data with
+        the input frame, which is left unchanged.
+
         Args:
             df: Input DataFrame
             custom_mapping: Custom column mapping (overrides default)
@@ -162,46 +314,116 @@ class PortfolioLoader:
         Returns:
             DataFrame with standardized column names
         """
-        df = df.copy()
+        # Pick the highest-priority alias present for each standard column
+        matches = {}
+        for col in df.columns:
+            match = cls._ALIAS_TO_STANDARD.get(col)
+            if match is None:
+                continue
+            standard_col, priority = match
+            if standard_col not in matches or priority < matches[standard_col][1]:
+                matches[standard_col] = (col, priority)
 
         # Build reverse mapping (file column -> standard column)
-        reverse_mapping = {}
-        for standard_col, possible_cols in cls.COLUMN_MAPPING.items():
-            for col in possible_cols:
-                if col in df.columns:
-                    reverse_mapping[col] = standard_col
-                    break
+        reverse_mapping = {col: standard_col for standard_col, (col, _) in matches.items()}
 
         # Apply custom mapping
         if custom_mapping:
             reverse_mapping.update(custom_mapping)
 
-        # Rename columns
-        df.rename(columns=reverse_mapping, inplace=True)
-
-        return df
+        # Rename columns on a shallow copy (no column data is copied)
+        renamed = df.copy(deep=False)
+        renamed.columns = [reverse_mapping.get(col, col) for col in df.columns]
+
+        return renamed
+
+    # Identifier columns kept as text
+    ID_FIELDS = ('item_id', 'borrower_id')
+
+    # Columns every row reads, falling back to defaults when absent
+    REQUIRED_FIELDS = ID_FIELDS + ('origination_date', 'maturity_date', 'outstanding_amount')
+
+    # Date columns parsed once per column before rows are assembled
+    DATE_FIELDS = ('origination_date', 'maturity_date', 'reporting_date')
+
+    # Amount columns converted to Decimal once per column
+    DECIMAL_FIELDS = ('outstanding_amount', 'undrawn_commitment', 'collateral_value')
+
+    # Stage columns mapped once per column before rows are assembled
+    STAGE_FIELDS = ('current_stage', 'previous_stage', 'origination_stage')
+
+    # Optional fields: (standard column, converter name) applied to non-null values
+    OPTIONAL_FIELDS = (
+        ('reporting_date', '_as_date'),
+        ('undrawn_commitment', '_parse_decimal'),
+        ('interest_rate', 'float'),
+        ('collateral_value', '_parse_decimal'),
+        ('credit_score', 'int'),
+        ('days_past_due', 'int'),
+        ('times_past_due_12m', 'int'),
+        ('sector', 'str'),
+        ('product_type', 'str'),
+        ('currency', 'str'),
+        ('collateral_type', 'str'),
+        ('internal_rating', 'str'),
+        ('external_rating', 'str'),
+        ('country', 'str'),
+        ('region', 'str'),
+        ('is_forborne', 'bool'),
+        ('is_restructured', 'bool'),
+        ('current_stage', '_parse_stage'),
+        ('previous_stage', '_parse_stage'),
+        ('origination_stage', '_parse_stage'),
+        ('origination_pd', 'float'),
+        ('previous_pd', 'float'),
+    )
 
     @classmethod
     def _dataframe_to_items(cls, df: pd.DataFrame) -> List[PortfolioItem]:
         """Convert DataFrame to list of PortfolioItem objects.
 
+        Each column a row reads is extracted once as a NumPy array (with a
+        null mask for optional fields), so rows are assembled by index
+        instead of materializing a Series per row.
+
         Args:
             df: DataFrame with standardized column names
 
         Returns:
             List of PortfolioItem objects
         """
+        column_parsers = {
+            **dict.fromkeys(cls.DATE_FIELDS, cls._parse_date_column),
+            **dict.fromkeys(cls.STAGE_FIELDS, cls._parse_stage_column),
+            **dict.fromkeys(cls.DECIMAL_FIELDS, cls._parse_decimal_column),
+        }
+
+        # Extract only the columns rows are built from; null masks are
+        # computed once per column, and only where nulls are skipped
+        optional_fields = dict(cls.OPTIONAL_FIELDS)
+        columns = {}
+        notna = {}
+        for col in df.columns:
+            if col not in cls.REQUIRED_FIELDS and col not in optional_fields:
+                continue
+            series = df[col]
+            parse = column_parsers.get(col)
+            columns[col] = parse(series) if parse else series.to_numpy(dtype=object)
+            if col in optional_fields:
+                notna[col] = series.notna().to_numpy()
+
+        build_row = cls._row_builder(columns, notna)
+
         items = []
 
-        for idx, row in df.iterrows():
+        for i in range(len(df)):
             try:
-                item_data = cls._row_to_dict(row)
-                item = PortfolioItem(**item_data)
+                item = PortfolioItem(**build_row(i))
                 items.append(item)
             except Exception as e:
                 logger.warning(
                     "Failed to create PortfolioItem",
-                    row_index=idx,
+                    row_index=df.index[i],
                     error=str(e)
                 )
                 # Continue processing other rows
@@ -209,94 +431,173 @@ class PortfolioLoader:
         return items
 
     @classmethod
-    def _row_to_dict(cls, row: pd.Series) -> Dict[str, Any]:
-        """Convert DataFrame row to dictionary suitable for PortfolioItem.
+    def _row_builder(
+        cls,
+        columns: Dict[str, np.ndarray],
+        notna: Dict[str, np.ndarray]
+    ) -> Callable[[int], Dict[str, Any]]:
+        """Get a function building the PortfolioItem arguments for a row.
+
+        The builder is specialized to the columns present, so it runs no
+        per-row checks for which fields exist.
+
+        Args:
+            columns: Column values keyed by standard column name
+            notna: Non-null masks for the optional columns present
+
+        Returns:
+            Function mapping a row position to PortfolioItem attributes
+        """
+        key = (cls, frozenset(columns))
+        factory = _ROW_BUILDER_FACTORIES.get(key)
+        if factory is None:
+            factory = _ROW_BUILDER_FACTORIES[key] = cls._compile_row_builder(key[1])
+        return factory(columns, notna)
+
+    @classmethod
+    def _compile_row_builder(cls, schema: FrozenSet[str]) -> Callable[..., Callable[[int], Dict[str, Any]]]:
+        """Generate a row builder factory for a set of columns.
+
+        Required fields absent from the schema get their defaults inlined;
+        absent optional fields are left out of the source entirely.
+
+        Args:
+            schema: Standard column names present
+
+        Returns:
+            Function taking (columns, notna) and returning a row builder
+        """
+        builtin_converters = {'float': float, 'int': int, 'str': str, 'bool': bool}
+        namespace = {'str': str, 'as_date': cls._as_date, 'parse_decimal': cls._parse_decimal}
+
+        # Required fields: (field, expression for a present column, expression when absent)
+        required = (
+            ('item_id', 'str(col_item_id[i])', "''"),
+            ('borrower_id', 'str(col_borrower_id[i])', "''"),
+            ('origination_date', 'as_date(col_origination_date[i])', 'as_date(None)'),
+            ('maturity_date', 'as_date(col_maturity_date[i])', 'as_date(None)'),
+            ('outstanding_amount', 'parse_decimal(col_outstanding_amount[i])', 'parse_decimal(0)'),
+        )
+        optional = [field for field, _ in cls.OPTIONAL_FIELDS if field in schema]
+
+        lines = ['def make_builder(columns, notna):']
+        lines += [f'    col_{field} = columns[{field!r}]' for field, _, _ in required if field in schema]
+        for field in optional:
+            lines.append(f'    col_{field} = columns[{field!r}]')
+            lines.append(f'    notna_{field} = notna[{field!r}]')
+        lines.append('    def build(i):')
+        lines.append('        data = {' + ', '.join(
+            f'{field!r}: {present if field in schema else absent}' for field, present, absent in required
+        ) + '}')
+        for field, converter in cls.OPTIONAL_FIELDS:
+            if field in schema:
+                namespace[f'convert_{field}'] = builtin_converters.get(converter) or getattr(cls, converter)
+                lines.append(f'        if notna_{field}[i]:')
+                lines.append(f'            data[{field!r}] = convert_{field}(col_{field}[i])')
+        lines.append('        return data')
+        lines.append('    return build')
+
+        exec(compile('\n'.join(lines), f'<{cls.__name__} row builder>', 'exec'), namespace)
+        return namespace['make_builder']
+
+    @staticmethod
+    def _parse_date_column(values: pd.Series) -> np.ndarray:
+        """Parse a column of date values in one vectorized call.
+
+        Cells the vectorized parser cannot handle (nulls, unparseable values
+        or formats differing from the rest of the column) are left as-is for
+        ``_parse_date`` to handle individually, as are numeric columns.
+
+        Args:
+            values: Column of date values
+
+        Returns:
+            Object array of date objects, with unparsed cells unchanged
+        """
+        if pd.api.types.is_datetime64_any_dtype(values):
+            parsed = values
+        elif values.dtype.kind in 'biuf':
+            return values.to_numpy(dtype=object)
+        else:
+            parsed = pd.to_datetime(values, errors='coerce')
+
+        dates = parsed.dt.date.to_numpy(dtype=object)
+
+        failed = parsed.isna().to_numpy()
+        if failed.any():
+            dates = np.where(failed, values.to_numpy(dtype=object), dates)
+
+        return dates
+
+    @classmethod
+    def _as_date(cls, value) -> date:
+        """Return a pre-parsed date, parsing any other value.
 
         Args:
-            row: DataFrame row
+            value: Date value from a parsed date column
 
         Returns:
-            Dictionary with PortfolioItem attributes
+            date object
         """
-        data = {}
-
-        # Required fields
-        data['item_id'] = str(row.get('item_id', ''))
-        data['borrower_id'] = str(row.get('borrower_id', ''))
-
-        # Dates
-        data['origination_date'] = cls._parse_date(row.get('origination_date'))
-        data['maturity_date'] = cls._parse_date(row.get('maturity_date'))
-        if 'reporting_date' in row and pd.notna(row['reporting_date']):
-            data['reporting_date'] = cls._parse_date(row['reporting_date'])
-
-        # Amounts
-        data['outstanding_amount'] = cls._parse_decimal(row.get('outstanding_amount', 0))
-
-        # Optional numeric fields
-        if 'undrawn_commitment' in row and pd.notna(row['undrawn_commitment']):
-            data['undrawn_commitment'] = cls._parse_decimal(row['undrawn_commitment'])
-        if 'interest_rate' in row and pd.notna(row['interest_rate']):
-            data['interest_rate'] = float(row['interest_rate'])
-        if 'collateral_value' in row and pd.notna(row['collateral_value']):
-            data['collateral_value'] = cls._parse_decimal(row['collateral_value'])
-        if 'credit_score' in row and pd.notna(row['credit_score']):
-            data['credit_score'] = int(row['credit_score'])
-        if 'days_past_due' in row and pd.notna(row['days_past_due']):
-            data['days_past_due'] = int(row['days_past_due'])
-        if 'times_past_due_12m' in row and pd.notna(row['times_past_due_12m']):
-            data['times_past_due_12m'] = int(row['times_past_due_12m'])
-
-        # Optional string fields
-        for field in ['sector', 'product_type', 'currency', 'collateral_type',
-                      'internal_rating', 'external_rating', 'country', 'region']:
-            if field in row and pd.notna(row[field]):
-                data[field] = str(row[field])
-
-        # Boolean fields
-        if 'is_forborne' in row and pd.notna(row['is_forborne']):
-            data['is_forborne'] = bool(row['is_forborne'])
-        if 'is_restructured' in row and pd.notna(row['is_restructured']):
-            data['is_restructured'] = bool(row['is_restructured'])
-
-        # Stage
-        if 'current_stage' in row and pd.notna(row['current_stage']):
-            data['current_stage'] = cls._parse_stage(row['current_stage'])
-        if 'previous_stage' in row and pd.notna(row['previous_stage']):
-            data['previous_stage'] = cls._parse_stage(row['previous_stage'])
-        if 'origination_stage' in row and pd.notna(row['origination_stage']):
-            data['origination_stage'] = cls._parse_stage(row['origination_stage'])
-
-        # PD fields
-        if 'origination_pd' in row and pd.notna(row['origination_pd']):
-            data['origination_pd'] = float(row['origination_pd'])
-        if 'previous_pd' in row and pd.notna(row['previous_pd']):
-            data['previous_pd'] = float(row['previous_pd'])
-
-        return data
+        if type(value) is date:
+            return value
+        return cls._parse_date(value)
 
     @staticmethod
     def _parse_date(value) -> date:
         """Parse date value from various formats.
 
         Args:
-            value: Date value (string, datetime, or date)
+            value: Date value (string, datetime, Timestamp, datetime64 or date)
 
         Returns:
             date object
         """
+        if type(value) is date:
+            return value
         if pd.isna(value):
             raise ValueError("Date value is required")
 
+        # datetime covers Timestamp; both drop their time of day
+        if isinstance(value, datetime):
+            return value.date()
         if isinstance(value, date):
             return value
-        if isinstance(value, pd.Timestamp):
-            return value.date()
-        if isinstance(value, str):
-            return pd.to_datetime(value).date()
+        if isinstance(value, (str, np.datetime64)):
+            # The Timestamp constructor parses in C, far cheaper than to_datetime
+            try:
+                timestamp = pd.Timestamp(value)
+            except ValueError as e:
+                raise ValueError(f"Cannot parse date from: {value}") from e
+            if timestamp is not pd.NaT:
+                return timestamp.date()
 
         raise ValueError(f"Cannot parse date from: {value}")
 
+    @staticmethod
+    def _parse_decimal_column(column: pd.Series) -> np.ndarray:
+        """Convert a numeric column to Decimal in one pass.
+
+        Values go through their shortest round-trip string, exactly as
+        ``_parse_decimal`` does per value, so amounts keep their digits.
+        Non-numeric columns are returned unchanged for per-value parsing.
+
+        Args:
+            column: Column of amounts
+
+        Returns:
+            Object array of Decimal (nulls as zero), or of the raw values
+        """
+        values = column.to_numpy()
+        if values.dtype.kind not in 'iuf':
+            return column.to_numpy(dtype=object)
+
+        decimals = np.array(list(map(Decimal, map(str, values.tolist()))), dtype=object)
+        if values.dtype.kind == 'f':
+            decimals[np.isnan(values)] = Decimal('0')
+
+        return decimals
+
     @staticmethod
     def _parse_decimal(value) -> Decimal:
         """Parse decimal value.
@@ -307,10 +608,31 @@ class PortfolioLoader:
         Returns:
             Decimal object
         """
+        if type(value) is Decimal and value.is_finite():
+            return value
         if pd.isna(value):
             return Decimal('0')
         return Decimal(str(value))
 
+    @staticmethod
+    def _parse_stage_column(values: pd.Series) -> np.ndarray:
+        """Map a column of stage labels to stages in one vectorized pass.
+
+        Labels missing from the alias table are left as-is for
+        ``_parse_stage`` to handle individually.
+
+        Args:
+            values: Column of stage values
+
+        Returns:
+            Object array of Stage members, with unmapped cells unchanged
+        """
+        raw = values.to_numpy(dtype=object)
+        labels = pd.Series(raw, dtype=object).astype(str).str.strip().str.upper()
+        mapped = labels.map(_STAGE_ALIASES)
+
+        return np.where(mapped.isna().to_numpy(), raw, mapped.to_numpy(dtype=object))
+
     @staticmethod
     def _parse_stage(value) -> Stage:
         """Parse stage value.
@@ -326,19 +648,18 @@ class PortfolioLoader:
 
         value_str = str(value).strip()
 
-        # Try direct enum value
-        try:
-            return Stage(value_str)
-        except ValueError:
-            pass
+        # Common labels ('1', 'Stage 1', 'STAGE_1', ...) via dictionary lookup
+        stage = _STAGE_ALIASES.get(value_str.upper())
+        if stage is not None:
+            return stage
 
-        # Try normalizing
+        # Fall back to free-form labels containing the stage
         value_upper = value_str.upper()
-        if 'STAGE 1' in value_upper or value_upper == '1':
+        if 'STAGE 1' in value_upper:
             return Stage.STAGE_1
-        elif 'STAGE 2' in value_upper or value_upper == '2':
+        elif 'STAGE 2' in value_upper:
             return Stage.STAGE_2
-        elif 'STAGE 3' in value_upper or value_upper == '3':
+        elif 'STAGE 3' in value_upper:
             return Stage.STAGE_3
 
         raise ValueError(f"Cannot parse stage from: {value}")
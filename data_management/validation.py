@@ -1,15 +1,35 @@
 """Data validation for portfolio items."""
 
+import logging
 from datetime import date
+from itertools import compress
 from decimal import Decimal
-from typing import List, Tuple, Optional
+from typing import Collection, Dict, Iterable, Iterator, List, Set, Tuple, Optional
+
+import numpy as np
 
 from models.portfolio_item import PortfolioItem
-from models.enums import Stage
-from utils.logger import get_logger
+from models.enums import Stage, STAGE_CODES
+from utils.jit import NUMBA_AVAILABLE
+from utils.logger import get_logger, is_enabled_for
+from data_management._kernels import _flag_invalid_kernel
 
 logger = get_logger(__name__)
 
+# Inclusive bounds shared by the per-item checks and the array-wide screen
+_MIN_CREDIT_SCORE, _MAX_CREDIT_SCORE = 300, 850
+_MIN_PD, _MAX_PD = 0, 1
+_MAX_INTEREST_RATE = 100
+_STAGE_3_DAYS_PAST_DUE = 90
+
+# Valid items per batch when streaming validation
+VALIDATION_BATCH_SIZE = 1000
+
+# Field values (and reference date) of items that passed validation, for
+# validate_item(use_cache=True); cleared when it reaches the size limit
+_VALID_ITEM_KEYS: Set[tuple] = set()
+VALIDATION_CACHE_SIZE = 1_000_000
+
 
 class ValidationError(Exception):
     """Exception raised for validation errors."""
@@ -23,13 +43,24 @@ class PortfolioValidator:
     def validate_item(
         cls,
         item: PortfolioItem,
-        raise_on_error: bool = True
+        raise_on_error: bool = True,
+        first_error_only: bool = False,
+        today: Optional[date] = None,
+        use_cache: bool = False
     ) -> Tuple[bool, List[str]]:
         """Validate a single portfolio item.
 
         Args:
             item: Portfolio item to validate
             raise_on_error: Whether to raise exception on validation failure
+            first_error_only: Whether to stop after the first group of checks
+                that reports errors, for callers that only need to know
+                whether the item is valid
+            today: Date that origination dates may not be after (defaults
+                to today; pass it in when validating many items)
+            use_cache: Whether to skip the checks for an item whose checked
+                fields match an item that already passed (for repeated
+                validation of the same portfolio; see ``clear_cache``)
 
         Returns:
             Tuple of (is_valid, list of error messages)
@@ -37,19 +68,30 @@ class PortfolioValidator:
         Raises:
             ValidationError: If validation fails and raise_on_error is True
         """
-        errors = []
+        if today is None:
+            today = date.today()
+
+        if use_cache:
+            key = cls._cache_key(item, today)
+            if key in _VALID_ITEM_KEYS:
+                return True, []
+
+        if first_error_only:
+            errors = cls._first_errors(item, today)
+        else:
+            errors = []
 
-        # Required field checks
-        errors.extend(cls._validate_required_fields(item))
+            # Required field checks
+            cls._validate_required_fields(item, errors)
 
-        # Data type and range checks
-        errors.extend(cls._validate_amounts(item))
-        errors.extend(cls._validate_dates(item))
-        errors.extend(cls._validate_credit_metrics(item))
-        errors.extend(cls._validate_performance_metrics(item))
+            # Data type and range checks
+            cls._validate_amounts(item, errors)
+            cls._validate_dates(item, today, errors)
+            cls._validate_credit_metrics(item, errors)
+            cls._validate_performance_metrics(item, errors)
 
-        # Business rule checks
-        errors.extend(cls._validate_business_rules(item))
+            # Business rule checks
+            cls._validate_business_rules(item, errors)
 
         is_valid = len(errors) == 0
 
@@ -57,8 +99,39 @@ class PortfolioValidator:
             error_msg = f"Validation failed for item {item.item_id}: " + "; ".join(errors)
             raise ValidationError(error_msg)
 
+        # Only valid verdicts are cached: error messages show the field values
+        # as given, which equal-comparing values (1.0 and 1.00) may not share
+        if use_cache and is_valid:
+            if len(_VALID_ITEM_KEYS) >= VALIDATION_CACHE_SIZE:
+                _VALID_ITEM_KEYS.clear()
+            _VALID_ITEM_KEYS.add(key)
+
         return is_valid, errors
 
+    @staticmethod
+    def clear_cache():
+        """Forget the items remembered by ``validate_item(use_cache=True)``."""
+        _VALID_ITEM_KEYS.clear()
+
+    @staticmethod
+    def _cache_key(item: PortfolioItem, today: date) -> tuple:
+        """Build the validation cache key: every field the checks read.
+
+        Args:
+            item: Portfolio item
+            today: Reference date of the validation
+
+        Returns:
+            Tuple of the checked field values and the reference date
+        """
+        return (
+            item.item_id, item.borrower_id, item.origination_date, item.maturity_date,
+            item.reporting_date, item.outstanding_amount, item.undrawn_commitment,
+            item.collateral_value, item.collateral_type, item.interest_rate, item.credit_score,
+            item.origination_pd, item.previous_pd, item.days_past_due, item.times_past_due_12m,
+            item.current_stage, item.is_forborne, item.is_restructured, today,
+        )
+
     @classmethod
     def validate_portfolio(
         cls,
@@ -77,37 +150,203 @@ class PortfolioValidator:
         Raises:
             ValidationError: If any validation fails and raise_on_error is True
         """
-        valid_count = 0
+        all_errors = list(cls._iter_invalid(items, raise_on_error))
+
+        invalid_count = len(all_errors)
+        valid_count = len(items) - invalid_count
+        cls._log_summary(valid_count, invalid_count)
+
+        return valid_count, invalid_count, all_errors
+
+    @classmethod
+    def validate_portfolio_compact(
+        cls,
+        items: List[PortfolioItem],
+        raise_on_error: bool = False
+    ) -> Tuple[int, int, Dict[str, str]]:
+        """Validate entire portfolio, reporting each item's errors as one string.
+
+        Args:
+            items: List of portfolio items
+            raise_on_error: Whether to raise exception on any validation failure
+
+        Returns:
+            Tuple of (valid_count, invalid_count, dict of item_id to "; "-joined
+            errors). Counts are per item, so an item_id listed more than once
+            keeps only its last errors in the dict.
+
+        Raises:
+            ValidationError: If any validation fails and raise_on_error is True
+        """
+        all_errors = {}
         invalid_count = 0
-        all_errors = []
 
-        for item in items:
-            is_valid, errors = cls.validate_item(item, raise_on_error=False)
+        for item_id, errors in cls._iter_invalid(items, raise_on_error):
+            all_errors[item_id] = "; ".join(errors)
+            invalid_count += 1
+
+        valid_count = len(items) - invalid_count
+        cls._log_summary(valid_count, invalid_count)
+
+        return valid_count, invalid_count, all_errors
+
+    @classmethod
+    def _iter_invalid(
+        cls,
+        items: Collection[PortfolioItem],
+        raise_on_error: bool
+    ) -> Iterator[Tuple[str, List[str]]]:
+        """Yield (item_id, errors) for each invalid item, in portfolio order."""
+        today = date.today()
 
-            if is_valid:
-                valid_count += 1
-            else:
-                invalid_count += 1
-                all_errors.append((item.item_id, errors))
+        # Only items the vectorized screen flags need the per-item checks
+        for item in compress(items, cls.flag_invalid(items, today)):
+            is_valid, errors = cls.validate_item(item, raise_on_error=False, today=today)
 
+            if not is_valid:
                 if raise_on_error:
                     error_msg = f"Validation failed for item {item.item_id}: " + "; ".join(errors)
                     raise ValidationError(error_msg)
 
-        logger.info(
-            "Portfolio validation complete",
-            valid=valid_count,
-            invalid=invalid_count,
-            total=len(items)
-        )
+                yield item.item_id, errors
 
-        return valid_count, invalid_count, all_errors
+    @staticmethod
+    def _log_summary(valid_count: int, invalid_count: int) -> None:
+        """Log portfolio validation counts."""
+        if is_enabled_for(logging.INFO):
+            logger.info(
+                "Portfolio validation complete",
+                valid=valid_count,
+                invalid=invalid_count,
+                total=valid_count + invalid_count
+            )
 
     @staticmethod
-    def _validate_required_fields(item: PortfolioItem) -> List[str]:
-        """Validate required fields are present."""
+    def flag_invalid(items: Collection[PortfolioItem], today: Optional[date] = None) -> np.ndarray:
+        """Flag items that may fail validation, using array-wide checks.
+
+        Applies every ``validate_item`` rule to columns extracted from the
+        items in a single pass, in a compiled parallel kernel when Numba is
+        installed and with NumPy array expressions otherwise.
+
+        The flags never miss an invalid item. Amounts are compared as
+        floats, so a negative zero amount may be flagged although valid,
+        and ``validate_item`` gives the final word.
+
+        Args:
+            items: Portfolio items
+            today: Date that origination dates may not be after (defaults
+                to today)
+
+        Returns:
+            Boolean array, True where an item may be invalid
+        """
+        if today is None:
+            today = date.today()
+
+        # One pass over the items, one row of fields per item
+        fields = np.fromiter(
+            (
+                (
+                    float(item.outstanding_amount),
+                    float(item.undrawn_commitment),
+                    float(item.collateral_value),
+                    item.interest_rate,
+                    item.credit_score,
+                    # Missing PDs are not checked, so stand in a valid value
+                    0.0 if item.origination_pd is None else item.origination_pd,
+                    0.0 if item.previous_pd is None else item.previous_pd,
+                    item.days_past_due,
+                    item.times_past_due_12m,
+                    item.origination_date.toordinal(),
+                    item.maturity_date.toordinal(),
+                    item.reporting_date.toordinal(),
+                    STAGE_CODES[item.current_stage],
+                    item.is_forborne or item.is_restructured,
+                    not (item.item_id and item.borrower_id),
+                    not item.collateral_type,
+                )
+                for item in items
+            ),
+            dtype=(np.float64, 16),
+            count=len(items)
+        )
+        stage_1, stage_3 = STAGE_CODES[Stage.STAGE_1], STAGE_CODES[Stage.STAGE_3]
+
+        if NUMBA_AVAILABLE:
+            return _flag_invalid_kernel(
+                fields, today.toordinal(), _MIN_CREDIT_SCORE, _MAX_CREDIT_SCORE, _MIN_PD, _MAX_PD,
+                _MAX_INTEREST_RATE, _STAGE_3_DAYS_PAST_DUE, stage_1, stage_3
+            )
+
+        (outstanding, undrawn, collateral, interest_rate, credit_score, origination_pd, previous_pd,
+         dpd, times_past_due, origination, maturity, reporting, stage,
+         forborne, missing_required, missing_collateral_type) = fields.T
+        forborne, missing_required, missing_collateral_type = (
+            forborne.astype(bool), missing_required.astype(bool), missing_collateral_type.astype(bool)
+        )
+
+        return np.logical_or.reduce([
+            missing_required,
+            # Amounts (signbit also flags negative zero, which is not an error)
+            np.signbit(outstanding),
+            np.signbit(undrawn),
+            np.signbit(collateral),
+            interest_rate < 0,
+            interest_rate > _MAX_INTEREST_RATE,
+            # Dates
+            origination >= maturity,
+            origination > today.toordinal(),
+            reporting < origination,
+            # Credit metrics (negated so NaN values are flagged)
+            ~((credit_score >= _MIN_CREDIT_SCORE) & (credit_score <= _MAX_CREDIT_SCORE)),
+            ~((origination_pd >= _MIN_PD) & (origination_pd <= _MAX_PD)),
+            ~((previous_pd >= _MIN_PD) & (previous_pd <= _MAX_PD)),
+            # Performance metrics
+            dpd < 0,
+            times_past_due < 0,
+            # Business rules
+            (dpd > _STAGE_3_DAYS_PAST_DUE) & (stage != stage_3),
+            forborne & (stage == stage_1),
+            (collateral > 0) & missing_collateral_type,
+            reporting > maturity,
+        ])
+
+    @classmethod
+    def _first_errors(cls, item: PortfolioItem, today: date) -> List[str]:
+        """Run the item checks in order, stopping at the first group with errors.
+
+        Args:
+            item: Portfolio item to validate
+            today: Date that origination dates may not be after
+
+        Returns:
+            Errors of the first failing group of checks (empty if valid)
+        """
         errors = []
 
+        cls._validate_required_fields(item, errors)
+        if errors:
+            return errors
+        cls._validate_amounts(item, errors)
+        if errors:
+            return errors
+        cls._validate_dates(item, today, errors)
+        if errors:
+            return errors
+        cls._validate_credit_metrics(item, errors)
+        if errors:
+            return errors
+        cls._validate_performance_metrics(item, errors)
+        if errors:
+            return errors
+        cls._validate_business_rules(item, errors)
+
+        return errors
+
+    @staticmethod
+    def _validate_required_fields(item: PortfolioItem, errors: List[str]) -> None:
+        """Validate required fields are present."""
         if not item.item_id:
             errors.append("item_id is required")
         if not item.borrower_id:
@@ -119,13 +358,9 @@ class PortfolioValidator:
         if item.outstanding_amount is None:
             errors.append("outstanding_amount is required")
 
-        return errors
-
     @staticmethod
-    def _validate_amounts(item: PortfolioItem) -> List[str]:
+    def _validate_amounts(item: PortfolioItem, errors: List[str]) -> None:
         """Validate amount fields."""
-        errors = []
-
         if item.outstanding_amount < 0:
             errors.append(f"outstanding_amount must be non-negative, got {item.outstanding_amount}")
 
@@ -135,22 +370,17 @@ class PortfolioValidator:
         if item.collateral_value < 0:
             errors.append(f"collateral_value must be non-negative, got {item.collateral_value}")
 
-        if item.interest_rate < 0:
-            errors.append(f"interest_rate must be non-negative, got {item.interest_rate}")
+        interest_rate = item.interest_rate
+        if interest_rate < 0:
+            errors.append(f"interest_rate must be non-negative, got {interest_rate}")
 
         # Check for unreasonably high values
-        if item.interest_rate > 100:
-            errors.append(f"interest_rate seems unreasonably high: {item.interest_rate}%")
-
-        return errors
+        if interest_rate > _MAX_INTEREST_RATE:
+            errors.append(f"interest_rate seems unreasonably high: {interest_rate}%")
 
     @staticmethod
-    def _validate_dates(item: PortfolioItem) -> List[str]:
+    def _validate_dates(item: PortfolioItem, today: date, errors: List[str]) -> None:
         """Validate date fields."""
-        errors = []
-
-        today = date.today()
-
         # Origination should be before maturity
         if item.origination_date >= item.maturity_date:
             errors.append(
@@ -169,48 +399,40 @@ class PortfolioValidator:
                 f"origination_date ({item.origination_date})"
             )
 
-        return errors
-
     @staticmethod
-    def _validate_credit_metrics(item: PortfolioItem) -> List[str]:
+    def _validate_credit_metrics(item: PortfolioItem, errors: List[str]) -> None:
         """Validate credit metrics."""
-        errors = []
-
         # Credit score range
-        if not (300 <= item.credit_score <= 850):
-            errors.append(f"credit_score must be between 300 and 850, got {item.credit_score}")
+        credit_score = item.credit_score
+        if not (_MIN_CREDIT_SCORE <= credit_score <= _MAX_CREDIT_SCORE):
+            errors.append(
+                f"credit_score must be between {_MIN_CREDIT_SCORE} and {_MAX_CREDIT_SCORE}, "
+                f"got {credit_score}"
+            )
 
         # PD ranges
-        if item.origination_pd is not None:
-            if not (0 <= item.origination_pd <= 1):
-                errors.append(f"origination_pd must be between 0 and 1, got {item.origination_pd}")
-
-        if item.previous_pd is not None:
-            if not (0 <= item.previous_pd <= 1):
-                errors.append(f"previous_pd must be between 0 and 1, got {item.previous_pd}")
+        origination_pd = item.origination_pd
+        if origination_pd is not None and not (_MIN_PD <= origination_pd <= _MAX_PD):
+            errors.append(f"origination_pd must be between {_MIN_PD} and {_MAX_PD}, got {origination_pd}")
 
-        return errors
+        previous_pd = item.previous_pd
+        if previous_pd is not None and not (_MIN_PD <= previous_pd <= _MAX_PD):
+            errors.append(f"previous_pd must be between {_MIN_PD} and {_MAX_PD}, got {previous_pd}")
 
     @staticmethod
-    def _validate_performance_metrics(item: PortfolioItem) -> List[str]:
+    def _validate_performance_metrics(item: PortfolioItem, errors: List[str]) -> None:
         """Validate performance metrics."""
-        errors = []
-
         if item.days_past_due < 0:
             errors.append(f"days_past_due must be non-negative, got {item.days_past_due}")
 
         if item.times_past_due_12m < 0:
             errors.append(f"times_past_due_12m must be non-negative, got {item.times_past_due_12m}")
 
-        return errors
-
     @staticmethod
-    def _validate_business_rules(item: PortfolioItem) -> List[str]:
+    def _validate_business_rules(item: PortfolioItem, errors: List[str]) -> None:
         """Validate business rules."""
-        errors = []
-
         # Stage consistency with days past due
-        if item.days_past_due > 90 and item.current_stage != Stage.STAGE_3:
+        if item.days_past_due > _STAGE_3_DAYS_PAST_DUE and item.current_stage != Stage.STAGE_3:
             errors.append(
                 f"Item with {item.days_past_due} days past due should be in Stage 3, "
                 f"but is in {item.current_stage}"
@@ -236,18 +458,76 @@ class PortfolioValidator:
                 f"maturity_date ({item.maturity_date})"
             )
 
-        return errors
+
+def iter_valid_items(
+    items: Iterable[PortfolioItem],
+    batch_size: int = VALIDATION_BATCH_SIZE,
+    invalid_items: Optional[List[Tuple[str, List[str]]]] = None,
+    remove_invalid: bool = True,
+    use_cache: bool = False
+) -> Iterator[List[PortfolioItem]]:
+    """Validate items lazily, yielding the valid ones in batches.
+
+    Downstream processing can start on each batch before the whole
+    portfolio is validated, and no full-size lists are built here.
+
+    Args:
+        items: Portfolio items (any iterable, read once)
+        batch_size: Maximum number of valid items per batch
+        invalid_items: Optional list that (item_id, errors) of each invalid
+            item is appended to
+        remove_invalid: If True, skip invalid items (listing only the first
+            failing group of checks); if False, raise on the first one
+        use_cache: Whether to skip items that already passed validation
+            (see ``PortfolioValidator.validate_item``)
+
+    Yields:
+        Lists of valid portfolio items, in input order
+
+    Raises:
+        ValidationError: If an invalid item is found and remove_invalid is False
+    """
+    validate_item = PortfolioValidator.validate_item
+    today = date.today()
+    batch = []
+
+    for item in items:
+        is_valid, errors = validate_item(
+            item, raise_on_error=False, first_error_only=remove_invalid, today=today, use_cache=use_cache
+        )
+
+        if is_valid:
+            batch.append(item)
+            if len(batch) == batch_size:
+                yield batch
+                batch = []
+        else:
+            if invalid_items is not None:
+                invalid_items.append((item.item_id, errors))
+
+            if not remove_invalid:
+                error_msg = f"Invalid item {item.item_id}: " + "; ".join(errors)
+                raise ValidationError(error_msg)
+
+    if batch:
+        yield batch
 
 
 def validate_and_filter_portfolio(
     items: List[PortfolioItem],
-    remove_invalid: bool = False
+    remove_invalid: bool = False,
+    use_cache: bool = False
 ) -> Tuple[List[PortfolioItem], List[Tuple[str, List[str]]]]:
     """Validate portfolio and optionally remove invalid items.
 
+    When invalid items are removed, each item's checks stop at the first
+    group that reports errors, so the errors listed for it may be partial.
+
     Args:
         items: List of portfolio items
         remove_invalid: If True, remove invalid items; if False, raise error
+        use_cache: Whether to skip items that already passed validation
+            (see ``PortfolioValidator.validate_item``)
 
     Returns:
         Tuple of (valid items, list of (item_id, errors) for invalid items)
@@ -255,24 +535,15 @@ def validate_and_filter_portfolio(
     Raises:
         ValidationError: If invalid items found and remove_invalid is False
     """
-    validator = PortfolioValidator()
-
     valid_items = []
     invalid_items = []
 
-    for item in items:
-        is_valid, errors = validator.validate_item(item, raise_on_error=False)
-
-        if is_valid:
-            valid_items.append(item)
-        else:
-            invalid_items.append((item.item_id, errors))
-
-            if not remove_invalid:
-                error_msg = f"Invalid item {item.item_id}: " + "; ".join(errors)
-                raise ValidationError(error_msg)
+    for batch in iter_valid_items(
+        items, invalid_items=invalid_items, remove_invalid=remove_invalid, use_cache=use_cache
+    ):
+        valid_items.extend(batch)
 
-    if invalid_items:
+    if invalid_items and is_enabled_for(logging.WARNING):
         logger.warning(
             "Invalid items found",
             invalid_count=len(invalid_items),
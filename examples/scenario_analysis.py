@@ -55,11 +55,10 @@ def main():
     # Calculate ECL for each scenario
     print("Calculating ECL under each scenario...")
     print("-" * 80)
-    scenario_results = {}
+    scenario_results = engine.calculate_portfolio_ecl_scenarios(items, scenarios)
 
     for scenario in scenarios:
-        result = engine.calculate_portfolio_ecl(items, scenario=scenario)
-        scenario_results[scenario.name] = result
+        result = scenario_results[scenario.name]
 
         print(f"\n{scenario.name.upper()} Scenario:")
         print(f"  Description:     {scenario.description}")
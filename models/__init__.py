@@ -2,6 +2,7 @@
 
 from .enums import Stage, ScenarioType, CalculationMethod
 from .portfolio_item import PortfolioItem
+from .portfolio_array import PortfolioArray
 from .scenario_config import ScenarioConfig
 from .calculation_results import ECLResult, PortfolioECLResult
 
@@ -10,6 +11,7 @@ __all__ = [
     'ScenarioType',
     'CalculationMethod',
     'PortfolioItem',
+    'PortfolioArray',
     'ScenarioConfig',
     'ECLResult',
     'PortfolioECLResult',
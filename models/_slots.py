@@ -0,0 +1,27 @@
+"""Slotted dataclass support for Python versions before 3.10."""
+
+from dataclasses import fields
+
+
+def with_slots(cls):
+    """Recreate a dataclass with ``__slots__`` for its fields.
+
+    Equivalent to ``dataclass(slots=True)``, which needs Python 3.10. Field
+    defaults live in the generated ``__init__``, so the class attributes
+    holding them can be dropped in favour of the slot descriptors. Fields
+    with ``init=False`` get no value from ``__init__`` and must be set in
+    ``__post_init__``.
+
+    Args:
+        cls: Dataclass whose bases define ``__slots__``
+
+    Returns:
+        New class without a per-instance ``__dict__``
+    """
+    field_names = tuple(f.name for f in fields(cls))
+    namespace = {
+        name: value for name, value in cls.__dict__.items()
+        if name not in field_names and name not in ('__dict__', '__weakref__')
+    }
+    namespace['__slots__'] = field_names
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
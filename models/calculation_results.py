@@ -1,14 +1,74 @@
 """ECL calculation result data models."""
 
+import math
 from dataclasses import dataclass, field
 from decimal import Decimal
-from typing import Optional, Dict, List
+from typing import ClassVar, Optional, Dict, List, Sequence, Tuple
 
-from .enums import Stage, ScenarioType
+import numpy as np
 
+from ._slots import with_slots
+from .enums import Stage, ScenarioType, STAGE_BY_VALUE, SCENARIO_TYPE_BY_VALUE, STAGE_CODES
+from .portfolio_array import encode_categories
 
+
+class _DecimalFields:
+    """Decimal access to float-valued monetary fields."""
+
+    __slots__ = ()
+
+    def as_decimal(self, field_name: str) -> Decimal:
+        """Get a monetary field as a Decimal for reporting.
+
+        The Decimal holds the shortest decimal representation of the stored
+        float, so an amount of 0.1 gives ``Decimal('0.1')``. This recovers
+        the stored value, not an exact calculation: the amounts are float64
+        results, so use ``Portfolio.total_exposure_decimal`` or
+        ``EADCalculator.calculate_current_ead`` where exact Decimal
+        arithmetic is required.
+
+        Args:
+            field_name: Name of the field (e.g. 'ecl_amount')
+
+        Returns:
+            Field value as a Decimal
+        """
+        return Decimal(str(getattr(self, field_name)))
+
+
+def _group_fsums(codes: np.ndarray, values: np.ndarray, group_count: int) -> List[float]:
+    """Sum values per integer group code, each sum correctly rounded.
+
+    Args:
+        codes: Group code (0 to ``group_count - 1``) of each value
+        values: Values to sum
+        group_count: Number of groups
+
+    Returns:
+        Total of each group, indexed by group code
+    """
+    # One mask per group: groups are few (stages, sectors, products, ratings)
+    return [math.fsum(values[codes == code]) for code in range(group_count)]
+
+
+def _group_sum(keys: Sequence[Optional[str]], values: np.ndarray) -> Dict[str, float]:
+    """Sum values by group key, in order of each key's first appearance.
+
+    Args:
+        keys: Group key for each value (values keyed None are left out)
+        values: Values to sum
+
+    Returns:
+        Dictionary of group key to total
+    """
+    codes, key_ids = encode_categories(keys, len(values))
+    totals = _group_fsums(codes, values, len(key_ids))
+    return {key: total for key, total in zip(key_ids, totals) if key is not None}
+
+
+@with_slots
 @dataclass
-class ECLResult:
+class ECLResult(_DecimalFields):
     """Result of ECL calculation for a single portfolio item.
 
     Contains all components of the ECL calculation including PD, LGD, EAD,
@@ -20,10 +80,10 @@ class ECLResult:
     # ECL components
     probability_of_default: float  # PD
     loss_given_default: float  # LGD (as percentage)
-    exposure_at_default: Decimal  # EAD
+    exposure_at_default: float  # EAD
 
     # ECL amounts
-    ecl_amount: Decimal  # Final ECL = PD × LGD × EAD
+    ecl_amount: float  # Final ECL = PD × LGD × EAD
 
     # Time horizon
     time_horizon_months: int  # 12 for Stage 1, lifetime for Stage 2/3
@@ -33,41 +93,52 @@ class ECLResult:
     scenario_type: Optional[ScenarioType] = None
 
     # Breakdown by time period (for lifetime ECL)
-    period_ecl: Optional[List[Decimal]] = None  # ECL by period
-    period_pd: Optional[List[float]] = None  # Marginal PD by period
+    period_ecl: Optional[np.ndarray] = field(default=None, compare=False)  # ECL by period (float64)
+    period_pd: Optional[np.ndarray] = field(default=None, compare=False)  # Marginal PD by period
 
     # Collateral impact
-    collateral_value: Decimal = Decimal('0')
-    unsecured_exposure: Decimal = Decimal('0')
+    collateral_value: float = 0.0
+    unsecured_exposure: float = 0.0
 
     # Additional metrics
     discount_rate: float = 0.0
-    present_value_ecl: Optional[Decimal] = None
+    present_value_ecl: Optional[float] = None
+
+    # Exported fields, in the order used by to_dict / to_record_tuple / to_columns
+    FIELDS: ClassVar[Tuple[str, ...]] = (
+        'item_id', 'stage', 'probability_of_default', 'loss_given_default',
+        'exposure_at_default', 'ecl_amount', 'ecl_rate', 'time_horizon_months',
+        'scenario_name', 'scenario_type', 'collateral_value', 'unsecured_exposure',
+        'discount_rate', 'present_value_ecl',
+    )
 
     def __post_init__(self):
         """Validate and convert types."""
-        if not isinstance(self.ecl_amount, Decimal):
-            self.ecl_amount = Decimal(str(self.ecl_amount))
-        if not isinstance(self.exposure_at_default, Decimal):
-            self.exposure_at_default = Decimal(str(self.exposure_at_default))
-        if not isinstance(self.collateral_value, Decimal):
-            self.collateral_value = Decimal(str(self.collateral_value))
-        if not isinstance(self.unsecured_exposure, Decimal):
-            self.unsecured_exposure = Decimal(str(self.unsecured_exposure))
+        # Amounts are stored as float (Decimal or int inputs are converted)
+        if type(self.ecl_amount) is not float:
+            self.ecl_amount = float(self.ecl_amount)
+        if type(self.exposure_at_default) is not float:
+            self.exposure_at_default = float(self.exposure_at_default)
+        if type(self.collateral_value) is not float:
+            self.collateral_value = float(self.collateral_value)
+        if type(self.unsecured_exposure) is not float:
+            self.unsecured_exposure = float(self.unsecured_exposure)
+        if self.present_value_ecl is not None and type(self.present_value_ecl) is not float:
+            self.present_value_ecl = float(self.present_value_ecl)
 
         # Convert stage string to enum
         if isinstance(self.stage, str):
-            self.stage = Stage(self.stage)
+            self.stage = STAGE_BY_VALUE.get(self.stage) or Stage(self.stage)
 
         # Convert scenario type string to enum
         if isinstance(self.scenario_type, str):
-            self.scenario_type = ScenarioType(self.scenario_type)
+            self.scenario_type = SCENARIO_TYPE_BY_VALUE.get(self.scenario_type) or ScenarioType(self.scenario_type)
 
     @property
     def ecl_rate(self) -> float:
         """ECL as percentage of exposure."""
         if self.exposure_at_default > 0:
-            return float(self.ecl_amount / self.exposure_at_default)
+            return self.ecl_amount / self.exposure_at_default
         return 0.0
 
     @property
@@ -77,44 +148,63 @@ class ECLResult:
 
     def to_dict(self) -> dict:
         """Convert to dictionary representation."""
-        return {
-            'item_id': self.item_id,
-            'stage': str(self.stage),
-            'probability_of_default': self.probability_of_default,
-            'loss_given_default': self.loss_given_default,
-            'exposure_at_default': float(self.exposure_at_default),
-            'ecl_amount': float(self.ecl_amount),
-            'ecl_rate': self.ecl_rate,
-            'time_horizon_months': self.time_horizon_months,
-            'scenario_name': self.scenario_name,
-            'scenario_type': str(self.scenario_type) if self.scenario_type else None,
-            'collateral_value': float(self.collateral_value),
-            'unsecured_exposure': float(self.unsecured_exposure),
-            'discount_rate': self.discount_rate,
-            'present_value_ecl': float(self.present_value_ecl) if self.present_value_ecl else None,
-        }
-
-
+        return dict(zip(self.FIELDS, self.to_record_tuple()))
+
+    def to_record_tuple(self) -> tuple:
+        """Convert to a tuple of exported values in ``FIELDS`` order."""
+        return (
+            self.item_id,
+            str(self.stage),
+            self.probability_of_default,
+            self.loss_given_default,
+            self.exposure_at_default,
+            self.ecl_amount,
+            self.ecl_rate,
+            self.time_horizon_months,
+            self.scenario_name,
+            str(self.scenario_type) if self.scenario_type else None,
+            self.collateral_value,
+            self.unsecured_exposure,
+            self.discount_rate,
+            self.present_value_ecl if self.present_value_ecl else None,
+        )
+
+    @classmethod
+    def to_columns(cls, results: Sequence['ECLResult']) -> Dict[str, list]:
+        """Convert results to column lists keyed and formatted like ``to_dict``.
+
+        Args:
+            results: ECL results
+
+        Returns:
+            Dictionary of column name to list of values
+        """
+        rows = [result.to_record_tuple() for result in results]
+        columns = zip(*rows) if rows else [()] * len(cls.FIELDS)
+        return {name: list(values) for name, values in zip(cls.FIELDS, columns)}
+
+
+@with_slots
 @dataclass
-class PortfolioECLResult:
+class PortfolioECLResult(_DecimalFields):
     """Aggregated ECL results for entire portfolio.
 
     Contains portfolio-level statistics and breakdowns by stage, sector,
     and other dimensions.
     """
     # Overall totals
-    total_ecl: Decimal
-    total_exposure: Decimal
+    total_ecl: float
+    total_exposure: float
     total_items: int
 
     # Breakdown by stage
-    stage_1_ecl: Decimal = Decimal('0')
-    stage_2_ecl: Decimal = Decimal('0')
-    stage_3_ecl: Decimal = Decimal('0')
+    stage_1_ecl: float = 0.0
+    stage_2_ecl: float = 0.0
+    stage_3_ecl: float = 0.0
 
-    stage_1_exposure: Decimal = Decimal('0')
-    stage_2_exposure: Decimal = Decimal('0')
-    stage_3_exposure: Decimal = Decimal('0')
+    stage_1_exposure: float = 0.0
+    stage_2_exposure: float = 0.0
+    stage_3_exposure: float = 0.0
 
     stage_1_count: int = 0
     stage_2_count: int = 0
@@ -124,9 +214,9 @@ class PortfolioECLResult:
     item_results: List[ECLResult] = field(default_factory=list)
 
     # Breakdown by other dimensions
-    ecl_by_sector: Dict[str, Decimal] = field(default_factory=dict)
-    ecl_by_product: Dict[str, Decimal] = field(default_factory=dict)
-    ecl_by_rating: Dict[str, Decimal] = field(default_factory=dict)
+    ecl_by_sector: Dict[str, float] = field(default_factory=dict)
+    ecl_by_product: Dict[str, float] = field(default_factory=dict)
+    ecl_by_rating: Dict[str, float] = field(default_factory=dict)
 
     # Scenario information
     scenario_name: Optional[str] = None
@@ -139,82 +229,139 @@ class PortfolioECLResult:
 
     def __post_init__(self):
         """Validate and convert types."""
-        if not isinstance(self.total_ecl, Decimal):
-            self.total_ecl = Decimal(str(self.total_ecl))
-        if not isinstance(self.total_exposure, Decimal):
-            self.total_exposure = Decimal(str(self.total_exposure))
-
-        for attr in ['stage_1_ecl', 'stage_2_ecl', 'stage_3_ecl',
+        # Amounts are stored as float (Decimal or int inputs are converted)
+        for attr in ['total_ecl', 'total_exposure',
+                     'stage_1_ecl', 'stage_2_ecl', 'stage_3_ecl',
                      'stage_1_exposure', 'stage_2_exposure', 'stage_3_exposure']:
             value = getattr(self, attr)
-            if not isinstance(value, Decimal):
-                setattr(self, attr, Decimal(str(value)))
+            if type(value) is not float:
+                setattr(self, attr, float(value))
+
+    @classmethod
+    def from_item_results(
+        cls,
+        item_results: List[ECLResult],
+        sectors: Sequence[str],
+        products: Sequence[str],
+        ratings: Optional[Sequence[Optional[str]]] = None,
+        **metadata
+    ) -> 'PortfolioECLResult':
+        """Aggregate item results into a portfolio result.
+
+        Monetary totals are correctly rounded (``math.fsum``) sums over the
+        result columns, per stage, sector, product and rating. Sector,
+        product and rating breakdowns list groups in order of first
+        appearance. The aggregation does not depend on the order of the
+        results, so callers need not sort them; ``item_results`` is kept in
+        the order given.
+
+        Args:
+            item_results: Individual ECL results
+            sectors: Sector of each result's item
+            products: Product type of each result's item
+            ratings: Internal rating of each result's item (unrated items
+                are left out of ``ecl_by_rating``)
+            **metadata: Scenario and calculation fields for the result
+
+        Returns:
+            Aggregated portfolio ECL result
+        """
+        n = len(item_results)
+
+        ecl = np.fromiter((r.ecl_amount for r in item_results), dtype=np.float64, count=n)
+        ead = np.fromiter((r.exposure_at_default for r in item_results), dtype=np.float64, count=n)
+        stage_codes = np.fromiter((STAGE_CODES[r.stage] for r in item_results), dtype=np.int32, count=n)
+
+        stage_ecl = _group_fsums(stage_codes, ecl, len(Stage))
+        stage_exposure = _group_fsums(stage_codes, ead, len(Stage))
+        stage_count = np.bincount(stage_codes, minlength=len(Stage)).tolist()
+        stage_1, stage_2, stage_3 = (STAGE_CODES[stage] for stage in Stage)
+
+        return cls(
+            total_ecl=math.fsum(ecl),
+            total_exposure=math.fsum(ead),
+            total_items=n,
+            stage_1_ecl=stage_ecl[stage_1],
+            stage_2_ecl=stage_ecl[stage_2],
+            stage_3_ecl=stage_ecl[stage_3],
+            stage_1_exposure=stage_exposure[stage_1],
+            stage_2_exposure=stage_exposure[stage_2],
+            stage_3_exposure=stage_exposure[stage_3],
+            stage_1_count=stage_count[stage_1],
+            stage_2_count=stage_count[stage_2],
+            stage_3_count=stage_count[stage_3],
+            item_results=item_results,
+            ecl_by_sector=_group_sum(sectors, ecl),
+            ecl_by_product=_group_sum(products, ecl),
+            ecl_by_rating=_group_sum(ratings, ecl) if ratings is not None else {},
+            **metadata
+        )
 
     @property
     def coverage_ratio(self) -> float:
         """Overall ECL coverage ratio."""
         if self.total_exposure > 0:
-            return float(self.total_ecl / self.total_exposure)
+            return self.total_ecl / self.total_exposure
         return 0.0
 
     @property
     def stage_1_coverage(self) -> float:
         """Stage 1 coverage ratio."""
         if self.stage_1_exposure > 0:
-            return float(self.stage_1_ecl / self.stage_1_exposure)
+            return self.stage_1_ecl / self.stage_1_exposure
         return 0.0
 
     @property
     def stage_2_coverage(self) -> float:
         """Stage 2 coverage ratio."""
         if self.stage_2_exposure > 0:
-            return float(self.stage_2_ecl / self.stage_2_exposure)
+            return self.stage_2_ecl / self.stage_2_exposure
         return 0.0
 
     @property
     def stage_3_coverage(self) -> float:
         """Stage 3 coverage ratio."""
         if self.stage_3_exposure > 0:
-            return float(self.stage_3_ecl / self.stage_3_exposure)
+            return self.stage_3_ecl / self.stage_3_exposure
         return 0.0
 
     @property
     def stage_2_ratio(self) -> float:
         """Stage 2 ratio (Stage 2 exposure / Total exposure)."""
         if self.total_exposure > 0:
-            return float(self.stage_2_exposure / self.total_exposure)
+            return self.stage_2_exposure / self.total_exposure
         return 0.0
 
     @property
     def stage_3_ratio(self) -> float:
         """Stage 3 ratio (Stage 3 exposure / Total exposure)."""
         if self.total_exposure > 0:
-            return float(self.stage_3_exposure / self.total_exposure)
+            return self.stage_3_exposure / self.total_exposure
         return 0.0
 
     def get_summary(self) -> dict:
         """Get summary statistics as dictionary."""
         return {
-            'total_ecl': float(self.total_ecl),
-            'total_exposure': float(self.total_exposure),
+            'total_ecl': self.total_ecl,
+            'total_exposure': self.total_exposure,
             'coverage_ratio': self.coverage_ratio,
             'total_items': self.total_items,
             'stage_1': {
-                'ecl': float(self.stage_1_ecl),
-                'exposure': float(self.stage_1_exposure),
+                'ecl': self.stage_1_ecl,
+                'exposure': self.stage_1_exposure,
                 'count': self.stage_1_count,
                 'coverage': self.stage_1_coverage,
             },
             'stage_2': {
-                'ecl': float(self.stage_2_ecl),
-                'exposure': float(self.stage_2_exposure),
+                'ecl': self.stage_2_ecl,
+                'exposure': self.stage_2_exposure,
                 'count': self.stage_2_count,
                 'coverage': self.stage_2_coverage,
                 'ratio': self.stage_2_ratio,
             },
             'stage_3': {
-                'ecl': float(self.stage_3_ecl),
-                'exposure': float(self.stage_3_exposure),
+                'ecl': self.stage_3_ecl,
+                'exposure': self.stage_3_exposure,
                 'count': self.stage_3_count,
                 'coverage': self.stage_3_coverage,
                 'ratio': self.stage_3_ratio,
@@ -227,7 +374,7 @@ class PortfolioECLResult:
         """Convert to dictionary representation."""
         return {
             **self.get_summary(),
-            'ecl_by_sector': {k: float(v) for k, v in self.ecl_by_sector.items()},
-            'ecl_by_product': {k: float(v) for k, v in self.ecl_by_product.items()},
-            'ecl_by_rating': {k: float(v) for k, v in self.ecl_by_rating.items()},
+            'ecl_by_sector': dict(self.ecl_by_sector),
+            'ecl_by_product': dict(self.ecl_by_product),
+            'ecl_by_rating': dict(self.ecl_by_rating),
         }
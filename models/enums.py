@@ -14,8 +14,10 @@ class Stage(str, Enum):
     STAGE_2 = "Stage 2"
     STAGE_3 = "Stage 3"
 
-    def __str__(self) -> str:
-        return self.value
+    # Members are their value as a str; use the C-level str methods instead
+    # of Enum's (Enum.__str__ would give "Stage.STAGE_1")
+    __str__ = str.__str__
+    __format__ = str.__format__
 
     @property
     def is_performing(self) -> bool:
@@ -33,6 +35,14 @@ class Stage(str, Enum):
         return self in (Stage.STAGE_2, Stage.STAGE_3)
 
 
+# Integer stage codes used by array-based (struct-of-arrays) calculations
+STAGE_CODES = {stage: code for code, stage in enumerate(Stage)}
+
+# Stages keyed by value; str-enum members hash and compare as their value,
+# so a member looks itself up too (a dict hit instead of Stage(value))
+STAGE_BY_VALUE = {stage.value: stage for stage in Stage}
+
+
 class ScenarioType(str, Enum):
     """Economic scenario types for forward-looking analysis."""
     BASE = "base"
@@ -41,8 +51,13 @@ class ScenarioType(str, Enum):
     STRESS = "stress"
     CUSTOM = "custom"
 
-    def __str__(self) -> str:
-        return self.value
+    # As for Stage, format as the plain value
+    __str__ = str.__str__
+    __format__ = str.__format__
+
+
+# Scenario types keyed by value (members look themselves up, as for stages)
+SCENARIO_TYPE_BY_VALUE = {scenario_type.value: scenario_type for scenario_type in ScenarioType}
 
 
 class CalculationMethod(str, Enum):
@@ -56,5 +71,6 @@ class CalculationMethod(str, Enum):
     COHORT = "cohort"
     VINTAGE = "vintage"
 
-    def __str__(self) -> str:
-        return self.value
+    # As for Stage, format as the plain value
+    __str__ = str.__str__
+    __format__ = str.__format__
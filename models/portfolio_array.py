@@ -0,0 +1,96 @@
+"""Struct-of-arrays view of portfolio items for vectorized calculations."""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .enums import STAGE_CODES
+from .portfolio_item import PortfolioItem
+
+
+def encode_categories(values: Iterable[Any], count: int) -> Tuple[np.ndarray, Dict[Any, int]]:
+    """Dictionary-encode category labels into integer ids.
+
+    Args:
+        values: Category label per item
+        count: Number of items
+
+    Returns:
+        Tuple of (int32 id per item, label -> id map in order of first appearance)
+    """
+    ids: Dict[Any, int] = {}
+    codes = np.fromiter((ids.setdefault(value, len(ids)) for value in values), np.int32, count)
+    return codes, ids
+
+
+@dataclass
+class PortfolioArray:
+    """Parallel NumPy columns of the portfolio item fields used in calculations.
+
+    Built once from a list of items so scenario, staging, ECL and
+    aggregation code can work on contiguous arrays instead of visiting
+    every item object. Stage codes are int32 throughout. Category
+    fields are dictionary-encoded: ``sector_code[i]`` indexes ``sectors``
+    and ``collateral_code[i]`` indexes ``collateral_types``.
+    """
+
+    item_id: np.ndarray  # object
+    outstanding: np.ndarray  # float64
+    undrawn: np.ndarray  # float64
+    collateral: np.ndarray  # float64
+    credit_score: np.ndarray  # float64
+    days_past_due: np.ndarray  # int64
+    times_past_due_12m: np.ndarray  # int64
+    is_forborne: np.ndarray  # bool
+    is_restructured: np.ndarray  # bool
+    stage_code: np.ndarray  # int32, see models.enums.STAGE_CODES
+    origination_pd: np.ndarray  # float64, NaN where unknown
+    sector_code: np.ndarray  # int32
+    collateral_code: np.ndarray  # int32
+    sectors: Tuple[str, ...] = ()
+    collateral_types: Tuple[Optional[str], ...] = ()
+
+    @classmethod
+    def from_items(cls, items: Sequence[PortfolioItem]) -> 'PortfolioArray':
+        """Build the columns from portfolio items.
+
+        Args:
+            items: Portfolio items
+
+        Returns:
+            PortfolioArray with one entry per item, in item order
+        """
+        n = len(items)
+        sector_code, sector_ids = encode_categories((item.sector for item in items), n)
+        collateral_code, collateral_ids = encode_categories((item.collateral_type for item in items), n)
+
+        return cls(
+            item_id=np.array([item.item_id for item in items], dtype=object),
+            outstanding=np.fromiter((item.outstanding_f for item in items), np.float64, n),
+            undrawn=np.fromiter((item.undrawn_f for item in items), np.float64, n),
+            collateral=np.fromiter((item.collateral_f for item in items), np.float64, n),
+            credit_score=np.fromiter((item.credit_score for item in items), np.float64, n),
+            days_past_due=np.fromiter((item.days_past_due for item in items), np.int64, n),
+            times_past_due_12m=np.fromiter((item.times_past_due_12m for item in items), np.int64, n),
+            is_forborne=np.fromiter((item.is_forborne for item in items), np.bool_, n),
+            is_restructured=np.fromiter((item.is_restructured for item in items), np.bool_, n),
+            stage_code=np.fromiter((STAGE_CODES[item.current_stage] for item in items), np.int32, n),
+            origination_pd=np.fromiter(
+                (np.nan if item.origination_pd is None else item.origination_pd for item in items),
+                np.float64, n
+            ),
+            sector_code=sector_code,
+            collateral_code=collateral_code,
+            sectors=tuple(sector_ids),
+            collateral_types=tuple(collateral_ids),
+        )
+
+    def __len__(self) -> int:
+        """Number of items."""
+        return len(self.item_id)
+
+    @property
+    def total_exposure(self) -> np.ndarray:
+        """Outstanding plus undrawn amount per item."""
+        return self.outstanding + self.undrawn
@@ -2,12 +2,19 @@
 
 from dataclasses import dataclass, field
 from datetime import date
-from typing import Optional
+from typing import ClassVar, Dict, Optional, Sequence, Tuple
 from decimal import Decimal
 
-from .enums import Stage
+from ._slots import with_slots
+from .enums import Stage, STAGE_BY_VALUE
 
 
+def _normalize_key(value: str) -> str:
+    """Normalize a type label to a config lookup key (e.g. 'Term Loan' -> 'term_loan')."""
+    return value.lower().replace(' ', '_')
+
+
+@with_slots
 @dataclass
 class PortfolioItem:
     """Represents a single credit exposure in the portfolio.
@@ -65,15 +72,42 @@ class PortfolioItem:
     country: str = "US"
     region: Optional[str] = None
 
+    # Exported fields, in the order used by to_dict / to_record_tuple / to_columns
+    FIELDS: ClassVar[Tuple[str, ...]] = (
+        'item_id', 'borrower_id', 'origination_date', 'maturity_date', 'reporting_date',
+        'outstanding_amount', 'undrawn_commitment', 'interest_rate', 'sector', 'product_type',
+        'currency', 'collateral_value', 'collateral_type', 'credit_score', 'internal_rating',
+        'external_rating', 'days_past_due', 'times_past_due_12m', 'is_forborne', 'is_restructured',
+        'current_stage', 'previous_stage', 'origination_stage', 'origination_pd', 'previous_pd',
+        'country', 'region',
+    )
+
+    # (label, normalized lookup key) pairs for product_type / collateral_type,
+    # filled on first access; the key is reused only while the field holds that label
+    _product_key: Optional[Tuple[str, str]] = field(init=False, repr=False, compare=False, default=None)
+    _collateral_key: Optional[Tuple[Optional[str], Optional[str]]] = field(
+        init=False, repr=False, compare=False, default=None
+    )
+
+    # (amount, float copy) pairs, filled on first access; the float is reused
+    # only while the field still holds that same Decimal
+    _outstanding_f: Optional[Tuple[Decimal, float]] = field(init=False, repr=False, compare=False, default=None)
+    _undrawn_f: Optional[Tuple[Decimal, float]] = field(init=False, repr=False, compare=False, default=None)
+    _collateral_f: Optional[Tuple[Decimal, float]] = field(init=False, repr=False, compare=False, default=None)
+
     def __post_init__(self):
         """Validate and convert types after initialization."""
-        # Convert to Decimal if needed
+        # Convert to Decimal if needed (ints exactly, others via their text
+        # so a float 0.1 gives Decimal('0.1'))
         if not isinstance(self.outstanding_amount, Decimal):
-            self.outstanding_amount = Decimal(str(self.outstanding_amount))
+            value = self.outstanding_amount
+            self.outstanding_amount = Decimal(value if type(value) is int else str(value))
         if not isinstance(self.undrawn_commitment, Decimal):
-            self.undrawn_commitment = Decimal(str(self.undrawn_commitment))
+            value = self.undrawn_commitment
+            self.undrawn_commitment = Decimal(value if type(value) is int else str(value))
         if not isinstance(self.collateral_value, Decimal):
-            self.collateral_value = Decimal(str(self.collateral_value))
+            value = self.collateral_value
+            self.collateral_value = Decimal(value if type(value) is int else str(value))
 
         # Convert to date if needed
         if isinstance(self.origination_date, str):
@@ -85,11 +119,58 @@ class PortfolioItem:
 
         # Convert stage strings to enum
         if isinstance(self.current_stage, str):
-            self.current_stage = Stage(self.current_stage)
+            self.current_stage = STAGE_BY_VALUE.get(self.current_stage) or Stage(self.current_stage)
         if isinstance(self.previous_stage, str):
-            self.previous_stage = Stage(self.previous_stage)
+            self.previous_stage = STAGE_BY_VALUE.get(self.previous_stage) or Stage(self.previous_stage)
         if isinstance(self.origination_stage, str):
-            self.origination_stage = Stage(self.origination_stage)
+            self.origination_stage = STAGE_BY_VALUE.get(self.origination_stage) or Stage(self.origination_stage)
+
+        # Slots have no class-level defaults, so fields left out of __init__ are set here
+        self._product_key = self._collateral_key = None
+        self._outstanding_f = self._undrawn_f = self._collateral_f = None
+
+    @property
+    def product_key(self) -> str:
+        """Normalized product type used for CCF lookups (e.g. 'term_loan')."""
+        cached = self._product_key
+        if cached is None or cached[0] is not self.product_type:
+            cached = self._product_key = (self.product_type, _normalize_key(self.product_type))
+        return cached[1]
+
+    @property
+    def collateral_key(self) -> Optional[str]:
+        """Normalized collateral type used for haircut lookups (None without collateral type)."""
+        cached = self._collateral_key
+        if cached is None or cached[0] is not self.collateral_type:
+            collateral_type = self.collateral_type
+            cached = self._collateral_key = (
+                collateral_type, _normalize_key(collateral_type) if collateral_type else None
+            )
+        return cached[1]
+
+    @property
+    def outstanding_f(self) -> float:
+        """Outstanding amount as float (cached until the amount is reassigned)."""
+        cached = self._outstanding_f
+        if cached is None or cached[0] is not self.outstanding_amount:
+            cached = self._outstanding_f = (self.outstanding_amount, float(self.outstanding_amount))
+        return cached[1]
+
+    @property
+    def undrawn_f(self) -> float:
+        """Undrawn commitment as float (cached until the amount is reassigned)."""
+        cached = self._undrawn_f
+        if cached is None or cached[0] is not self.undrawn_commitment:
+            cached = self._undrawn_f = (self.undrawn_commitment, float(self.undrawn_commitment))
+        return cached[1]
+
+    @property
+    def collateral_f(self) -> float:
+        """Collateral value as float (cached until the amount is reassigned)."""
+        cached = self._collateral_f
+        if cached is None or cached[0] is not self.collateral_value:
+            cached = self._collateral_f = (self.collateral_value, float(self.collateral_value))
+        return cached[1]
 
     @property
     def total_exposure(self) -> Decimal:
@@ -129,32 +210,53 @@ class PortfolioItem:
 
     def to_dict(self) -> dict:
         """Convert to dictionary representation."""
-        return {
-            'item_id': self.item_id,
-            'borrower_id': self.borrower_id,
-            'origination_date': self.origination_date.isoformat(),
-            'maturity_date': self.maturity_date.isoformat(),
-            'reporting_date': self.reporting_date.isoformat(),
-            'outstanding_amount': float(self.outstanding_amount),
-            'undrawn_commitment': float(self.undrawn_commitment),
-            'interest_rate': self.interest_rate,
-            'sector': self.sector,
-            'product_type': self.product_type,
-            'currency': self.currency,
-            'collateral_value': float(self.collateral_value),
-            'collateral_type': self.collateral_type,
-            'credit_score': self.credit_score,
-            'internal_rating': self.internal_rating,
-            'external_rating': self.external_rating,
-            'days_past_due': self.days_past_due,
-            'times_past_due_12m': self.times_past_due_12m,
-            'is_forborne': self.is_forborne,
-            'is_restructured': self.is_restructured,
-            'current_stage': str(self.current_stage),
-            'previous_stage': str(self.previous_stage) if self.previous_stage else None,
-            'origination_stage': str(self.origination_stage),
-            'origination_pd': self.origination_pd,
-            'previous_pd': self.previous_pd,
-            'country': self.country,
-            'region': self.region,
-        }
+        return dict(zip(self.FIELDS, self.to_record_tuple()))
+
+    def to_record_tuple(self) -> tuple:
+        """Convert to a tuple of exported values in ``FIELDS`` order."""
+        return (
+            self.item_id,
+            self.borrower_id,
+            self.origination_date.isoformat(),
+            self.maturity_date.isoformat(),
+            self.reporting_date.isoformat(),
+            float(self.outstanding_amount),
+            float(self.undrawn_commitment),
+            self.interest_rate,
+            self.sector,
+            self.product_type,
+            self.currency,
+            float(self.collateral_value),
+            self.collateral_type,
+            self.credit_score,
+            self.internal_rating,
+            self.external_rating,
+            self.days_past_due,
+            self.times_past_due_12m,
+            self.is_forborne,
+            self.is_restructured,
+            str(self.current_stage),
+            str(self.previous_stage) if self.previous_stage else None,
+            str(self.origination_stage),
+            self.origination_pd,
+            self.previous_pd,
+            self.country,
+            self.region,
+        )
+
+    @classmethod
+    def to_columns(cls, items: Sequence['PortfolioItem']) -> Dict[str, list]:
+        """Convert items to column lists keyed and formatted like ``to_dict``.
+
+        Builds one list per field rather than one dictionary per item, so a
+        DataFrame can be created without hashing every key of every row.
+
+        Args:
+            items: Portfolio items
+
+        Returns:
+            Dictionary of column name to list of values
+        """
+        rows = [item.to_record_tuple() for item in items]
+        columns = zip(*rows) if rows else [()] * len(cls.FIELDS)
+        return {name: list(values) for name, values in zip(cls.FIELDS, columns)}
@@ -1,14 +1,52 @@
 """Forward-looking adjustments to PD and LGD based on macroeconomic scenarios."""
 
-from typing import Dict, Optional
+import logging
+from typing import Dict, Optional, Tuple
 
+import numpy as np
+
+from models.portfolio_array import PortfolioArray
 from models.portfolio_item import PortfolioItem
 from scenarios.macroeconomic_model import MacroeconomicModel
+from scenarios._kernels import _apply_scenario_kernel
 from utils.config import get_config
-from utils.logger import get_logger
+from utils.jit import NUMBA_AVAILABLE
+from utils.logger import get_logger, is_enabled_for
 
 logger = get_logger(__name__)
 
+# Sector sensitivity to economic cycles (PD multiplier, 1.0 = average)
+_SECTOR_SENSITIVITIES = {
+    'Construction': 1.5,
+    'Hospitality': 1.4,
+    'Retail': 1.3,
+    'Transportation': 1.2,
+    'Manufacturing': 1.1,
+    'Energy': 1.1,
+    'Real Estate': 1.0,
+    'Technology': 0.9,
+    'Healthcare': 0.8,
+    'Financial Services': 1.0,
+    'Utilities': 0.7,
+}
+
+# Collateral sensitivity to economic stress (LGD multiplier, keyed by normalized type)
+_COLLATERAL_SENSITIVITIES = {
+    'real_estate': 1.3,  # Highly sensitive to house prices
+    'inventory': 1.4,  # Sensitive to demand
+    'equipment': 1.1,
+    'receivables': 1.2,
+    'securities': 1.5,  # Highly sensitive to markets
+    'cash': 0.0,  # Not sensitive
+}
+
+# Scenario factors memoized per adjuster; each cache is emptied when it
+# reaches this many macro model versions
+FACTOR_CACHE_SIZE = 64
+
+_PD_FLOOR, _PD_CEILING = 0.0001, 0.99
+_LGD_FLOOR, _LGD_CEILING = 0.01, 1.0
+
 
 class ForwardLookingAdjustment:
     """Apply forward-looking adjustments to PD and LGD based on macro scenarios.
@@ -38,6 +76,22 @@ class ForwardLookingAdjustment:
             'unemployment_rate': 0.08,  # 1% unemployment increase raises LGD by 8%
         })
 
+        # Scenario-level factors, memoized per macro model version (bounded
+        # by FACTOR_CACHE_SIZE)
+        self._pd_factor_cache: Dict[int, float] = {}
+        self._lgd_factor_cache: Dict[int, float] = {}
+        self._ead_stress_cache: Dict[int, float] = {}
+
+        # Sensitivity lookup tables indexed by code, with the 1.0 default at code 0
+        self._sector_codes: Dict[str, int] = {
+            sector: code for code, sector in enumerate(_SECTOR_SENSITIVITIES, start=1)
+        }
+        self._sector_mult_table = np.array([1.0, *_SECTOR_SENSITIVITIES.values()], dtype=np.float64)
+        self._collateral_codes: Dict[str, int] = {
+            collateral_type: code for code, collateral_type in enumerate(_COLLATERAL_SENSITIVITIES, start=1)
+        }
+        self._collateral_mult_table = np.array([1.0, *_COLLATERAL_SENSITIVITIES.values()], dtype=np.float64)
+
         logger.info(
             "Forward-looking adjustment initialized",
             pd_elasticities=self.pd_elasticities,
@@ -62,31 +116,7 @@ class ForwardLookingAdjustment:
         Returns:
             Adjusted PD
         """
-        # Get macro changes from baseline
-        macro_changes = macro_model.get_changes_from_baseline()
-
-        # Calculate adjustment factor
-        adjustment_factor = 0.0
-
-        for variable, elasticity in self.pd_elasticities.items():
-            if variable in macro_changes:
-                change = macro_changes[variable]
-
-                # Normalize certain variables
-                if variable == 'credit_spreads':
-                    # Credit spreads in bps, normalize to percentage points
-                    change = change / 100.0
-
-                contribution = elasticity * change
-                adjustment_factor += contribution
-
-                logger.debug(
-                    "PD adjustment contribution",
-                    variable=variable,
-                    change=change,
-                    elasticity=elasticity,
-                    contribution=contribution
-                )
+        adjustment_factor = self._pd_adjustment_factor(macro_model)
 
         # Apply sector-specific multiplier if available
         sector_multiplier = 1.0
@@ -97,15 +127,16 @@ class ForwardLookingAdjustment:
         adjusted_pd = base_pd * (1 + adjustment_factor * sector_multiplier)
 
         # Apply bounds (PD should be between 0 and 1)
-        adjusted_pd = max(0.0001, min(0.99, adjusted_pd))
-
-        logger.debug(
-            "PD adjusted",
-            base_pd=base_pd,
-            adjustment_factor=adjustment_factor,
-            sector_multiplier=sector_multiplier,
-            adjusted_pd=adjusted_pd
-        )
+        adjusted_pd = max(_PD_FLOOR, min(_PD_CEILING, adjusted_pd))
+
+        if is_enabled_for(logging.DEBUG):
+            logger.debug(
+                "PD adjusted",
+                base_pd=base_pd,
+                adjustment_factor=adjustment_factor,
+                sector_multiplier=sector_multiplier,
+                adjusted_pd=adjusted_pd
+            )
 
         return adjusted_pd
 
@@ -127,31 +158,7 @@ class ForwardLookingAdjustment:
         Returns:
             Adjusted LGD
         """
-        # Get macro changes from baseline
-        macro_changes = macro_model.get_changes_from_baseline()
-
-        # Calculate adjustment factor
-        adjustment_factor = 0.0
-
-        for variable, elasticity in self.lgd_elasticities.items():
-            if variable in macro_changes:
-                change = macro_changes[variable]
-
-                # Normalize certain variables
-                if variable == 'house_price_index':
-                    # House price index change is in percentage points
-                    change = change / 100.0
-
-                contribution = elasticity * change
-                adjustment_factor += contribution
-
-                logger.debug(
-                    "LGD adjustment contribution",
-                    variable=variable,
-                    change=change,
-                    elasticity=elasticity,
-                    contribution=contribution
-                )
+        adjustment_factor = self._lgd_adjustment_factor(macro_model)
 
         # Apply collateral-specific multiplier if available
         collateral_multiplier = 1.0
@@ -162,18 +169,146 @@ class ForwardLookingAdjustment:
         adjusted_lgd = base_lgd * (1 + adjustment_factor * collateral_multiplier)
 
         # Apply bounds (LGD should be between 0 and 1)
-        adjusted_lgd = max(0.01, min(1.0, adjusted_lgd))
-
-        logger.debug(
-            "LGD adjusted",
-            base_lgd=base_lgd,
-            adjustment_factor=adjustment_factor,
-            collateral_multiplier=collateral_multiplier,
-            adjusted_lgd=adjusted_lgd
-        )
+        adjusted_lgd = max(_LGD_FLOOR, min(_LGD_CEILING, adjusted_lgd))
+
+        if is_enabled_for(logging.DEBUG):
+            logger.debug(
+                "LGD adjusted",
+                base_lgd=base_lgd,
+                adjustment_factor=adjustment_factor,
+                collateral_multiplier=collateral_multiplier,
+                adjusted_lgd=adjusted_lgd
+            )
 
         return adjusted_lgd
 
+    def adjust_pd_batch(
+        self,
+        base_pd: np.ndarray,
+        macro_model: MacroeconomicModel,
+        portfolio: Optional[PortfolioArray] = None
+    ) -> np.ndarray:
+        """Adjust many PDs at once based on macroeconomic changes.
+
+        Vectorized equivalent of ``adjust_pd``: the adjustment factor is
+        computed once for the scenario and applied to every PD.
+
+        Args:
+            base_pd: Base probabilities of default
+            macro_model: Macroeconomic model with current scenario
+            portfolio: Optional portfolio columns (aligned with ``base_pd``)
+                for sector-specific adjustments
+
+        Returns:
+            Array of adjusted PDs
+        """
+        adjustment_factor = self._pd_adjustment_factor(macro_model)
+
+        if portfolio is None:
+            adjusted_pd = base_pd * (1 + adjustment_factor)
+        else:
+            adjusted_pd = base_pd * (1 + adjustment_factor * self._sector_multipliers(portfolio))
+
+        # Apply bounds in place
+        return np.clip(adjusted_pd, _PD_FLOOR, _PD_CEILING, out=adjusted_pd)
+
+    def adjust_lgd_batch(
+        self,
+        base_lgd: np.ndarray,
+        macro_model: MacroeconomicModel,
+        portfolio: Optional[PortfolioArray] = None
+    ) -> np.ndarray:
+        """Adjust many LGDs at once based on macroeconomic changes.
+
+        Vectorized equivalent of ``adjust_lgd``: the adjustment factor is
+        computed once for the scenario and applied to every LGD.
+
+        Args:
+            base_lgd: Base losses given default
+            macro_model: Macroeconomic model with current scenario
+            portfolio: Optional portfolio columns (aligned with ``base_lgd``)
+                for collateral-specific adjustments
+
+        Returns:
+            Array of adjusted LGDs
+        """
+        adjustment_factor = self._lgd_adjustment_factor(macro_model)
+
+        if portfolio is None:
+            adjusted_lgd = base_lgd * (1 + adjustment_factor)
+        else:
+            adjusted_lgd = base_lgd * (1 + adjustment_factor * self._collateral_multipliers(portfolio))
+
+        # Apply bounds in place
+        return np.clip(adjusted_lgd, _LGD_FLOOR, _LGD_CEILING, out=adjusted_lgd)
+
+    def adjust_ead_batch(
+        self,
+        base_ead: np.ndarray,
+        macro_model: MacroeconomicModel,
+        ccf_adjustment: float = 0.0
+    ) -> np.ndarray:
+        """Adjust many EADs at once based on macroeconomic scenario.
+
+        Vectorized equivalent of ``adjust_ead``.
+
+        Args:
+            base_ead: Base exposures at default
+            macro_model: Macroeconomic model with current scenario
+            ccf_adjustment: Additional CCF adjustment in stress
+
+        Returns:
+            Array of adjusted EADs
+        """
+        return base_ead * (1.0 + self._ead_stress_factor(macro_model) + ccf_adjustment)
+
+    def adjust_portfolio(
+        self,
+        base_pd: np.ndarray,
+        base_lgd: np.ndarray,
+        base_ead: np.ndarray,
+        macro_model: MacroeconomicModel,
+        portfolio: PortfolioArray,
+        ccf_adjustment: float = 0.0
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Adjust PD, LGD and EAD of every item for one scenario.
+
+        Equivalent to ``adjust_pd_batch``, ``adjust_lgd_batch`` and
+        ``adjust_ead_batch`` with sector and collateral adjustments, but
+        uses a single compiled pass over the items when Numba is installed.
+
+        Args:
+            base_pd: Base probabilities of default
+            base_lgd: Base losses given default
+            base_ead: Base exposures at default
+            macro_model: Macroeconomic model with current scenario
+            portfolio: Portfolio columns aligned with the base arrays
+            ccf_adjustment: Additional CCF adjustment in stress
+
+        Returns:
+            Tuple of (adjusted PDs, adjusted LGDs, adjusted EADs)
+        """
+        if not NUMBA_AVAILABLE:
+            return (
+                self.adjust_pd_batch(base_pd, macro_model, portfolio),
+                self.adjust_lgd_batch(base_lgd, macro_model, portfolio),
+                self.adjust_ead_batch(base_ead, macro_model, ccf_adjustment),
+            )
+
+        return _apply_scenario_kernel(
+            np.ascontiguousarray(base_pd, dtype=np.float64),
+            np.ascontiguousarray(base_lgd, dtype=np.float64),
+            np.ascontiguousarray(base_ead, dtype=np.float64),
+            portfolio.sector_code,
+            portfolio.collateral_code,
+            self._sector_table(portfolio),
+            self._collateral_table(portfolio),
+            self._pd_adjustment_factor(macro_model),
+            self._lgd_adjustment_factor(macro_model),
+            1.0 + self._ead_stress_factor(macro_model) + ccf_adjustment,
+            _PD_FLOOR, _PD_CEILING, _LGD_FLOOR, _LGD_CEILING
+        )
+
     def adjust_ead(
         self,
         base_ead: float,
@@ -192,10 +327,121 @@ class ForwardLookingAdjustment:
         Returns:
             Adjusted EAD
         """
-        # Get macro changes
+        stress_factor = self._ead_stress_factor(macro_model)
+
+        # Apply adjustment
+        adjustment_factor = 1.0 + stress_factor + ccf_adjustment
+        adjusted_ead = base_ead * adjustment_factor
+
+        if is_enabled_for(logging.DEBUG):
+            logger.debug(
+                "EAD adjusted",
+                base_ead=base_ead,
+                stress_factor=stress_factor,
+                ccf_adjustment=ccf_adjustment,
+                adjusted_ead=adjusted_ead
+            )
+
+        return adjusted_ead
+
+    def _pd_adjustment_factor(self, macro_model: MacroeconomicModel) -> float:
+        """Calculate the PD adjustment factor Σ(elasticity × macro_change).
+
+        The factor does not depend on the item, so it is memoized per macro
+        model version.
+
+        Args:
+            macro_model: Macroeconomic model with current scenario
+
+        Returns:
+            Adjustment factor (0.0 = no change from baseline)
+        """
+        adjustment_factor = self._pd_factor_cache.get(macro_model.version)
+        if adjustment_factor is not None:
+            return adjustment_factor
+
+        macro_changes = macro_model.get_changes_from_baseline()
+        adjustment_factor = 0.0
+
+        for variable, elasticity in self.pd_elasticities.items():
+            if variable in macro_changes:
+                change = macro_changes[variable]
+
+                # Normalize certain variables
+                if variable == 'credit_spreads':
+                    # Credit spreads in bps, normalize to percentage points
+                    change = change / 100.0
+
+                contribution = elasticity * change
+                adjustment_factor += contribution
+
+                if is_enabled_for(logging.DEBUG):
+                    logger.debug(
+                        "PD adjustment contribution",
+                        variable=variable,
+                        change=change,
+                        elasticity=elasticity,
+                        contribution=contribution
+                    )
+
+        return self._remember(self._pd_factor_cache, macro_model.version, adjustment_factor)
+
+    def _lgd_adjustment_factor(self, macro_model: MacroeconomicModel) -> float:
+        """Calculate the LGD adjustment factor Σ(elasticity × macro_change).
+
+        The factor does not depend on the item, so it is memoized per macro
+        model version.
+
+        Args:
+            macro_model: Macroeconomic model with current scenario
+
+        Returns:
+            Adjustment factor (0.0 = no change from baseline)
+        """
+        adjustment_factor = self._lgd_factor_cache.get(macro_model.version)
+        if adjustment_factor is not None:
+            return adjustment_factor
+
         macro_changes = macro_model.get_changes_from_baseline()
+        adjustment_factor = 0.0
+
+        for variable, elasticity in self.lgd_elasticities.items():
+            if variable in macro_changes:
+                change = macro_changes[variable]
+
+                # Normalize certain variables
+                if variable == 'house_price_index':
+                    # House price index change is in percentage points
+                    change = change / 100.0
 
-        # Calculate stress factor based on GDP and unemployment
+                contribution = elasticity * change
+                adjustment_factor += contribution
+
+                if is_enabled_for(logging.DEBUG):
+                    logger.debug(
+                        "LGD adjustment contribution",
+                        variable=variable,
+                        change=change,
+                        elasticity=elasticity,
+                        contribution=contribution
+                    )
+
+        return self._remember(self._lgd_factor_cache, macro_model.version, adjustment_factor)
+
+    def _ead_stress_factor(self, macro_model: MacroeconomicModel) -> float:
+        """Calculate the EAD stress factor from GDP and unemployment changes.
+
+        Args:
+            macro_model: Macroeconomic model with current scenario
+
+        Returns:
+            Stress factor (0.0 = no additional drawdown)
+        """
+        stress_factor = self._ead_stress_cache.get(macro_model.version)
+        if stress_factor is not None:
+            return stress_factor
+
+        macro_changes = macro_model.get_changes_from_baseline()
         stress_factor = 0.0
 
         if 'gdp_growth' in macro_changes:
@@ -210,19 +456,110 @@ class ForwardLookingAdjustment:
             if unemp_change > 0:
                 stress_factor += unemp_change * 0.015  # 1.5% per percentage point increase
 
-        # Apply adjustment
-        adjustment_factor = 1.0 + stress_factor + ccf_adjustment
-        adjusted_ead = base_ead * adjustment_factor
+        return self._remember(self._ead_stress_cache, macro_model.version, stress_factor)
 
-        logger.debug(
-            "EAD adjusted",
-            base_ead=base_ead,
-            stress_factor=stress_factor,
-            ccf_adjustment=ccf_adjustment,
-            adjusted_ead=adjusted_ead
-        )
+    @staticmethod
+    def _remember(cache: Dict[int, float], version: int, factor: float) -> float:
+        """Memoize a factor, emptying the cache when it reaches its size limit.
 
-        return adjusted_ead
+        Args:
+            cache: Factor cache keyed by macro model version
+            version: Macro model version the factor was calculated for
+            factor: Calculated factor
+
+        Returns:
+            The factor
+        """
+        if len(cache) >= FACTOR_CACHE_SIZE:
+            cache.clear()
+        cache[version] = factor
+        return factor
+
+    def clear_cache(self):
+        """Forget memoized scenario factors.
+
+        Factors are keyed by macro model version, so changes made through
+        the model's methods are picked up without this. Edits made directly
+        to a model's ``current_values`` or ``baseline_values`` dicts do not
+        change its version; call this after such edits, or after changing
+        the elasticities.
+        """
+        self._pd_factor_cache.clear()
+        self._lgd_factor_cache.clear()
+        self._ead_stress_cache.clear()
+
+    def encode_sector(self, sector: Optional[str]) -> int:
+        """Get the sensitivity table code of a sector.
+
+        Args:
+            sector: Sector name
+
+        Returns:
+            Index into the sector sensitivity table (0 for unlisted sectors)
+        """
+        return self._sector_codes.get(sector, 0)
+
+    def encode_collateral(self, collateral_type: Optional[str]) -> int:
+        """Get the sensitivity table code of a collateral type.
+
+        Args:
+            collateral_type: Collateral type, in any case and with spaces or underscores
+
+        Returns:
+            Index into the collateral sensitivity table (0 for missing or unlisted types)
+        """
+        if not collateral_type:
+            return 0
+        return self._collateral_codes.get(collateral_type.lower().replace(' ', '_'), 0)
+
+    def _sector_table(self, portfolio: PortfolioArray) -> np.ndarray:
+        """Get the sector sensitivity multiplier of each sector code.
+
+        Args:
+            portfolio: Portfolio columns
+
+        Returns:
+            Array of PD sensitivity multipliers indexed by ``sector_code``
+        """
+        codes = np.array([self.encode_sector(sector) for sector in portfolio.sectors], dtype=np.intp)
+        return self._sector_mult_table[codes]
+
+    def _collateral_table(self, portfolio: PortfolioArray) -> np.ndarray:
+        """Get the collateral sensitivity multiplier of each collateral code.
+
+        Args:
+            portfolio: Portfolio columns
+
+        Returns:
+            Array of LGD sensitivity multipliers indexed by ``collateral_code``
+            (1.0 without collateral type)
+        """
+        codes = np.array([
+            self.encode_collateral(collateral_type) for collateral_type in portfolio.collateral_types
+        ], dtype=np.intp)
+        return self._collateral_mult_table[codes]
+
+    def _sector_multipliers(self, portfolio: PortfolioArray) -> np.ndarray:
+        """Get the sector sensitivity multiplier of each item.
+
+        Args:
+            portfolio: Portfolio columns
+
+        Returns:
+            Array of PD sensitivity multipliers
+        """
+        return self._sector_table(portfolio)[portfolio.sector_code]
+
+    def _collateral_multipliers(self, portfolio: PortfolioArray) -> np.ndarray:
+        """Get the collateral sensitivity multiplier of each item.
+
+        Args:
+            portfolio: Portfolio columns
+
+        Returns:
+            Array of LGD sensitivity multipliers (1.0 without collateral type)
+        """
+        return self._collateral_table(portfolio)[portfolio.collateral_code]
 
     def _get_sector_sensitivity(self, sector: str) -> float:
         """Get sector-specific sensitivity multiplier for PD adjustments.
@@ -233,22 +570,7 @@ class ForwardLookingAdjustment:
         Returns:
             Sensitivity multiplier (1.0 = average, >1.0 = more sensitive)
         """
-        # Sector sensitivity to economic cycles
-        sector_sensitivities = {
-            'Construction': 1.5,
-            'Hospitality': 1.4,
-            'Retail': 1.3,
-            'Transportation': 1.2,
-            'Manufacturing': 1.1,
-            'Energy': 1.1,
-            'Real Estate': 1.0,
-            'Technology': 0.9,
-            'Healthcare': 0.8,
-            'Financial Services': 1.0,
-            'Utilities': 0.7,
-        }
-
-        return sector_sensitivities.get(sector, 1.0)
+        return _SECTOR_SENSITIVITIES.get(sector, 1.0)
 
     def _get_collateral_sensitivity(self, collateral_type: str) -> float:
         """Get collateral-specific sensitivity multiplier for LGD adjustments.
@@ -259,18 +581,8 @@ class ForwardLookingAdjustment:
         Returns:
             Sensitivity multiplier (1.0 = average, >1.0 = more sensitive)
         """
-        # Collateral sensitivity to economic stress
-        collateral_sensitivities = {
-            'real_estate': 1.3,  # Highly sensitive to house prices
-            'inventory': 1.4,  # Sensitive to demand
-            'equipment': 1.1,
-            'receivables': 1.2,
-            'securities': 1.5,  # Highly sensitive to markets
-            'cash': 0.0,  # Not sensitive
-        }
-
         collateral_lower = collateral_type.lower().replace(' ', '_')
-        return collateral_sensitivities.get(collateral_lower, 1.0)
+        return _COLLATERAL_SENSITIVITIES.get(collateral_lower, 1.0)
 
     def calculate_scenario_multipliers(
         self,
@@ -1,5 +1,6 @@
 """Macroeconomic model for forward-looking ECL adjustments."""
 
+import itertools
 from dataclasses import dataclass
 from typing import Dict, Optional, List
 from datetime import date
@@ -8,6 +9,10 @@ from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Source of model versions, unique across all models so a version never
+# identifies two different states
+_VERSIONS = itertools.count()
+
 
 @dataclass
 class MacroeconomicVariable:
@@ -63,6 +68,12 @@ class MacroeconomicModel:
         # Current values (start at baseline)
         self.current_values = self.baseline_values.copy()
 
+        # Changes whenever values are changed through the model's methods,
+        # so results derived from the values can be cached by version. Direct
+        # edits to current_values / baseline_values are not tracked; use
+        # set_variable or the shock methods instead.
+        self.version = next(_VERSIONS)
+
         # Variable metadata
         self.variable_info = {
             'gdp_growth': {
@@ -129,6 +140,7 @@ class MacroeconomicModel:
             raise KeyError(f"Unknown variable: {name}")
 
         self.current_values[name] = value
+        self.version = next(_VERSIONS)
 
         logger.debug(
             "Macro variable updated",
@@ -160,6 +172,8 @@ class MacroeconomicModel:
             else:
                 logger.warning(f"Unknown variable in shock: {variable}")
 
+        self.version = next(_VERSIONS)
+
     def apply_multiplicative_shock(self, shocks: Dict[str, float]):
         """Apply multiplicative shocks to macroeconomic variables.
 
@@ -182,9 +196,12 @@ class MacroeconomicModel:
             else:
                 logger.warning(f"Unknown variable in shock: {variable}")
 
+        self.version = next(_VERSIONS)
+
     def reset_to_baseline(self):
         """Reset all variables to baseline values."""
         self.current_values = self.baseline_values.copy()
+        self.version = next(_VERSIONS)
         logger.info("Reset macro model to baseline")
 
     def get_all_variables(self) -> List[MacroeconomicVariable]:
@@ -325,4 +342,5 @@ class MacroeconomicModel:
         """
         new_model = MacroeconomicModel(self.baseline_values.copy())
         new_model.current_values = self.current_values.copy()
+        new_model.version = next(_VERSIONS)
         return new_model
@@ -1,8 +1,8 @@
 """Scenario manager for multi-scenario ECL analysis."""
 
-from typing import Dict, List, Optional
+import logging
+from typing import Dict, List, Optional, Tuple
 from pathlib import Path
-from decimal import Decimal
 
 import yaml
 
@@ -12,7 +12,7 @@ from models.portfolio_item import PortfolioItem
 from scenarios.macroeconomic_model import MacroeconomicModel
 from scenarios.forward_looking import ForwardLookingAdjustment
 from utils.config import get_config
-from utils.logger import get_logger
+from utils.logger import get_logger, is_enabled_for
 
 logger = get_logger(__name__)
 
@@ -242,43 +242,65 @@ class ScenarioManager:
             probabilities={name: s.probability for name, s in self.scenarios.items()}
         )
 
-    def calculate_weighted_ecl(
+    def _weighted_ecl_totals(
         self,
         scenario_results: Dict[str, PortfolioECLResult]
-    ) -> Decimal:
-        """Calculate probability-weighted ECL across scenarios.
+    ) -> Tuple[float, float, float, float]:
+        """Weight each scenario's ECL totals by its probability in one pass.
+
+        Results for unknown scenarios are logged and left out.
 
         Args:
             scenario_results: Dictionary mapping scenario name to ECL result
 
         Returns:
-            Probability-weighted total ECL
+            Tuple of weighted (total_ecl, stage_1_ecl, stage_2_ecl, stage_3_ecl)
         """
-        weighted_ecl = Decimal('0')
+        total_ecl = stage_1_ecl = stage_2_ecl = stage_3_ecl = 0.0
+        log_contributions = is_enabled_for(logging.DEBUG)
 
         for scenario_name, result in scenario_results.items():
             scenario = self.scenarios.get(scenario_name)
             if scenario:
-                weight = Decimal(str(scenario.probability))
-                contribution = result.total_ecl * weight
-                weighted_ecl += contribution
-
-                logger.debug(
-                    "Scenario ECL contribution",
-                    scenario=scenario_name,
-                    ecl=float(result.total_ecl),
-                    probability=scenario.probability,
-                    contribution=float(contribution)
-                )
+                weight = scenario.probability
+                total_ecl += result.total_ecl * weight
+                stage_1_ecl += result.stage_1_ecl * weight
+                stage_2_ecl += result.stage_2_ecl * weight
+                stage_3_ecl += result.stage_3_ecl * weight
+
+                if log_contributions:
+                    logger.debug(
+                        "Scenario ECL contribution",
+                        scenario=scenario_name,
+                        ecl=result.total_ecl,
+                        probability=weight,
+                        contribution=result.total_ecl * weight
+                    )
             else:
                 logger.warning(
                     "Scenario not found for result",
                     scenario=scenario_name
                 )
 
+        return total_ecl, stage_1_ecl, stage_2_ecl, stage_3_ecl
+
+    def calculate_weighted_ecl(
+        self,
+        scenario_results: Dict[str, PortfolioECLResult]
+    ) -> float:
+        """Calculate probability-weighted ECL across scenarios.
+
+        Args:
+            scenario_results: Dictionary mapping scenario name to ECL result
+
+        Returns:
+            Probability-weighted total ECL
+        """
+        weighted_ecl = self._weighted_ecl_totals(scenario_results)[0]
+
         logger.info(
             "Calculated weighted ECL",
-            weighted_ecl=float(weighted_ecl),
+            weighted_ecl=weighted_ecl,
             scenario_count=len(scenario_results)
         )
 
@@ -303,19 +325,8 @@ class ScenarioManager:
         first_result = next(iter(scenario_results.values()))
 
         # Calculate weighted values
-        weighted_total_ecl = Decimal('0')
-        weighted_stage_1_ecl = Decimal('0')
-        weighted_stage_2_ecl = Decimal('0')
-        weighted_stage_3_ecl = Decimal('0')
-
-        for scenario_name, result in scenario_results.items():
-            scenario = self.scenarios.get(scenario_name)
-            if scenario:
-                weight = Decimal(str(scenario.probability))
-                weighted_total_ecl += result.total_ecl * weight
-                weighted_stage_1_ecl += result.stage_1_ecl * weight
-                weighted_stage_2_ecl += result.stage_2_ecl * weight
-                weighted_stage_3_ecl += result.stage_3_ecl * weight
+        (weighted_total_ecl, weighted_stage_1_ecl,
+         weighted_stage_2_ecl, weighted_stage_3_ecl) = self._weighted_ecl_totals(scenario_results)
 
         # Create weighted result
         weighted_result = PortfolioECLResult(
@@ -38,6 +38,11 @@ setup(
         "tqdm>=4.66.0",
     ],
     extras_require={
+        "fast": [
+            "numba>=0.58.0",
+            "orjson>=3.9.0",
+            "python-calamine>=0.2.0",
+        ],
         "dev": [
             "pytest>=7.4.0",
             "pytest-cov>=4.1.0",
@@ -0,0 +1,25 @@
+"""Shared test fixtures."""
+
+import pytest
+from datetime import date
+from decimal import Decimal
+
+from models.portfolio_item import PortfolioItem
+
+
+@pytest.fixture
+def make_item():
+    """Provide a factory building portfolio items with sensible defaults."""
+    def _make_item(item_id, **kwargs):
+        defaults = dict(
+            item_id=item_id,
+            borrower_id=f"B{item_id}",
+            origination_date=date(2021, 1, 1),
+            maturity_date=date(2028, 1, 1),
+            outstanding_amount=Decimal('100000'),
+            reporting_date=date(2024, 1, 1),
+        )
+        defaults.update(kwargs)
+        return PortfolioItem(**defaults)
+
+    return _make_item
@@ -5,13 +5,18 @@ from datetime import date
 from decimal import Decimal
 from pathlib import Path
 
+import numpy as np
+
 from data_management.portfolio_loader import PortfolioLoader
 from core.ecl_engine import ECLCalculationEngine
 from scenarios.scenario_manager import ScenarioManager
 from scenarios.macroeconomic_model import MacroeconomicModel
+from scenarios import forward_looking
 from scenarios.forward_looking import ForwardLookingAdjustment
+from models.portfolio_array import PortfolioArray
 from models.scenario_config import ScenarioConfig, MacroeconomicAdjustments
 from models.enums import ScenarioType
+from utils.jit import NUMBA_AVAILABLE
 
 
 class TestMacroeconomicModel:
@@ -153,6 +158,104 @@ class TestForwardLookingAdjustment:
         # EAD should increase in stress scenario (higher drawdowns)
         assert adjusted_ead > base_ead
 
+    def test_batch_matches_per_item(self, stressed_macro_model):
+        """Test batch PD and LGD adjustments match per-item adjustments."""
+        adjuster = ForwardLookingAdjustment()
+        csv_path = Path(__file__).parent.parent.parent / "examples" / "sample_portfolio.csv"
+        items = PortfolioLoader.load_from_csv(str(csv_path))
+        items[0].sector = 'Unknown'
+        items[1].collateral_type = None
+        items[2].collateral_type = 'Real Estate'
+        base_pd = np.linspace(0.00001, 0.9, len(items))
+        base_lgd = np.linspace(0.005, 0.95, len(items))
+
+        portfolio = PortfolioArray.from_items(items)
+
+        adjusted_pd = adjuster.adjust_pd_batch(base_pd, stressed_macro_model, portfolio)
+        adjusted_lgd = adjuster.adjust_lgd_batch(base_lgd, stressed_macro_model, portfolio)
+        adjusted_ead = adjuster.adjust_ead_batch(portfolio.total_exposure, stressed_macro_model, 0.05)
+
+        assert adjusted_pd.tolist() == [
+            adjuster.adjust_pd(pd, stressed_macro_model, item) for pd, item in zip(base_pd, items)
+        ]
+        assert adjusted_lgd.tolist() == [
+            adjuster.adjust_lgd(lgd, stressed_macro_model, item) for lgd, item in zip(base_lgd, items)
+        ]
+        assert adjuster.adjust_pd_batch(base_pd, stressed_macro_model).tolist() == [
+            adjuster.adjust_pd(pd, stressed_macro_model) for pd in base_pd
+        ]
+        assert adjusted_ead.tolist() == [
+            adjuster.adjust_ead(float(i.total_exposure), stressed_macro_model, 0.05) for i in items
+        ]
+
+    @pytest.mark.parametrize("use_numba", [False, True])
+    def test_adjust_portfolio_matches_batch(self, stressed_macro_model, monkeypatch, use_numba):
+        """Test the fused portfolio adjustment matches the batch adjustments."""
+        if use_numba and not NUMBA_AVAILABLE:
+            pytest.skip("Numba not installed")
+        monkeypatch.setattr(forward_looking, 'NUMBA_AVAILABLE', use_numba)
+        adjuster = ForwardLookingAdjustment()
+        csv_path = Path(__file__).parent.parent.parent / "examples" / "sample_portfolio.csv"
+        items = PortfolioLoader.load_from_csv(str(csv_path))
+        items[0].sector = 'Unknown'
+        items[1].collateral_type = None
+        portfolio = PortfolioArray.from_items(items)
+        base_pd = np.linspace(0.00001, 0.9, len(items))
+        base_lgd = np.linspace(0.005, 0.95, len(items))
+
+        adjusted_pd, adjusted_lgd, adjusted_ead = adjuster.adjust_portfolio(
+            base_pd, base_lgd, portfolio.total_exposure, stressed_macro_model, portfolio, 0.05
+        )
+
+        np.testing.assert_allclose(adjusted_pd, adjuster.adjust_pd_batch(base_pd, stressed_macro_model, portfolio))
+        np.testing.assert_allclose(adjusted_lgd, adjuster.adjust_lgd_batch(base_lgd, stressed_macro_model, portfolio))
+        np.testing.assert_allclose(
+            adjusted_ead, adjuster.adjust_ead_batch(portfolio.total_exposure, stressed_macro_model, 0.05)
+        )
+
+    def test_sensitivity_tables_match_lookups(self):
+        """Test encoded sensitivity table entries match the per-label lookups."""
+        adjuster = ForwardLookingAdjustment()
+
+        for sector in ['Construction', 'Utilities', 'Financial Services', 'Unknown', '']:
+            assert adjuster._sector_mult_table[adjuster.encode_sector(sector)] == \
+                adjuster._get_sector_sensitivity(sector)
+        for collateral_type in ['Real Estate', 'real_estate', 'CASH', 'Securities', 'Gold']:
+            assert adjuster._collateral_mult_table[adjuster.encode_collateral(collateral_type)] == \
+                adjuster._get_collateral_sensitivity(collateral_type)
+        assert adjuster.encode_sector('Unknown') == adjuster.encode_collateral(None) == 0
+
+    def test_factors_follow_macro_changes(self, stressed_macro_model):
+        """Test memoized factors are recalculated when the macro model changes."""
+        adjuster = ForwardLookingAdjustment()
+        stressed_pd = adjuster.adjust_pd(0.02, stressed_macro_model)
+        stressed_ead = adjuster.adjust_ead(1000.0, stressed_macro_model)
+        clone = stressed_macro_model.clone()
+
+        stressed_macro_model.reset_to_baseline()
+
+        assert adjuster.adjust_pd(0.02, stressed_macro_model) == pytest.approx(0.02)
+        assert adjuster.adjust_ead(1000.0, stressed_macro_model) == pytest.approx(1000.0)
+        assert adjuster.adjust_pd(0.02, clone) == stressed_pd
+        assert adjuster.adjust_ead(1000.0, clone) == stressed_ead
+
+        adjuster.pd_elasticities = {}
+        adjuster.clear_cache()
+        assert adjuster.adjust_pd(0.02, clone) == pytest.approx(0.02)
+
+    def test_factor_cache_is_bounded(self, stressed_macro_model, monkeypatch):
+        """Test the factor caches are emptied when they reach their size limit."""
+        monkeypatch.setattr(forward_looking, 'FACTOR_CACHE_SIZE', 3)
+        adjuster = ForwardLookingAdjustment()
+
+        for _ in range(10):
+            stressed_macro_model.apply_shock({'gdp_growth': -0.1})
+            adjuster.adjust_pd(0.02, stressed_macro_model)
+            adjuster.adjust_ead(1000.0, stressed_macro_model)
+
+            assert len(adjuster._pd_factor_cache) <= 3
+            assert len(adjuster._ead_stress_cache) <= 3
+
     def test_calculate_scenario_multipliers(self, stressed_macro_model):
         """Test calculating scenario multipliers."""
         adjuster = ForwardLookingAdjustment()
@@ -390,6 +493,29 @@ class TestScenarioWorkflow:
         assert weighted_result.total_ecl > 0
         assert weighted_result.scenario_name == 'probability_weighted'
 
+    def test_weighted_ecl_matches_per_scenario_sum(self, portfolio_items):
+        """Test weighted totals match summing each known scenario's weighted ECL."""
+        scenario_mgr = ScenarioManager()
+        scenario_mgr.create_default_scenarios()
+
+        engine = ECLCalculationEngine()
+        scenario_results = {
+            scenario.name: engine.calculate_portfolio_ecl(portfolio_items, scenario=scenario)
+            for scenario in scenario_mgr.list_scenarios()
+        }
+        scenario_results['unknown'] = scenario_results['base']
+
+        weighted_result = scenario_mgr.calculate_weighted_portfolio_result(scenario_results)
+
+        known = [(scenario_mgr.scenarios[name].probability, result)
+                 for name, result in scenario_results.items() if name != 'unknown']
+        for attr in ('total_ecl', 'stage_1_ecl', 'stage_2_ecl', 'stage_3_ecl'):
+            assert getattr(weighted_result, attr) == pytest.approx(
+                sum(p * getattr(result, attr) for p, result in known)
+            )
+        assert scenario_mgr.calculate_weighted_ecl(scenario_results) == weighted_result.total_ecl
+        assert scenario_mgr.calculate_weighted_ecl({}) == 0.0
+
     def test_scenario_comparison(self, portfolio_items):
         """Test scenario comparison."""
         scenario_mgr = ScenarioManager()
@@ -0,0 +1,173 @@
+"""Unit tests for the ECL calculation engine."""
+
+import copy
+import pytest
+from datetime import date
+from decimal import Decimal
+
+from core.ecl_engine import ECLCalculationEngine
+from models.enums import Stage, ScenarioType
+from models.scenario_config import ScenarioConfig, MacroeconomicAdjustments
+
+
+@pytest.fixture
+def engine():
+    """Create ECL calculation engine."""
+    return ECLCalculationEngine()
+
+
+@pytest.fixture
+def portfolio(make_item):
+    """Create a portfolio covering all stages, products and collateral cases."""
+    return [
+        make_item('L1', credit_score=780, collateral_value=Decimal('120000'),
+                  collateral_type='real_estate', sector='Real Estate'),
+        make_item('L2', credit_score=640, undrawn_commitment=Decimal('50000'),
+                  product_type='Revolving Credit', sector='Retail'),
+        make_item('L3', credit_score=560, days_past_due=45, times_past_due_12m=2,
+                  collateral_value=Decimal('30000'), collateral_type='equipment'),
+        make_item('L4', credit_score=520, days_past_due=120, sector='Retail'),
+        make_item('L5', credit_score=700, maturity_date=date(2024, 9, 1),
+                  days_past_due=35, product_type='Credit Card',
+                  undrawn_commitment=Decimal('20000')),
+        make_item('L6', credit_score=610, outstanding_amount=Decimal('0'),
+                  undrawn_commitment=Decimal('0')),
+    ]
+
+
+@pytest.fixture
+def stress_scenario():
+    """Create a stress scenario."""
+    return ScenarioConfig(
+        name='stress',
+        scenario_type=ScenarioType.STRESS,
+        probability=1.0,
+        macro_adjustments=MacroeconomicAdjustments(gdp_growth=-4.0, unemployment_rate=4.0),
+        pd_multiplier=2.5,
+        lgd_multiplier=1.3,
+        ead_multiplier=1.1,
+        lgd_downturn_factor=1.2,
+    )
+
+
+class TestInvalidItems:
+    """Tests for excluding items that cannot be calculated."""
+
+    @pytest.mark.parametrize("method", ["calculate_portfolio_ecl", "calculate_portfolio_ecl_vectorized"])
+    def test_invalid_items_excluded(self, engine, portfolio, method, make_item):
+        """Test invalid items are skipped and the rest are calculated."""
+        invalid = make_item('BAD', outstanding_amount=Decimal('-5000'))
+
+        result = getattr(engine, method)(portfolio + [invalid])
+
+        assert result.total_items == len(portfolio)
+        assert 'BAD' not in {r.item_id for r in result.item_results}
+
+    @pytest.mark.parametrize("method", ["calculate_portfolio_ecl", "calculate_portfolio_ecl_vectorized"])
+    @pytest.mark.parametrize("field", ["origination_pd", "previous_pd", "interest_rate"])
+    def test_non_numeric_rates_excluded(self, engine, portfolio, method, field, make_item):
+        """Test items with text PDs or rates are skipped rather than failing the run."""
+        invalid = make_item('BAD', **{field: "0.01"})
+
+        result = getattr(engine, method)(portfolio + [invalid])
+
+        assert result.total_items == len(portfolio)
+
+    def test_calculation_errors_skip_item(self, engine, portfolio, monkeypatch):
+        """Test an item failing during calculation is skipped by the per-item loop."""
+        calculate_ecl = engine.calculate_ecl
+
+        def failing_calculate_ecl(item, *args):
+            if item.item_id == 'L2':
+                raise ValueError("bad item")
+            return calculate_ecl(item, *args)
+
+        monkeypatch.setattr(engine, 'calculate_ecl', failing_calculate_ecl)
+
+        result = engine.calculate_portfolio_ecl(portfolio)
+
+        assert [r.item_id for r in result.item_results] == ['L1', 'L3', 'L4', 'L5', 'L6']
+
+
+class TestVectorizedPortfolioECL:
+    """Tests for the array-based portfolio ECL calculation."""
+
+    @pytest.mark.parametrize("use_scenario", [False, True])
+    def test_matches_item_by_item_calculation(self, engine, portfolio, stress_scenario, use_scenario):
+        """Test vectorized results match the per-item calculation."""
+        scenario = stress_scenario if use_scenario else None
+
+        expected = engine.calculate_portfolio_ecl(copy.deepcopy(portfolio), scenario)
+        actual = engine.calculate_portfolio_ecl_vectorized(copy.deepcopy(portfolio), scenario)
+
+        assert actual.total_items == expected.total_items
+        assert float(actual.total_ecl) == pytest.approx(float(expected.total_ecl), rel=1e-9)
+        assert float(actual.total_exposure) == pytest.approx(float(expected.total_exposure), rel=1e-9)
+        assert (actual.stage_1_count, actual.stage_2_count, actual.stage_3_count) == \
+            (expected.stage_1_count, expected.stage_2_count, expected.stage_3_count)
+
+        for exp, act in zip(expected.item_results, actual.item_results):
+            assert act.item_id == exp.item_id
+            assert act.stage == exp.stage
+            assert act.time_horizon_months == exp.time_horizon_months
+            assert act.probability_of_default == pytest.approx(exp.probability_of_default, rel=1e-9)
+            assert act.loss_given_default == pytest.approx(exp.loss_given_default, rel=1e-9)
+            assert float(act.ecl_amount) == pytest.approx(float(exp.ecl_amount), rel=1e-9, abs=1e-6)
+            assert float(act.unsecured_exposure) == pytest.approx(float(exp.unsecured_exposure), rel=1e-9)
+
+        for sector, ecl in expected.ecl_by_sector.items():
+            assert float(actual.ecl_by_sector[sector]) == pytest.approx(float(ecl), rel=1e-9)
+
+    def test_empty_portfolio(self, engine):
+        """Test vectorized calculation with no items."""
+        result = engine.calculate_portfolio_ecl_vectorized([])
+
+        assert result.total_items == 0
+        assert result.total_ecl == Decimal('0')
+
+
+class TestScenarioBatchECL:
+    """Tests for evaluating several scenarios in one pass."""
+
+    def test_matches_per_scenario_calculation(self, engine, portfolio, stress_scenario):
+        """Test batched scenario results match separate per-scenario runs."""
+        base = ScenarioConfig(
+            name='base',
+            scenario_type=ScenarioType.BASE,
+            probability=0.5,
+            macro_adjustments=MacroeconomicAdjustments(),
+        )
+        scenarios = [base, stress_scenario]
+
+        results = engine.calculate_portfolio_ecl_scenarios(copy.deepcopy(portfolio), scenarios)
+
+        assert list(results) == ['base', 'stress']
+        for scenario in scenarios:
+            expected = engine.calculate_portfolio_ecl(copy.deepcopy(portfolio), scenario)
+            actual = results[scenario.name]
+
+            assert actual.scenario_name == scenario.name
+            assert float(actual.total_ecl) == pytest.approx(float(expected.total_ecl), rel=1e-9)
+            assert float(actual.total_exposure) == pytest.approx(float(expected.total_exposure), rel=1e-9)
+            for exp, act in zip(expected.item_results, actual.item_results):
+                assert act.probability_of_default == pytest.approx(exp.probability_of_default, rel=1e-9)
+                assert act.loss_given_default == pytest.approx(exp.loss_given_default, rel=1e-9)
+                assert float(act.ecl_amount) == pytest.approx(float(exp.ecl_amount), rel=1e-9, abs=1e-6)
+
+    def test_no_scenarios(self, engine, portfolio):
+        """Test an empty scenario list returns no results."""
+        assert engine.calculate_portfolio_ecl_scenarios(portfolio, []) == {}
+
+
+class TestLifetimeECL:
+    """Tests for Stage 2/3 lifetime ECL calculation."""
+
+    def test_period_ecl_sums_to_total(self, engine, stress_scenario, make_item):
+        """Test per-period ECL breakdown adds up to lifetime ECL."""
+        item = make_item('L1', credit_score=560, days_past_due=45, times_past_due_12m=2)
+
+        result = engine.calculate_ecl(item, stress_scenario)
+
+        assert result.stage == Stage.STAGE_2
+        assert len(result.period_ecl) == len(result.period_pd)
+        assert sum(result.period_ecl) == pytest.approx(float(result.ecl_amount), rel=1e-9)
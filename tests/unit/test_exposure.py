@@ -0,0 +1,89 @@
+"""Unit tests for EAD calculations."""
+
+import pytest
+from datetime import date
+from decimal import Decimal
+
+from core.exposure import EADCalculator
+from models.portfolio_item import PortfolioItem
+
+
+@pytest.fixture
+def calculator():
+    """Create EAD calculator."""
+    return EADCalculator()
+
+
+@pytest.fixture
+def revolving_item():
+    """Create a partially drawn revolving facility."""
+    return PortfolioItem(
+        item_id='RCF001',
+        borrower_id='BORR001',
+        origination_date=date(2022, 1, 1),
+        maturity_date=date(2027, 1, 1),
+        outstanding_amount=Decimal('600000'),
+        undrawn_commitment=Decimal('400000'),
+        product_type='Revolving Credit',
+    )
+
+
+def _project_month_by_month(outstanding, undrawn, months, prepayment_rate, drawdown_rate):
+    """Reference month-by-month projection."""
+    for _ in range(months):
+        outstanding = outstanding * (1 - prepayment_rate)
+        drawdown = undrawn * drawdown_rate
+        outstanding += drawdown
+        undrawn -= drawdown
+    return outstanding, undrawn
+
+
+class TestProjectEAD:
+    """Tests for EADCalculator.project_ead."""
+
+    @pytest.mark.parametrize("months,prepayment_rate,drawdown_rate", [
+        (0, 0.01, 0.02),
+        (1, 0.01, 0.02),
+        (120, 0.01, 0.02),
+        (60, 0.03, 0.03),
+        (36, 0.0, 0.05),
+        (24, 0.02, 0.0),
+    ])
+    def test_matches_monthly_recurrence(
+        self, calculator, revolving_item, months, prepayment_rate, drawdown_rate
+    ):
+        """Test closed-form projection matches month-by-month projection."""
+        outstanding, undrawn = _project_month_by_month(
+            600000.0, 400000.0, months, prepayment_rate, drawdown_rate
+        )
+        ccf = calculator._get_ccf(revolving_item)
+
+        ead = calculator.project_ead(
+            revolving_item,
+            months,
+            prepayment_rate=prepayment_rate,
+            drawdown_rate=drawdown_rate,
+        )
+
+        assert float(ead) == pytest.approx(outstanding + undrawn * ccf, rel=1e-9)
+
+    def test_no_projection_equals_current_ead(self, calculator, revolving_item):
+        """Test zero-month projection equals current EAD."""
+        ead = calculator.project_ead(revolving_item, 0)
+
+        assert float(ead) == pytest.approx(calculator.calculate_current_ead_float(revolving_item))
+
+
+class TestCurrentEAD:
+    """Tests for EADCalculator.calculate_current_ead."""
+
+    def test_exact_decimal(self, calculator, revolving_item):
+        """Test current EAD keeps sub-cent digits and matches the float version."""
+        revolving_item.outstanding_amount = Decimal('600000.005')
+        ccf = calculator._get_ccf(revolving_item)
+
+        ead = calculator.calculate_current_ead(revolving_item)
+
+        assert ead == Decimal('600000.005') + Decimal('400000') * Decimal(str(ccf))
+        assert float(ead) == pytest.approx(calculator.calculate_current_ead_float(revolving_item))
+        assert calculator.calculate_ead_with_scenario_adjustment(revolving_item, 1.1) == ead * Decimal('1.1')
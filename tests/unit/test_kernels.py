@@ -0,0 +1,99 @@
+"""Unit tests for compiled numerical kernels."""
+
+import numpy as np
+import pytest
+
+from core import _kernels
+from data_management import _kernels as _validation_kernels
+from scenarios import _kernels as _scenario_kernels
+from utils.jit import NUMBA_AVAILABLE
+
+
+KERNELS = ['_period_ecl_kernel', '_portfolio_ecl_kernel', '_stage_migrate_kernel']
+
+
+@pytest.mark.skipif(not NUMBA_AVAILABLE, reason="Numba not installed")
+class TestEagerCompilation:
+    """Tests that kernels are compiled at import rather than on first call."""
+
+    @pytest.mark.parametrize("name", KERNELS)
+    def test_compiled_at_import(self, name):
+        """Test kernel has exactly its declared signature and no lazy compilation."""
+        kernel = getattr(_kernels, name)
+
+        assert len(kernel.signatures) == 1
+        assert not kernel._can_compile
+
+    def test_stage_kernel_matches_python_fallback(self):
+        """Test compiled stage kernel matches its pure-Python fallback."""
+        rng = np.random.default_rng(7)
+        n = 500
+        args = (
+            rng.integers(0, 120, n),
+            rng.integers(0, 4, n),
+            rng.random(n) < 0.1,
+            rng.random(n) < 0.1,
+            np.where(rng.random(n) < 0.2, np.nan, rng.random(n) * 0.05),
+            np.where(rng.random(n) < 0.3, np.nan, rng.random(n) * 0.02),
+            30.0, 90.0, 30.0, 30.0, 200.0,
+        )
+
+        compiled = _kernels._stage_migrate_kernel(*args)
+        fallback = _kernels._stage_migrate_kernel.py_func(*args)
+
+        np.testing.assert_array_equal(compiled, fallback)
+        assert set(np.unique(compiled)) <= {0, 1, 2}
+
+    def test_validation_kernel_matches_python_fallback(self):
+        """Test compiled validation kernel is eager and matches its pure-Python fallback."""
+        rng = np.random.default_rng(11)
+        n = 500
+        fields = np.column_stack([
+            rng.normal(1000, 2000, n),
+            rng.choice([0.0, -0.0, -1.0, 50.0], n),
+            rng.choice([0.0, -5.0, 1000.0], n),
+            rng.normal(5, 50, n),
+            np.where(rng.random(n) < 0.05, np.nan, rng.integers(250, 900, n)),
+            rng.normal(0.5, 0.5, n),
+            np.where(rng.random(n) < 0.05, np.nan, rng.random(n)),
+            rng.integers(-5, 120, n),
+            rng.integers(-1, 4, n),
+            rng.integers(737000, 739000, n),
+            rng.integers(737500, 741000, n),
+            rng.integers(737000, 741000, n),
+            rng.integers(0, 3, n),
+            rng.random(n) < 0.1,
+            rng.random(n) < 0.05,
+            rng.random(n) < 0.5,
+        ]).astype(np.float64)
+        args = (fields, 738500.0, 300.0, 850.0, 0.0, 1.0, 100.0, 90.0, 0.0, 2.0)
+        kernel = _validation_kernels._flag_invalid_kernel
+
+        compiled = kernel(*args)
+
+        assert len(kernel.signatures) == 1
+        np.testing.assert_array_equal(compiled, kernel.py_func(*args))
+        assert 0 < compiled.sum() < n
+
+    def test_scenario_kernel_matches_python_fallback(self):
+        """Test compiled scenario kernel is eager and matches its pure-Python fallback."""
+        rng = np.random.default_rng(13)
+        n = 500
+        args = (
+            rng.random(n),
+            rng.random(n),
+            rng.random(n) * 1e6,
+            rng.integers(0, 4, n).astype(np.int32),
+            rng.integers(0, 3, n).astype(np.int32),
+            np.array([1.5, 1.0, 0.7, 1.2]),
+            np.array([1.0, 1.3, 0.0]),
+            0.4, 0.2, 1.05, 0.0001, 0.99, 0.01, 1.0,
+        )
+        kernel = _scenario_kernels._apply_scenario_kernel
+
+        compiled = kernel(*args)
+
+        assert len(kernel.signatures) == 1
+        for actual, expected in zip(compiled, kernel.py_func(*args)):
+            np.testing.assert_allclose(actual, expected)
+        assert compiled[0].max() == 0.99
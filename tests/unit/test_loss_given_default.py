@@ -0,0 +1,61 @@
+"""Unit tests for LGD calculations."""
+
+import pytest
+from decimal import Decimal
+
+from core.loss_given_default import LGDCalculator
+
+
+@pytest.fixture
+def calculator():
+    """Create LGD calculator with fixed parameters."""
+    return LGDCalculator({
+        'unsecured_base': 0.45,
+        'secured_base': 0.25,
+        'downturn_multiplier': 1.25,
+        'floor': 0.01,
+        'ceiling': 1.0,
+        'collateral_haircuts': {'cash': 0.0, 'real_estate': 0.2},
+    })
+
+
+class TestCalculateLGD:
+    """Tests for LGDCalculator.calculate_lgd."""
+
+    def test_fully_unsecured(self, calculator, make_item):
+        """Test uncollateralized exposure uses unsecured base LGD."""
+        assert calculator.calculate_lgd(make_item('LOAN001'), 100000.0) == pytest.approx(0.45)
+
+    def test_fully_secured(self, calculator, make_item):
+        """Test fully collateralized exposure uses secured base LGD."""
+        item = make_item('LOAN001', collateral_value=Decimal('150000'), collateral_type='cash')
+
+        assert calculator.calculate_lgd(item, 100000.0) == pytest.approx(0.25)
+
+    def test_partially_secured_blend(self, calculator, make_item):
+        """Test partially collateralized exposure blends base LGDs."""
+        # 40,000 after haircut
+        item = make_item('LOAN001', collateral_value=Decimal('50000'), collateral_type='real_estate')
+
+        assert calculator.calculate_lgd(item, 100000.0) == pytest.approx(0.6 * 0.45 + 0.4 * 0.25)
+
+    def test_zero_exposure_treated_as_unsecured(self, calculator, make_item):
+        """Test zero exposure uses unsecured base LGD."""
+        item = make_item('LOAN001', collateral_value=Decimal('50000'), collateral_type='cash')
+
+        assert calculator.calculate_lgd(item, 0.0) == pytest.approx(0.45)
+
+    def test_downturn_adjustment(self, calculator, make_item):
+        """Test downturn adjustment scales base LGD."""
+        lgd = calculator.calculate_lgd(make_item('LOAN001'), 100000.0, apply_downturn=True)
+
+        assert lgd == pytest.approx(0.45 * 1.25)
+
+    def test_returns_unsecured_exposure(self, calculator, make_item):
+        """Test LGD is returned with the unsecured exposure used."""
+        item = make_item('LOAN001', collateral_value=Decimal('50000'), collateral_type='real_estate')
+
+        lgd, unsecured = calculator.calculate_lgd_and_unsecured(item, 100000.0)
+
+        assert unsecured == pytest.approx(60000.0)
+        assert lgd == pytest.approx(calculator.calculate_lgd(item, 100000.0))
@@ -4,7 +4,10 @@ import pytest
 from datetime import date
 from decimal import Decimal
 
-from models.enums import Stage, ScenarioType, CalculationMethod
+import numpy as np
+
+from models.enums import Stage, ScenarioType, CalculationMethod, STAGE_CODES
+from models.portfolio_array import PortfolioArray
 from models.portfolio_item import PortfolioItem
 from models.scenario_config import ScenarioConfig, MacroeconomicAdjustments
 from models.calculation_results import ECLResult, PortfolioECLResult
@@ -24,6 +27,13 @@ class TestStageEnum:
         assert str(Stage.STAGE_1) == "Stage 1"
         assert str(Stage.STAGE_2) == "Stage 2"
 
+    def test_formatting(self):
+        """Test str and f-strings give the plain value for every enum."""
+        for member in [*Stage, *ScenarioType, *CalculationMethod]:
+            assert type(str(member)) is str
+            assert str(member) == f"{member}" == f"{member:}" == member.value
+        assert f"{Stage.STAGE_3:>8}" == " Stage 3"
+
     def test_is_performing(self):
         """Test is_performing property."""
         assert Stage.STAGE_1.is_performing
@@ -155,6 +165,21 @@ class TestPortfolioItem:
         assert isinstance(item.origination_date, date)
         assert item.origination_date == date(2020, 1, 15)
 
+    def test_amount_conversion(self):
+        """Test int, float and text amounts convert to exact Decimals."""
+        item = PortfolioItem(
+            item_id="LOAN005",
+            borrower_id="BORR005",
+            origination_date=date(2020, 1, 1),
+            maturity_date=date(2025, 1, 1),
+            outstanding_amount=12345678901234567890,
+            undrawn_commitment=0.1,
+            collateral_value="2500.50",
+        )
+        assert item.outstanding_amount == Decimal('12345678901234567890')
+        assert item.undrawn_commitment == Decimal('0.1')
+        assert item.collateral_value == Decimal('2500.50')
+
     def test_string_stage_conversion(self):
         """Test automatic stage string conversion."""
         item = PortfolioItem(
@@ -173,6 +198,62 @@ class TestPortfolioItem:
         assert result['item_id'] == "LOAN001"
         assert result['outstanding_amount'] == 1000000.0
         assert result['current_stage'] == "Stage 1"
+        assert tuple(result) == PortfolioItem.FIELDS
+        assert tuple(result.values()) == sample_item.to_record_tuple()
+
+    def test_to_columns(self, sample_item):
+        """Test column conversion matches per-item dictionaries."""
+        other = PortfolioItem(
+            item_id="LOAN002",
+            borrower_id="BORR002",
+            origination_date=date(2021, 3, 1),
+            maturity_date=date(2026, 3, 1),
+            outstanding_amount=Decimal('250000.25'),
+            previous_stage=Stage.STAGE_2,
+            origination_pd=0.015,
+            region="EMEA",
+        )
+        items = [sample_item, other]
+
+        columns = PortfolioItem.to_columns(items)
+
+        assert list(columns) == list(sample_item.to_dict())
+        assert [dict(zip(columns, row)) for row in zip(*columns.values())] == [i.to_dict() for i in items]
+
+    def test_slotted(self, sample_item):
+        """Test items have no instance dictionary and cache float amounts on first access."""
+        assert not hasattr(sample_item, '__dict__')
+        with pytest.raises(AttributeError):
+            sample_item.unknown_field = 1
+
+        sample_item.collateral_value = Decimal('900000')
+
+        assert (sample_item.outstanding_f, sample_item.undrawn_f, sample_item.collateral_f) == \
+            (1000000.0, 500000.0, 900000.0)
+        assert sample_item == PortfolioItem(**{name: getattr(sample_item, name) for name in PortfolioItem.FIELDS})
+
+    def test_float_amounts_follow_assignment(self, sample_item):
+        """Test reassigning an amount replaces its cached float copy."""
+        assert sample_item.outstanding_f == 1000000.0
+
+        sample_item.outstanding_amount = Decimal('5000')
+        sample_item.undrawn_commitment = Decimal('100')
+
+        assert (sample_item.outstanding_f, sample_item.undrawn_f) == (5000.0, 100.0)
+        assert sample_item.outstanding_f + sample_item.undrawn_f == float(sample_item.total_exposure)
+
+    def test_lookup_keys_follow_assignment(self, sample_item):
+        """Test reassigning the product or collateral type replaces its lookup key."""
+        assert sample_item.product_key == 'term_loan'
+
+        sample_item.product_type = 'Revolving Credit'
+        sample_item.collateral_type = 'Real Estate'
+
+        assert (sample_item.product_key, sample_item.collateral_key) == ('revolving_credit', 'real_estate')
+
+        sample_item.collateral_type = None
+
+        assert sample_item.collateral_key is None
 
 
 class TestMacroeconomicAdjustments:
@@ -285,6 +366,52 @@ class TestECLResult:
         assert sample_result.probability_of_default == 0.02
         assert sample_result.ecl_amount == Decimal('9000')
 
+    def test_amounts_stored_as_float(self, sample_result):
+        """Test Decimal inputs are stored as floats and recoverable as Decimals."""
+        result = ECLResult(
+            item_id="LOAN003",
+            stage=Stage.STAGE_1,
+            probability_of_default=0.01,
+            loss_given_default=0.4,
+            exposure_at_default=1000,
+            ecl_amount=0.1,
+            time_horizon_months=12,
+            present_value_ecl=Decimal('0.05'),
+        )
+
+        assert type(sample_result.ecl_amount) is float
+        assert type(result.exposure_at_default) is float
+        assert result.present_value_ecl == 0.05
+        assert result.as_decimal('ecl_amount') == Decimal('0.1')
+
+    def test_slotted(self, sample_result):
+        """Test results have no instance dictionary and keep field defaults."""
+        assert not hasattr(sample_result, '__dict__')
+        assert sample_result.collateral_value == 0.0
+        with pytest.raises(AttributeError):
+            sample_result.unknown_field = 1
+
+    def test_enum_values_converted(self):
+        """Test stage and scenario type values become enum members."""
+        result = ECLResult(
+            item_id="LOAN004",
+            stage="Stage 2",
+            probability_of_default=0.05,
+            loss_given_default=0.4,
+            exposure_at_default=1000,
+            ecl_amount=20,
+            time_horizon_months=60,
+            scenario_type="stress",
+        )
+
+        assert result.stage is Stage.STAGE_2
+        assert result.scenario_type is ScenarioType.STRESS
+        with pytest.raises(ValueError):
+            ECLResult(
+                item_id="LOAN005", stage="Stage 4", probability_of_default=0.05, loss_given_default=0.4,
+                exposure_at_default=1000, ecl_amount=20, time_horizon_months=12,
+            )
+
     def test_ecl_rate(self, sample_result):
         """Test ECL rate calculation."""
         expected = 9000 / 1000000
@@ -299,6 +426,28 @@ class TestECLResult:
         result = sample_result.to_dict()
         assert result['item_id'] == "LOAN001"
         assert result['ecl_amount'] == 9000.0
+        assert tuple(result) == ECLResult.FIELDS
+        assert result['ecl_rate'] == pytest.approx(0.009)
+
+    def test_to_columns(self, sample_result):
+        """Test column conversion matches per-result dictionaries."""
+        other = ECLResult(
+            item_id="LOAN002",
+            stage=Stage.STAGE_2,
+            probability_of_default=0.1,
+            loss_given_default=0.25,
+            exposure_at_default=Decimal('0'),
+            ecl_amount=Decimal('0'),
+            time_horizon_months=48,
+            scenario_type=ScenarioType.STRESS,
+            present_value_ecl=Decimal('12.5'),
+        )
+        results = [sample_result, other]
+
+        columns = ECLResult.to_columns(results)
+
+        assert list(columns) == list(sample_result.to_dict())
+        assert [dict(zip(columns, row)) for row in zip(*columns.values())] == [r.to_dict() for r in results]
 
 
 class TestPortfolioECLResult:
@@ -327,6 +476,78 @@ class TestPortfolioECLResult:
         assert sample_portfolio_result.total_ecl == Decimal('100000')
         assert sample_portfolio_result.total_items == 100
 
+    def test_amounts_stored_as_float(self, sample_portfolio_result):
+        """Test totals are stored as floats and recoverable as Decimals."""
+        assert type(sample_portfolio_result.stage_2_ecl) is float
+        assert sample_portfolio_result.as_decimal('total_exposure') == Decimal('10000000.0')
+
+    def test_from_item_results(self):
+        """Test totals and breakdowns aggregated from item results."""
+        item_results = [
+            ECLResult(item_id=item_id, stage=stage, probability_of_default=0.05, loss_given_default=0.4,
+                      exposure_at_default=ead, ecl_amount=ecl, time_horizon_months=12)
+            for item_id, stage, ead, ecl in [
+                ("L1", Stage.STAGE_1, 1000, 10), ("L2", Stage.STAGE_3, 500, 200), ("L3", Stage.STAGE_1, 2000, 30),
+            ]
+        ]
+
+        result = PortfolioECLResult.from_item_results(
+            item_results,
+            sectors=["Retail", "Energy", "Retail"],
+            products=["Term Loan"] * 3,
+            ratings=["A", None, "B"],
+            scenario_name="base",
+        )
+
+        assert (result.total_ecl, result.total_exposure, result.total_items) == (240.0, 3500.0, 3)
+        assert (result.stage_1_ecl, result.stage_2_ecl, result.stage_3_ecl) == (40.0, 0.0, 200.0)
+        assert (result.stage_1_count, result.stage_2_count, result.stage_3_count) == (2, 0, 1)
+        assert result.stage_3_exposure == 500.0
+        assert list(result.ecl_by_sector.items()) == [("Retail", 40.0), ("Energy", 200.0)]
+        assert result.ecl_by_product == {"Term Loan": 240.0}
+        assert result.ecl_by_rating == {"A": 10.0, "B": 30.0}
+        assert result.scenario_name == "base"
+        assert PortfolioECLResult.from_item_results([], [], []).total_items == 0
+
+    def test_totals_correctly_rounded(self):
+        """Test monetary totals are correctly rounded sums of the item amounts."""
+        item_results = [
+            ECLResult(item_id=f"L{i}", stage=Stage.STAGE_1, probability_of_default=0.05, loss_given_default=0.4,
+                      exposure_at_default=0.1, ecl_amount=0.1, time_horizon_months=12)
+            for i in range(10)
+        ]
+
+        result = PortfolioECLResult.from_item_results(item_results, ["Retail"] * 10, ["Term Loan"] * 10)
+
+        assert sum([0.1] * 10) != 1.0
+        assert (result.total_exposure, result.total_ecl, result.stage_1_exposure) == (1.0, 1.0, 1.0)
+        assert result.ecl_by_sector == {"Retail": 1.0}
+
+    def test_totals_independent_of_result_order(self):
+        """Test shuffling the item results leaves every total unchanged."""
+        rng = np.random.default_rng(3)
+        stages = list(Stage)
+        rows = [
+            (f"L{i}", stages[i % 3], round(float(rng.uniform(1e3, 1e6)), 2), round(float(rng.uniform(0, 1e4)), 2),
+             ["Retail", "Energy", "Technology"][i % 3])
+            for i in range(300)
+        ]
+
+        def aggregate(rows):
+            item_results = [
+                ECLResult(item_id=item_id, stage=stage, probability_of_default=0.05, loss_given_default=0.4,
+                          exposure_at_default=ead, ecl_amount=ecl, time_horizon_months=12)
+                for item_id, stage, ead, ecl, _ in rows
+            ]
+            result = PortfolioECLResult.from_item_results(
+                item_results, [row[4] for row in rows], ["Term Loan"] * len(rows)
+            )
+            return result.get_summary(), dict(result.ecl_by_sector)
+
+        shuffled = [rows[i] for i in rng.permutation(len(rows))]
+
+        assert aggregate(shuffled) == aggregate(rows)
+
     def test_coverage_ratio(self, sample_portfolio_result):
         """Test overall coverage ratio."""
         expected = 100000 / 10000000
@@ -357,3 +578,51 @@ class TestPortfolioECLResult:
         result = sample_portfolio_result.to_dict()
         assert result['total_ecl'] == 100000.0
         assert result['total_items'] == 100
+
+
+class TestPortfolioArray:
+    """Tests for the struct-of-arrays portfolio columns."""
+
+    @pytest.fixture
+    def items(self):
+        """Create items with repeated and missing categories."""
+        common = dict(origination_date=date(2020, 1, 15), maturity_date=date(2025, 1, 15))
+        return [
+            PortfolioItem(item_id="A1", borrower_id="B1", outstanding_amount=Decimal('1000.5'),
+                          undrawn_commitment=Decimal('250'), sector="Retail", collateral_type="Real Estate",
+                          collateral_value=Decimal('800'), origination_pd=0.02, **common),
+            PortfolioItem(item_id="A2", borrower_id="B2", outstanding_amount=Decimal('300'),
+                          sector="Energy", current_stage=Stage.STAGE_3, days_past_due=120, **common),
+            PortfolioItem(item_id="A3", borrower_id="B3", outstanding_amount=Decimal('50'),
+                          sector="Retail", credit_score=640, times_past_due_12m=2, **common),
+        ]
+
+    def test_columns_match_items(self, items):
+        """Test each column holds the item values in item order."""
+        array = PortfolioArray.from_items(items)
+
+        assert len(array) == 3
+        assert array.item_id.tolist() == ['A1', 'A2', 'A3']
+        assert array.total_exposure.tolist() == [1250.5, 300.0, 50.0]
+        assert array.collateral.tolist() == [800.0, 0.0, 0.0]
+        assert array.credit_score.tolist() == [500, 500, 640]
+        assert array.days_past_due.tolist() == [0, 120, 0]
+        assert array.times_past_due_12m.tolist() == [0, 0, 2]
+        assert array.stage_code.tolist() == [STAGE_CODES[item.current_stage] for item in items]
+        assert array.origination_pd[0] == 0.02
+        assert np.isnan(array.origination_pd[1:]).all()
+
+    def test_categories_encoded(self, items):
+        """Test category codes index the label tables."""
+        array = PortfolioArray.from_items(items)
+
+        assert [array.sectors[code] for code in array.sector_code] == ['Retail', 'Energy', 'Retail']
+        assert [array.collateral_types[code] for code in array.collateral_code] == ['Real Estate', None, None]
+        assert len(array.sectors) == 2
+
+    def test_empty(self):
+        """Test building columns from no items."""
+        array = PortfolioArray.from_items([])
+
+        assert len(array) == 0
+        assert array.sectors == ()
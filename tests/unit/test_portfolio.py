@@ -0,0 +1,261 @@
+"""Unit tests for portfolio aggregation."""
+
+import pytest
+from collections import Counter
+from decimal import Decimal
+
+from core.ecl_engine import ECLCalculationEngine
+from core.portfolio import Portfolio
+from models.enums import Stage
+
+
+@pytest.fixture
+def items(make_item):
+    """Create items spread across stages, sectors and products."""
+    return [
+        make_item('P1', credit_score=780, collateral_value=Decimal('125000'),
+                  sector='Real Estate', internal_rating='A'),
+        make_item('P2', credit_score=640, undrawn_commitment=Decimal('50000.50'),
+                  product_type='Revolving Credit', sector='Retail',
+                  current_stage=Stage.STAGE_2, days_past_due=35),
+        make_item('P3', credit_score=520, outstanding_amount=Decimal('40000'),
+                  collateral_value=Decimal('20000'), sector='Retail',
+                  current_stage=Stage.STAGE_3, days_past_due=120),
+        make_item('P4', credit_score=700, outstanding_amount=Decimal('250000.25'),
+                  internal_rating='A'),
+    ]
+
+
+@pytest.fixture
+def portfolio(items):
+    """Create portfolio from items."""
+    return Portfolio(items)
+
+
+class TestPortfolioAggregation:
+    """Tests for columnar portfolio aggregations."""
+
+    def test_totals_match_items(self, portfolio, items):
+        """Test totals match sums over the items."""
+        assert portfolio.total_exposure() == pytest.approx(float(sum(i.total_exposure for i in items)))
+        assert portfolio.total_outstanding() == pytest.approx(float(sum(i.outstanding_amount for i in items)))
+        assert portfolio.total_undrawn() == pytest.approx(float(sum(i.undrawn_commitment for i in items)))
+        assert portfolio.total_collateral() == pytest.approx(float(sum(i.collateral_value for i in items)))
+
+    def test_averages(self, portfolio):
+        """Test average credit score and LTV (infinite LTVs excluded)."""
+        assert portfolio.average_credit_score() == pytest.approx((780 + 640 + 520 + 700) / 4)
+        assert portfolio.average_ltv() == pytest.approx((100000 / 125000 + 40000 / 20000) / 2)
+
+    def test_stage_breakdown(self, portfolio):
+        """Test stage counts and exposures."""
+        assert portfolio.stage_distribution() == {Stage.STAGE_1: 2, Stage.STAGE_2: 1, Stage.STAGE_3: 1}
+        assert portfolio.stage_exposure() == pytest.approx({
+            Stage.STAGE_1: 350000.25, Stage.STAGE_2: 150000.50, Stage.STAGE_3: 40000.0,
+        })
+
+    def test_category_breakdown(self, portfolio):
+        """Test sector and product counts and exposures."""
+        assert portfolio.sector_distribution() == {'Real Estate': 1, 'Retail': 2, 'Other': 1}
+        assert portfolio.sector_exposure() == pytest.approx({
+            'Real Estate': 100000.0, 'Retail': 190000.50, 'Other': 250000.25,
+        })
+        assert portfolio.product_distribution() == {'Term Loan': 3, 'Revolving Credit': 1}
+
+    def test_flag_counts(self, portfolio):
+        """Test past-due and defaulted counts."""
+        assert portfolio.past_due_count() == 2
+        assert portfolio.defaulted_count() == 1
+
+    def test_summary_matches_individual_aggregations(self, portfolio):
+        """Test summary fields agree with the individual aggregation methods."""
+        summary = portfolio.get_summary()
+
+        assert summary['total_exposure'] == portfolio.total_exposure()
+        assert summary['past_due_count'] == portfolio.past_due_count()
+        assert summary['stage_distribution'] == {str(s): c for s, c in portfolio.stage_distribution().items()}
+        assert summary['stage_exposure'] == {str(s): e for s, e in portfolio.stage_exposure().items()}
+        assert summary['stage_1_ratio'] + summary['stage_2_ratio'] + summary['stage_3_ratio'] == pytest.approx(1.0)
+
+    def test_add_and_remove_update_aggregations(self, portfolio, make_item):
+        """Test aggregations reflect items added and removed after construction."""
+        portfolio.add(make_item('P5', sector='Retail'))
+        assert portfolio.sector_distribution()['Retail'] == 3
+
+        portfolio.remove('P2')
+        assert portfolio.stage_distribution() == {Stage.STAGE_1: 3, Stage.STAGE_3: 1}
+
+    def test_refresh_after_in_place_change(self, portfolio):
+        """Test refresh picks up items mutated in place."""
+        portfolio['P1'].current_stage = Stage.STAGE_2
+        portfolio.refresh()
+
+        assert portfolio.stage_distribution()[Stage.STAGE_2] == 2
+
+    def test_other_in_place_changes_need_refresh(self, portfolio):
+        """Test in-place edits other than stage are only seen after refresh."""
+        before = portfolio.get_summary()
+        item = portfolio['P1']
+        item.outstanding_amount = Decimal('500000')
+        item.days_past_due = 120
+        item.sector = 'Energy'
+
+        assert portfolio.get_summary() == before
+        assert 'Energy' not in portfolio.sector_distribution()
+
+        portfolio.refresh()
+
+        assert portfolio.total_outstanding() == before['total_outstanding'] + 400000
+        assert portfolio.defaulted_count() == before['defaulted_count'] + 1
+        assert portfolio.sector_distribution()['Energy'] == 1
+
+    def test_stage_changes_need_no_refresh(self, portfolio, items):
+        """Test stage aggregations follow stages set in place by the ECL engine."""
+        view = portfolio.filter_by_stage(Stage.STAGE_1)
+        items[0].days_past_due = 45
+        items[3].current_stage = Stage.STAGE_3
+
+        ECLCalculationEngine().calculate_portfolio_ecl(items)
+
+        expected = Counter(item.current_stage for item in items)
+        assert portfolio.stage_distribution() == expected
+        assert len(portfolio.filter_by_stage(Stage.STAGE_3)) == expected[Stage.STAGE_3]
+        assert portfolio.defaulted_count() == portfolio.get_summary()['defaulted_count'] == \
+            sum(item.is_defaulted for item in items)
+        assert [item.item_id for item in view] == ['P1', 'P4']
+
+    def test_empty_portfolio(self):
+        """Test aggregations on an empty portfolio."""
+        portfolio = Portfolio()
+
+        assert portfolio.total_exposure() == 0.0
+        assert portfolio.average_ltv() == 0.0
+        assert portfolio.stage_distribution() == {}
+        assert portfolio.get_summary()['stage_1_ratio'] == 0
+
+    def test_total_exposure_decimal(self, portfolio, items):
+        """Test exact Decimal total matches the item sum."""
+        assert portfolio.total_exposure_decimal() == sum(i.total_exposure for i in items)
+        assert float(portfolio.total_exposure_decimal()) == pytest.approx(portfolio.total_exposure())
+
+
+class TestPortfolioMembership:
+    """Tests for adding and removing portfolio items."""
+
+    def test_remove_moves_last_item(self, portfolio):
+        """Test default removal fills the gap with the last item."""
+        assert portfolio.remove('P1')
+
+        assert [item.item_id for item in portfolio] == ['P4', 'P2', 'P3']
+        assert portfolio.remove('P4')
+        assert [item.item_id for item in portfolio] == ['P3', 'P2']
+
+    def test_stable_remove_preserves_order(self, portfolio):
+        """Test stable removal keeps remaining items in order."""
+        assert portfolio.remove('P2', stable=True)
+        assert portfolio.remove('P1')
+
+        assert [item.item_id for item in portfolio] == ['P4', 'P3']
+
+    def test_remove_last_and_missing(self, portfolio):
+        """Test removing the last item and an unknown ID."""
+        assert portfolio.remove('P4')
+        assert not portfolio.remove('P4')
+
+        assert len(portfolio) == 3
+        assert portfolio.get('P4') is None
+
+    def test_add_replaces_existing(self, portfolio, make_item):
+        """Test adding an item with an existing ID replaces it."""
+        portfolio.add(make_item('P2', sector='Energy'))
+
+        assert len(portfolio) == 4
+        assert portfolio['P2'].sector == 'Energy'
+        assert portfolio.remove('P2')
+        assert 'P2' not in {item.item_id for item in portfolio}
+
+
+class TestPortfolioView:
+    """Tests for column-backed filtered views."""
+
+    def test_filter_by_stage(self, portfolio):
+        """Test stage view selects the right items and aggregates over them."""
+        view = portfolio.filter_by_stage(Stage.STAGE_1)
+
+        assert [item.item_id for item in view] == ['P1', 'P4']
+        assert view.total_exposure() == pytest.approx(350000.25)
+        assert view.stage_distribution() == {Stage.STAGE_1: 2}
+
+    def test_filter_by_category(self, portfolio):
+        """Test sector, product and rating views."""
+        retail = portfolio.filter_by_sector('Retail')
+
+        assert len(retail) == 2
+        assert retail.sector_exposure() == pytest.approx({'Retail': 190000.50})
+        assert retail.product_distribution() == {'Revolving Credit': 1, 'Term Loan': 1}
+        assert [item.item_id for item in portfolio.filter_by_product('Revolving Credit')] == ['P2']
+        assert [item.item_id for item in portfolio.filter_by_rating('A')] == ['P1', 'P4']
+        assert len(portfolio.filter_by_sector('Unknown')) == 0
+
+    def test_chained_filters_and_summary(self, portfolio):
+        """Test views can be filtered further and summarized."""
+        view = portfolio.filter_by_sector('Retail').filter_by_stage(Stage.STAGE_3)
+
+        summary = view.get_summary()
+
+        assert [item.item_id for item in view] == ['P3']
+        assert summary['total_items'] == 1
+        assert summary['defaulted_count'] == 1
+        assert summary['stage_3_ratio'] == pytest.approx(1.0)
+
+    def test_view_is_snapshot(self, portfolio, make_item):
+        """Test a view is unaffected by later changes to the parent."""
+        view = portfolio.filter_by_sector('Retail')
+        portfolio.remove('P2')
+        portfolio.add(make_item('P6', sector='Retail'))
+
+        assert [item.item_id for item in view] == ['P2', 'P3']
+        assert view.sector_distribution() == {'Retail': 2}
+
+    def test_to_portfolio(self, portfolio):
+        """Test a view can be materialized into a mutable Portfolio."""
+        subset = portfolio.filter_by_sector('Retail').to_portfolio()
+        subset.remove('P3')
+
+        assert isinstance(subset, Portfolio)
+        assert len(subset) == 1
+        assert len(portfolio) == 4
+
+    def test_iter_items(self, portfolio):
+        """Test iter_items yields the items without copying the list."""
+        assert list(portfolio.iter_items()) == portfolio.items()
+        assert [item.item_id for item in portfolio.filter_by_sector('Retail').iter_items()] == ['P2', 'P3']
+
+    def test_total_exposure_decimal_follows_changes(self, portfolio, make_item):
+        """Test the cached Decimal total is invalidated by add, remove and refresh."""
+        before = portfolio.total_exposure_decimal()
+
+        portfolio.add(make_item('P5', outstanding_amount=Decimal('0.10')))
+        assert portfolio.total_exposure_decimal() == before + Decimal('0.10')
+
+        portfolio.remove('P5')
+        assert portfolio.total_exposure_decimal() == before
+
+        portfolio['P1'].undrawn_commitment = Decimal('5')
+        portfolio.refresh()
+        assert portfolio.total_exposure_decimal() == before + Decimal('5')
+        assert portfolio.filter_by_sector('Retail').total_exposure_decimal() == Decimal('190000.50')
+
+    def test_total_exposure_decimal_matches_float_snapshot(self, portfolio):
+        """Test the Decimal and float totals come from the same snapshot of the items."""
+        before = portfolio.total_exposure_decimal()
+
+        portfolio['P1'].outstanding_amount = Decimal('500000')
+
+        assert portfolio.total_exposure_decimal() == before
+        assert float(portfolio.total_exposure_decimal()) == pytest.approx(portfolio.total_exposure())
+
+        portfolio.refresh()
+
+        assert portfolio.total_exposure_decimal() == before + Decimal('400000')
+        assert float(portfolio.total_exposure_decimal()) == pytest.approx(portfolio.total_exposure())
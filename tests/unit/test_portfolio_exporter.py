@@ -0,0 +1,166 @@
+"""Unit tests for portfolio and ECL result export."""
+
+import json
+import pytest
+from decimal import Decimal
+
+import pandas as pd
+
+from core.ecl_engine import ECLCalculationEngine
+from data_management import portfolio_exporter
+from data_management.portfolio_exporter import PortfolioExporter
+from models.enums import Stage
+from models.portfolio_item import PortfolioItem
+
+
+@pytest.fixture
+def items(make_item):
+    """Create items with optional fields both set and missing."""
+    return [
+        make_item('E1', credit_score=780, collateral_value=Decimal('125000.50'),
+                  collateral_type='Real Estate', sector='Real Estate'),
+        make_item('E2', undrawn_commitment=Decimal('50000'), product_type='Revolving Credit',
+                  current_stage=Stage.STAGE_2, previous_stage=Stage.STAGE_1,
+                  days_past_due=35, origination_pd=0.01),
+        make_item('E3', current_stage=Stage.STAGE_3, days_past_due=120, is_forborne=True),
+    ]
+
+
+@pytest.fixture
+def portfolio_result(items):
+    """Calculate a portfolio ECL result."""
+    return ECLCalculationEngine().calculate_portfolio_ecl(items)
+
+
+class TestJSONExport:
+    """Tests for JSON exports."""
+
+    @pytest.mark.parametrize("indent", [0, 2, 4])
+    def test_portfolio_round_trip(self, items, tmp_path, indent):
+        """Test exported portfolio JSON matches item dictionaries."""
+        path = tmp_path / 'out' / 'portfolio.json'
+
+        PortfolioExporter.export_portfolio_to_json(items, str(path), indent=indent)
+
+        assert json.loads(path.read_text()) == [item.to_dict() for item in items]
+
+    def test_ecl_results_round_trip(self, portfolio_result, tmp_path):
+        """Test exported ECL results JSON matches result dictionaries."""
+        path = tmp_path / 'results.json'
+
+        PortfolioExporter.export_ecl_results_to_json(portfolio_result.item_results, str(path))
+
+        assert json.loads(path.read_text()) == [r.to_dict() for r in portfolio_result.item_results]
+
+    def test_portfolio_ecl_includes_detailed_results(self, portfolio_result, tmp_path):
+        """Test portfolio ECL JSON contains the summary and detailed results."""
+        path = tmp_path / 'portfolio_ecl.json'
+
+        PortfolioExporter.export_portfolio_ecl_to_json(portfolio_result, str(path))
+
+        data = json.loads(path.read_text())
+        assert data['total_ecl'] == float(portfolio_result.total_ecl)
+        assert data['ecl_by_sector'] == {k: float(v) for k, v in portfolio_result.ecl_by_sector.items()}
+        assert data['detailed_results'] == [r.to_dict() for r in portfolio_result.item_results]
+
+    @pytest.mark.parametrize("indent", [None, 0, 2, 4])
+    @pytest.mark.parametrize("use_orjson", [False, True])
+    def test_streamed_items_match_full_dump(self, portfolio_result, tmp_path, monkeypatch, indent, use_orjson):
+        """Test streamed detailed results give the same text as a single dump."""
+        if use_orjson:
+            pytest.importorskip('orjson')
+        monkeypatch.setattr(portfolio_exporter, 'ORJSON_AVAILABLE', use_orjson)
+        monkeypatch.setattr(portfolio_exporter, 'JSON_ITEM_BATCH_SIZE', 2)
+        data = portfolio_result.to_dict()
+        details = [r.to_dict() for r in portfolio_result.item_results]
+
+        portfolio_exporter._write_json_with_items(data, 'detailed_results', iter(details),
+                                                  tmp_path / 'streamed.json', indent)
+        portfolio_exporter._write_json({**data, 'detailed_results': details}, tmp_path / 'full.json', indent)
+
+        assert (tmp_path / 'streamed.json').read_bytes() == (tmp_path / 'full.json').read_bytes()
+
+
+class TestCSVExport:
+    """Tests for CSV exports."""
+
+    def test_portfolio_matches_pandas(self, items, tmp_path):
+        """Test streamed portfolio CSV matches pandas output."""
+        path = tmp_path / 'out' / 'portfolio.csv'
+
+        PortfolioExporter.export_portfolio_to_csv(items, str(path))
+
+        assert path.read_text() == pd.DataFrame([item.to_dict() for item in items]).to_csv(index=False)
+
+    def test_ecl_results_match_pandas(self, portfolio_result, tmp_path):
+        """Test streamed ECL results CSV matches pandas output."""
+        path = tmp_path / 'results.csv'
+
+        PortfolioExporter.export_ecl_results_to_csv(portfolio_result.item_results, str(path))
+
+        expected = pd.DataFrame([r.to_dict() for r in portfolio_result.item_results]).to_csv(index=False)
+        assert path.read_text() == expected
+
+    def test_output_directory_recreated(self, items, tmp_path, monkeypatch):
+        """Test relative output directories are created again after a move or removal."""
+        monkeypatch.chdir(tmp_path)
+        PortfolioExporter.export_portfolio_to_csv(items, 'out/first.csv')
+        (tmp_path / 'out' / 'first.csv').unlink()
+        (tmp_path / 'out').rmdir()
+        PortfolioExporter.export_portfolio_to_csv(items, 'out/second.csv')
+
+        monkeypatch.chdir(tmp_path / 'out')
+        PortfolioExporter.export_portfolio_to_csv(items, 'out/third.csv')
+
+        assert (tmp_path / 'out' / 'second.csv').exists()
+        assert (tmp_path / 'out' / 'out' / 'third.csv').exists()
+
+    def test_empty(self, tmp_path):
+        """Test exporting no items writes just the header."""
+        path = tmp_path / 'empty.csv'
+
+        PortfolioExporter.export_portfolio_to_csv([], str(path))
+
+        assert path.read_text() == ','.join(PortfolioItem.FIELDS) + '\n'
+
+
+class TestExcelExport:
+    """Tests for Excel exports."""
+
+    @pytest.fixture(autouse=True)
+    def _requires_excel_engines(self):
+        """Skip when the Excel engines are not installed."""
+        pytest.importorskip('openpyxl')
+        pytest.importorskip('xlsxwriter')
+
+    def test_streamed_portfolio_matches_default(self, items, tmp_path, monkeypatch):
+        """Test streamed portfolio export matches the default writer."""
+        PortfolioExporter.export_portfolio_to_excel(items, str(tmp_path / 'default.xlsx'))
+        monkeypatch.setattr(portfolio_exporter, 'EXCEL_STREAMING_THRESHOLD', 0)
+        PortfolioExporter.export_portfolio_to_excel(items, str(tmp_path / 'streamed.xlsx'))
+
+        default = pd.read_excel(tmp_path / 'default.xlsx', sheet_name='Portfolio')
+        streamed = pd.read_excel(tmp_path / 'streamed.xlsx', sheet_name='Portfolio')
+
+        pd.testing.assert_frame_equal(streamed, default)
+        assert streamed['item_id'].tolist() == ['E1', 'E2', 'E3']
+        assert streamed['collateral_value'][0] == 125000.5
+
+    def test_portfolio_ecl_sheets(self, portfolio_result, tmp_path):
+        """Test multi-sheet export writes every sheet with pandas-readable values."""
+        path = tmp_path / 'portfolio_ecl.xlsx'
+        PortfolioExporter.export_portfolio_ecl_to_excel(portfolio_result, str(path))
+        PortfolioExporter.export_ecl_results_to_excel(portfolio_result.item_results, str(tmp_path / 'results.xlsx'))
+
+        sheets = pd.read_excel(path, sheet_name=None)
+
+        assert list(sheets) == ['Summary', 'Stage Breakdown', 'By Sector', 'By Product', 'Detailed Results']
+        assert sheets['Stage Breakdown']['Count'].tolist() == [
+            portfolio_result.stage_1_count, portfolio_result.stage_2_count, portfolio_result.stage_3_count,
+        ]
+        assert sheets['By Sector'].set_index('Sector')['ECL'].to_dict() == pytest.approx(
+            {k: float(v) for k, v in portfolio_result.ecl_by_sector.items()}
+        )
+        pd.testing.assert_frame_equal(
+            sheets['Detailed Results'], pd.read_excel(tmp_path / 'results.xlsx', sheet_name='ECL Results')
+        )
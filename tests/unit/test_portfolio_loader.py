@@ -0,0 +1,278 @@
+"""Unit tests for portfolio loading."""
+
+import pytest
+from datetime import date, datetime
+from decimal import Decimal
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from data_management import portfolio_loader
+from data_management.portfolio_loader import PortfolioLoader
+from models.enums import Stage
+
+
+SAMPLE_CSV = Path(__file__).parents[2] / 'examples' / 'sample_portfolio.csv'
+
+
+@pytest.fixture
+def df():
+    """Create a DataFrame using column aliases and missing values."""
+    return pd.DataFrame({
+        'loan_id': ['L1', 'L2', 'L3'],
+        'client_id': ['C1', 'C2', 'C3'],
+        'start_date': ['2020-01-15', '2021-06-01', None],
+        'end_date': ['2030-01-15', '2026-06-01', '2029-01-01'],
+        'as_of_date': ['2024-01-01', None, '2024-01-01'],
+        'balance': [1000.5, np.nan, 300],
+        'undrawn': [None, 250.25, 0],
+        'score': [720, None, 610],
+        'dpd': [0, 45, 5],
+        'stage': ['Stage 1', '2', 'Stage 3'],
+        'forborne': [False, True, None],
+        'sector': ['Retail', None, 'Energy'],
+        'initial_pd': [0.01, None, 0.02],
+    })
+
+
+class TestLoadFromDataFrame:
+    """Tests for converting DataFrames to portfolio items."""
+
+    def test_aliases_and_values(self, df):
+        """Test aliased columns are mapped and values converted."""
+        first, second = PortfolioLoader.load_from_dataframe(df)
+
+        assert first.item_id == 'L1'
+        assert first.borrower_id == 'C1'
+        assert first.origination_date == date(2020, 1, 15)
+        assert first.reporting_date == date(2024, 1, 1)
+        assert first.outstanding_amount == Decimal('1000.5')
+        assert first.credit_score == 720
+        assert first.origination_pd == 0.01
+        assert second.current_stage == Stage.STAGE_2
+        assert second.undrawn_commitment == Decimal('250.25')
+        assert second.is_forborne is True
+
+    def test_missing_values_use_defaults(self, df):
+        """Test null cells fall back to PortfolioItem defaults."""
+        _, second = PortfolioLoader.load_from_dataframe(df)
+
+        assert second.outstanding_amount == Decimal('0')
+        assert second.credit_score == 500
+        assert second.sector == 'Other'
+        assert second.origination_pd is None
+
+    def test_invalid_rows_are_skipped(self, df):
+        """Test rows that cannot be converted are skipped."""
+        items = PortfolioLoader.load_from_dataframe(df)
+
+        assert [item.item_id for item in items] == ['L1', 'L2']
+
+    def test_date_columns(self, df):
+        """Test datetime, mixed-format and unparseable date columns."""
+        df['start_date'] = ['2020-01-15', '15 June 2021', 'not a date']
+        df['end_date'] = pd.to_datetime(df['end_date'])
+
+        items = PortfolioLoader.load_from_dataframe(df)
+
+        assert [item.origination_date for item in items] == [date(2020, 1, 15), date(2021, 6, 15)]
+        assert type(items[0].maturity_date) is date
+        assert items[1].reporting_date == date.today()
+
+    @pytest.mark.parametrize("balance", [
+        [1234567.891, 0.1, 300.0],
+        [1000, 25, 300],
+        ['1234567.891', '0.1', '300.0'],
+    ])
+    def test_amounts_keep_digits(self, df, balance):
+        """Test float, integer and text amounts convert to exact Decimals."""
+        df['balance'] = balance
+
+        items = PortfolioLoader.load_from_dataframe(df)
+
+        assert [item.outstanding_amount for item in items] == [Decimal(str(v)) for v in balance[:2]]
+        assert items[0].undrawn_commitment == Decimal('0')
+
+    def test_row_builder_per_schema(self, df):
+        """Test row builders are reused for a schema and skip absent columns."""
+        PortfolioLoader.load_from_dataframe(df)
+        factories = len(portfolio_loader._ROW_BUILDER_FACTORIES)
+
+        PortfolioLoader.load_from_dataframe(df.copy())
+        assert len(portfolio_loader._ROW_BUILDER_FACTORIES) == factories
+
+        first, second = PortfolioLoader.load_from_dataframe(df.drop(columns=['score', 'sector', 'undrawn']))
+        assert len(portfolio_loader._ROW_BUILDER_FACTORIES) == factories + 1
+        assert (first.credit_score, first.sector, first.undrawn_commitment) == (500, 'Other', Decimal('0'))
+        assert second.current_stage == Stage.STAGE_2
+
+    def test_custom_mapping(self, df):
+        """Test custom mapping overrides the default aliases."""
+        df = df.rename(columns={'balance': 'principal'})
+
+        items = PortfolioLoader.load_from_dataframe(df, column_mapping={'principal': 'outstanding_amount'})
+
+        assert items[0].outstanding_amount == Decimal('1000.5')
+
+
+class TestColumnMapping:
+    """Tests for standardizing column names."""
+
+    def test_renames_without_copying(self, df):
+        """Test aliases are renamed on a frame sharing the input's data."""
+        original = list(df.columns)
+
+        mapped = PortfolioLoader._apply_column_mapping(df, {'dpd': 'days_past_due'})
+
+        assert list(df.columns) == original
+        assert {'item_id', 'borrower_id', 'outstanding_amount', 'days_past_due'} <= set(mapped.columns)
+        assert np.shares_memory(mapped['outstanding_amount'].to_numpy(), df['balance'].to_numpy())
+
+
+    def test_first_listed_alias_wins(self, df):
+        """Test only the highest-priority alias present is mapped."""
+        df['exposure'] = 1.0
+        df['outstanding'] = 2.0
+
+        mapped = PortfolioLoader._apply_column_mapping(df)
+
+        assert list(mapped.columns).count('outstanding_amount') == 1
+        assert (mapped['outstanding_amount'] == 2.0).all()
+        assert {'balance', 'exposure'} <= set(mapped.columns)
+
+
+class TestParseDate:
+    """Tests for scalar date parsing."""
+
+    @pytest.mark.parametrize("value", [
+        '2024-01-15', '15 January 2024', date(2024, 1, 15), datetime(2024, 1, 15, 9, 30),
+        pd.Timestamp('2024-01-15 09:30'), np.datetime64('2024-01-15'),
+    ])
+    def test_values(self, value):
+        """Test supported types parse to a plain date."""
+        parsed = PortfolioLoader._parse_date(value)
+
+        assert type(parsed) is date
+        assert parsed == date(2024, 1, 15)
+
+    @pytest.mark.parametrize("value", [None, np.nan, pd.NaT, '', 'not a date', 20240115])
+    def test_invalid(self, value):
+        """Test missing and unparseable values raise ValueError."""
+        with pytest.raises(ValueError):
+            PortfolioLoader._parse_date(value)
+
+
+class TestParseStage:
+    """Tests for stage label parsing."""
+
+    @pytest.mark.parametrize("label,stage", [
+        ('Stage 1', Stage.STAGE_1), ('2', Stage.STAGE_2), (' stage_3 ', Stage.STAGE_3),
+        ('STAGE2', Stage.STAGE_2), ('IFRS9 Stage 2 (watchlist)', Stage.STAGE_2), (3, Stage.STAGE_3),
+    ])
+    def test_labels(self, label, stage):
+        """Test scalar and column parsing accept the same labels."""
+        column = PortfolioLoader._parse_stage_column(pd.Series([label], dtype=object))
+
+        assert PortfolioLoader._parse_stage(label) == stage
+        assert PortfolioLoader._parse_stage(column[0]) == stage
+
+    def test_unknown_label(self):
+        """Test unrecognized labels raise ValueError."""
+        with pytest.raises(ValueError):
+            PortfolioLoader._parse_stage('Stage 4')
+
+
+class TestLoadFromCSV:
+    """Tests for loading portfolios from CSV files."""
+
+    def test_sample_portfolio(self):
+        """Test the sample portfolio loads every row."""
+        items = PortfolioLoader.load_from_csv(str(SAMPLE_CSV))
+
+        assert len(items) == len(pd.read_csv(SAMPLE_CSV))
+        assert items[0].item_id == 'LOAN001'
+        assert items[0].outstanding_amount == Decimal('1000000')
+        assert items[1].current_stage == Stage.STAGE_2
+
+    def test_identifiers_kept_as_text(self, tmp_path):
+        """Test numeric-looking IDs keep leading zeros and dates are parsed."""
+        path = tmp_path / 'portfolio.csv'
+        path.write_text(
+            "loan_id,client_id,start_date,end_date,as_of_date,balance\n"
+            "00123,0042,2020-01-15,2030-01-15,2024-01-01,1000\n"
+            "00124,0043,2021-06-01,2031-06-01,,2000\n"
+        )
+
+        items = PortfolioLoader.load_from_csv(str(path))
+
+        assert [(item.item_id, item.borrower_id) for item in items] == [('00123', '0042'), ('00124', '0043')]
+        assert items[0].reporting_date == date(2024, 1, 1)
+        assert items[1].maturity_date == date(2031, 6, 1)
+
+    def test_caller_dtype_takes_precedence(self, tmp_path):
+        """Test explicit read_csv options override the loader's hints."""
+        path = tmp_path / 'portfolio.csv'
+        path.write_text("item_id,borrower_id,origination_date,maturity_date\n007,1,2020-01-15,2030-01-15\n")
+
+        items = PortfolioLoader.load_from_csv(str(path), dtype={'item_id': 'int64'})
+
+        assert items[0].item_id == '7'
+
+    def test_missing_file(self, tmp_path):
+        """Test a missing file raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            PortfolioLoader.load_from_csv(str(tmp_path / 'missing.csv'))
+
+
+class TestLoadFromExcel:
+    """Tests for loading portfolios from Excel and Parquet files."""
+
+    @pytest.fixture
+    def sample(self):
+        """Load the sample portfolio as a DataFrame."""
+        return pd.read_csv(SAMPLE_CSV)
+
+    @pytest.fixture
+    def xlsx_path(self, sample, tmp_path):
+        """Write the sample portfolio to an Excel workbook."""
+        pytest.importorskip('openpyxl')
+        path = tmp_path / 'portfolio.xlsx'
+        sample.to_excel(path, sheet_name='Loans', index=False)
+        return path
+
+    @pytest.mark.parametrize("engine", [None, 'openpyxl'])
+    def test_matches_csv(self, xlsx_path, engine):
+        """Test Excel loading gives the same items as the CSV."""
+        items = PortfolioLoader.load_from_excel(str(xlsx_path), sheet_name='Loans', engine=engine)
+
+        assert items == PortfolioLoader.load_from_csv(str(SAMPLE_CSV))
+
+    @pytest.mark.parametrize("version, supported", [
+        ('2.1.0', False), ('2.1.4', False), ('2.2.0rc0', True), ('2.2.3', True), ('3.0.0', True),
+    ])
+    def test_calamine_needs_pandas_2_2(self, version, supported):
+        """Test calamine is only the default engine on pandas versions that have it."""
+        assert portfolio_loader._pandas_supports_calamine(version) is supported
+
+    def test_parquet_cache(self, xlsx_path):
+        """Test the parquet cache is written and read while it is current."""
+        pytest.importorskip('pyarrow')
+        cache_path = xlsx_path.with_name('portfolio.Loans.parquet')
+
+        first = PortfolioLoader.load_from_excel(str(xlsx_path), sheet_name='Loans', cache_parquet=True)
+        assert cache_path.exists()
+
+        # A newer cache is used in place of the workbook
+        pd.read_parquet(cache_path).head(3).to_parquet(cache_path, index=False)
+        cached = PortfolioLoader.load_from_excel(str(xlsx_path), sheet_name='Loans', cache_parquet=True)
+
+        assert cached == first[:3]
+
+    def test_load_from_parquet(self, sample, tmp_path):
+        """Test Parquet loading gives the same items as the CSV."""
+        pytest.importorskip('pyarrow')
+        path = tmp_path / 'portfolio.parquet'
+        sample.to_parquet(path, index=False)
+
+        assert PortfolioLoader.load_from_parquet(str(path)) == PortfolioLoader.load_from_csv(str(SAMPLE_CSV))
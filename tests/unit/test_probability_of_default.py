@@ -0,0 +1,151 @@
+"""Unit tests for PD calculations."""
+
+import numpy as np
+import pytest
+from datetime import date
+
+from core.probability_of_default import PDCalculator
+from models.enums import STAGE_CODES
+from models.portfolio_array import PortfolioArray
+
+
+@pytest.fixture
+def calculator():
+    """Create PD calculator."""
+    return PDCalculator()
+
+
+@pytest.fixture
+def items(make_item):
+    """Create items across score range and every DPD bucket."""
+    return [
+        make_item('D1', credit_score=850),
+        make_item('D2', credit_score=250),
+        make_item('D3', credit_score=700, days_past_due=30),
+        make_item('D4', credit_score=650, days_past_due=31, times_past_due_12m=1),
+        make_item('D5', credit_score=600, days_past_due=60, is_forborne=True),
+        make_item('D6', credit_score=550, days_past_due=90, times_past_due_12m=3),
+        make_item('D7', credit_score=500, days_past_due=91, is_restructured=True),
+        make_item('D8', credit_score=320, days_past_due=400, times_past_due_12m=5, is_forborne=True),
+    ]
+
+
+class TestCalculate12mPDBatch:
+    """Tests for the vectorized 12-month PD calculation."""
+
+    def test_matches_scalar(self, calculator, items):
+        """Test batch PDs match item-by-item calculation."""
+        expected = [calculator.calculate_12m_pd(item) for item in items]
+
+        assert calculator.calculate_12m_pd_batch(items).tolist() == pytest.approx(expected, rel=1e-12)
+
+    def test_base_pd_override(self, calculator, items):
+        """Test override replaces the score-based PD before adjustments."""
+        expected = [calculator.calculate_12m_pd(item, base_pd_override=0.02) for item in items]
+
+        actual = calculator.calculate_12m_pd_batch(items, base_pd_override=0.02)
+
+        assert actual.tolist() == pytest.approx(expected, rel=1e-12)
+
+    def test_empty(self, calculator):
+        """Test batch calculation with no items."""
+        assert calculator.calculate_12m_pd_batch([]).shape == (0,)
+
+    def test_portfolio_columns(self, calculator, items):
+        """Test PDs from prebuilt portfolio columns match PDs from the items."""
+        portfolio = PortfolioArray.from_items(items)
+
+        actual = calculator.calculate_12m_pd_batch(items, portfolio=portfolio)
+
+        assert actual.tolist() == calculator.calculate_12m_pd_batch(items).tolist()
+
+
+class TestPerformanceAdjustment:
+    """Tests for performance-based PD adjustments."""
+
+    @pytest.mark.parametrize("dpd,multiplier", [
+        (-1, 1.0), (0, 1.0), (1, 1.5), (30, 1.5), (31, 2.0),
+        (60, 2.0), (61, 3.0), (90, 3.0), (91, 5.0), (365, 5.0),
+    ])
+    def test_dpd_buckets(self, calculator, dpd, multiplier, make_item):
+        """Test DPD bucket boundaries are inclusive upper bounds."""
+        item = make_item('DPD', days_past_due=dpd)
+
+        assert calculator._adjust_pd_for_performance(0.01, item) == pytest.approx(0.01 * multiplier)
+        assert calculator.calculate_12m_pd_batch([item])[0] == pytest.approx(calculator.calculate_12m_pd(item))
+
+
+class TestCreditScoreToPD:
+    """Tests for the credit score to PD mapping."""
+
+    @pytest.mark.parametrize("score", [200, 300, 301, 575, 700, 849, 850, 900])
+    def test_table_matches_formula(self, calculator, score):
+        """Test table lookup matches the logistic formula, clamped to the range."""
+        assert calculator._credit_score_to_pd(score) == pytest.approx(
+            calculator._credit_score_to_pd(float(score)), rel=1e-12
+        )
+
+    def test_table_follows_score_range(self, calculator):
+        """Test the table is rebuilt when the score range changes."""
+        before = calculator._credit_score_to_pd(600)
+        calculator.credit_score_max = 900
+
+        assert calculator._credit_score_to_pd(600) > before
+        assert calculator._credit_score_to_pd(600) == pytest.approx(
+            calculator._credit_score_to_pd(600.0), rel=1e-12
+        )
+
+
+class TestLifetimePD:
+    """Tests for lifetime PD calculation."""
+
+    @pytest.mark.parametrize("kwargs", [
+        dict(credit_score=820),
+        dict(credit_score=600, days_past_due=45, current_stage='Stage 2'),
+        dict(credit_score=320, days_past_due=120, current_stage='Stage 3'),
+        dict(credit_score=700, maturity_date=date(2054, 1, 1)),
+    ])
+    def test_closed_form_matches_curve_sum(self, calculator, kwargs, make_item):
+        """Test closed-form lifetime PD equals the sum of the marginal curve."""
+        item = make_item('LT', **kwargs)
+        pd_12m = calculator.calculate_12m_pd(item)
+        curve = calculator.get_marginal_pd_curve(item, pd_12m, item.remaining_term_months)
+
+        lifetime_pd = calculator.calculate_lifetime_pd(item)
+
+        assert lifetime_pd == pytest.approx(float(curve.sum()), rel=1e-12)
+        assert lifetime_pd == pytest.approx(calculator.calculate_lifetime_pd(item, marginal_pds=curve), rel=1e-12)
+
+    def test_short_term_uses_12m_pd(self, calculator, make_item):
+        """Test items maturing within 12 months use the 12-month PD."""
+        item = make_item('ST', maturity_date=date(2024, 10, 1))
+
+        assert calculator.calculate_lifetime_pd(item) == calculator.calculate_12m_pd(item)
+
+
+class TestMarginalPDCurvesBatch:
+    """Tests for the batched marginal PD curves."""
+
+    def test_rows_match_scalar_curves(self, calculator, items):
+        """Test each row matches the item's scalar curve, zero-padded."""
+        pd_12m = calculator.calculate_12m_pd_batch(items)
+        stage_codes = np.array([STAGE_CODES[item.current_stage] for item in items])
+        horizon = np.array([item.remaining_term_months for item in items])
+
+        curves = calculator.get_marginal_pd_curves_batch(pd_12m, stage_codes, horizon)
+
+        for row, item, pd in zip(curves, items, pd_12m):
+            expected = calculator.get_marginal_pd_curve(item, pd, item.remaining_term_months)
+            np.testing.assert_allclose(row[:len(expected)], expected, rtol=1e-12)
+            assert not row[len(expected):].any()
+        np.testing.assert_allclose(
+            curves.sum(axis=1),
+            calculator.calculate_cumulative_pd_batch(pd_12m, stage_codes, horizon),
+            rtol=1e-12
+        )
+
+    def test_empty(self, calculator):
+        """Test batched curves with no items."""
+        empty = np.array([], dtype=np.float64)
+
+        assert calculator.get_marginal_pd_curves_batch(empty, empty.astype(int), empty).shape == (0, 0)
@@ -0,0 +1,148 @@
+"""Unit tests for the IFRS 9 staging framework."""
+
+import copy
+import pytest
+from decimal import Decimal
+
+from core.probability_of_default import PDCalculator
+from core.portfolio import Portfolio
+from core.staging_framework import StagingFramework
+from models.enums import Stage, STAGE_CODES
+from models.portfolio_array import PortfolioArray
+
+
+@pytest.fixture
+def framework():
+    """Create staging framework."""
+    return StagingFramework()
+
+
+@pytest.fixture
+def items(make_item):
+    """Create items covering every staging rule."""
+    return [
+        make_item('S1', credit_score=780),
+        make_item('S2', days_past_due=95),
+        make_item('S3', days_past_due=5, is_forborne=True),
+        make_item('S4', days_past_due=45, is_restructured=True),
+        make_item('S5', days_past_due=31),
+        make_item('S6', times_past_due_12m=2),
+        make_item('S7', is_restructured=True),
+        make_item('S8', credit_score=600, origination_pd=0.001),
+        make_item('S9', credit_score=800, origination_pd=0.0005),
+        make_item('S10', credit_score=700, origination_pd=0.0),
+        make_item('S11', current_stage=Stage.STAGE_3, credit_score=720),
+    ]
+
+
+class TestStageMigration:
+    """Tests for portfolio stage migration."""
+
+    @pytest.mark.parametrize("use_pd", [False, True])
+    def test_matches_classify_stage(self, framework, items, use_pd):
+        """Test batch migration matches item-by-item classification."""
+        pd_calculator = PDCalculator() if use_pd else None
+        expected = [
+            framework.classify_stage(item, pd_calculator.calculate_12m_pd(item) if use_pd else None)
+            for item in items
+        ]
+
+        updated, _ = framework.perform_stage_migration(copy.deepcopy(items), pd_calculator)
+
+        assert [item.current_stage for item in updated] == expected
+
+    def test_migration_statistics(self, framework, items):
+        """Test previous stage is recorded and migrations are counted."""
+        updated, stats = framework.perform_stage_migration(items)
+
+        assert updated[1].previous_stage == Stage.STAGE_1
+        assert updated[1].current_stage == Stage.STAGE_3
+        assert sum(stats.values()) == len(items)
+        assert stats['Stage 3_to_Stage 1'] == 1
+
+    def test_transition_counts(self, framework, items):
+        """Test statistics count every (previous, new) stage transition."""
+        previous = [item.current_stage for item in items]
+
+        updated, stats = framework.perform_stage_migration(items)
+
+        expected = {}
+        for before, item in zip(previous, updated):
+            key = f"{before}_to_{item.current_stage}"
+            expected[key] = expected.get(key, 0) + 1
+        assert stats == expected
+
+    def test_migrates_portfolio_in_place(self, framework, items):
+        """Test migration accepts a Portfolio and updates its items."""
+        portfolio = Portfolio(items)
+
+        updated, _ = framework.perform_stage_migration(portfolio)
+
+        assert updated == items
+        assert portfolio['S2'].current_stage == Stage.STAGE_3
+
+    def test_empty_portfolio(self, framework):
+        """Test migration of an empty portfolio."""
+        assert framework.perform_stage_migration([]) == ([], {})
+
+
+class TestStageSummary:
+    """Tests for stage summary statistics."""
+
+    def test_counts_and_exposure(self, framework, make_item):
+        """Test counts, exposure and percentages per stage."""
+        items = [
+            make_item('A', undrawn_commitment=Decimal('50000')),
+            make_item('B', current_stage=Stage.STAGE_3, outstanding_amount=Decimal('50000')),
+        ]
+
+        summary = framework.get_stage_summary(items)
+
+        assert summary['stage_1'] == {'count': 1, 'exposure': 150000.0, 'exposure_pct': pytest.approx(75.0)}
+        assert summary['stage_2'] == {'count': 0, 'exposure': 0.0, 'exposure_pct': 0.0}
+        assert summary['stage_3']['exposure_pct'] == pytest.approx(25.0)
+        assert summary['total'] == {'count': 2, 'exposure': 200000.0}
+
+    def test_empty(self, framework):
+        """Test summary of no items."""
+        summary = framework.get_stage_summary([])
+
+        assert summary['total'] == {'count': 0, 'exposure': 0.0}
+        assert summary['stage_1']['exposure_pct'] == 0
+
+    def test_accepts_portfolio_and_iterables(self, framework, items):
+        """Test summary accepts a Portfolio or a one-shot iterator."""
+        expected = framework.get_stage_summary(items)
+
+        assert framework.get_stage_summary(Portfolio(list(items))) == expected
+        assert framework.get_stage_summary(iter(items)) == expected
+
+
+class TestClassifyStageBatch:
+    """Tests for vectorized stage classification."""
+
+    def test_matches_classify_stage(self, framework, items):
+        """Test batch stage codes match item-by-item classification."""
+        pd_calculator = PDCalculator()
+        current_pds = pd_calculator.calculate_12m_pd_batch(items)
+
+        codes = framework.classify_stage_batch(items, current_pds)
+
+        expected = [framework.classify_stage(item, pd) for item, pd in zip(items, current_pds)]
+        assert [STAGE_CODES[stage] for stage in expected] == codes.tolist()
+
+    def test_portfolio_columns(self, framework, items):
+        """Test codes from prebuilt portfolio columns match codes from the items."""
+        current_pds = PDCalculator().calculate_12m_pd_batch(items)
+        portfolio = PortfolioArray.from_items(items)
+
+        codes = framework.classify_stage_batch(items, current_pds, portfolio=portfolio)
+
+        assert codes.dtype == portfolio.stage_code.dtype
+        assert codes.tolist() == framework.classify_stage_batch(items, current_pds).tolist()
+
+    def test_does_not_modify_items(self, framework, items):
+        """Test batch classification leaves item stages unchanged."""
+        framework.classify_stage_batch(items)
+
+        assert items[1].current_stage == Stage.STAGE_1
@@ -0,0 +1,207 @@
+"""Unit tests for portfolio validation."""
+
+import pytest
+from datetime import date, timedelta
+from decimal import Decimal
+
+from core.portfolio import Portfolio
+from data_management import validation
+from data_management.validation import (
+    PortfolioValidator, ValidationError, iter_valid_items, validate_and_filter_portfolio,
+)
+from models.enums import Stage
+from utils.jit import NUMBA_AVAILABLE
+
+
+@pytest.fixture
+def items(make_item):
+    """Create valid items and items breaking each validation rule."""
+    return [
+        make_item('V1'),
+        make_item('V2', collateral_value=Decimal('50000'), collateral_type='Real Estate',
+                  current_stage=Stage.STAGE_2, is_forborne=True, origination_pd=0.02),
+        make_item('V3', borrower_id=''),
+        make_item('V4', outstanding_amount=Decimal('-1')),
+        make_item('V5', undrawn_commitment=Decimal('-0.01'), collateral_value=Decimal('-5')),
+        make_item('V6', interest_rate=-0.5),
+        make_item('V7', interest_rate=150.0),
+        make_item('V8', origination_date=date(2028, 1, 1)),
+        make_item('V9', origination_date=date.today() + timedelta(days=30),
+                  maturity_date=date.today() + timedelta(days=3000)),
+        make_item('V10', reporting_date=date(2020, 6, 1)),
+        make_item('V11', credit_score=299),
+        make_item('V12', credit_score=851, origination_pd=1.5, previous_pd=-0.1),
+        make_item('V13', previous_pd=float('nan')),
+        make_item('V14', days_past_due=-1, times_past_due_12m=-2),
+        make_item('V15', days_past_due=91, current_stage=Stage.STAGE_2),
+        make_item('V16', is_restructured=True),
+        make_item('V17', collateral_value=Decimal('1000')),
+        make_item('V18', reporting_date=date(2029, 1, 1)),
+        make_item('V19', days_past_due=120, current_stage=Stage.STAGE_3, credit_score=300),
+    ]
+
+
+class TestValidatePortfolio:
+    """Tests for portfolio-wide validation."""
+
+    def test_matches_validate_item(self, items):
+        """Test results match item-by-item validation."""
+        expected = [
+            (item.item_id, errors)
+            for item in items
+            for is_valid, errors in [PortfolioValidator.validate_item(item, raise_on_error=False)]
+            if not is_valid
+        ]
+
+        valid_count, invalid_count, errors = PortfolioValidator.validate_portfolio(items)
+
+        assert errors == expected
+        assert (valid_count, invalid_count) == (3, len(items) - 3)
+
+    @pytest.mark.parametrize("use_numba", [False, True])
+    def test_flags_cover_every_invalid_item(self, items, monkeypatch, use_numba):
+        """Test flagged items are exactly those validate_item rejects."""
+        if use_numba and not NUMBA_AVAILABLE:
+            pytest.skip("Numba not installed")
+        monkeypatch.setattr(validation, 'NUMBA_AVAILABLE', use_numba)
+
+        flags = PortfolioValidator.flag_invalid(items)
+
+        expected = [not PortfolioValidator.validate_item(item, raise_on_error=False)[0] for item in items]
+        assert flags.tolist() == expected
+
+    def test_negative_zero_is_rechecked(self, make_item):
+        """Test a flagged negative-zero amount is still reported valid."""
+        item = make_item('Z', undrawn_commitment=Decimal('-0'))
+
+        assert PortfolioValidator.flag_invalid([item]).tolist() == [True]
+        assert PortfolioValidator.validate_portfolio([item]) == (1, 0, [])
+
+    def test_raise_on_error(self, items):
+        """Test the first invalid item raises when requested."""
+        with pytest.raises(ValidationError, match="item V3"):
+            PortfolioValidator.validate_portfolio(items, raise_on_error=True)
+
+    def test_accepts_portfolio(self, items):
+        """Test a Portfolio validates like its item list."""
+        assert PortfolioValidator.validate_portfolio(Portfolio(items)) == \
+            PortfolioValidator.validate_portfolio(items)
+
+    def test_empty(self):
+        """Test validating no items."""
+        assert PortfolioValidator.validate_portfolio([]) == (0, 0, [])
+
+    def test_compact_matches_validate_portfolio(self, items):
+        """Test compact results join each item's errors from the full results."""
+        valid_count, invalid_count, errors = PortfolioValidator.validate_portfolio(items)
+
+        assert PortfolioValidator.validate_portfolio_compact(items) == (
+            valid_count, invalid_count, {item_id: "; ".join(e) for item_id, e in errors}
+        )
+
+    def test_compact_raise_on_error(self, items):
+        """Test compact validation raises on the first invalid item when requested."""
+        with pytest.raises(ValidationError, match="item V3"):
+            PortfolioValidator.validate_portfolio_compact(items, raise_on_error=True)
+
+
+class TestFirstErrorOnly:
+    """Tests for stopping validation at the first failing group of checks."""
+
+    def test_stops_at_first_failing_group(self, make_item):
+        """Test only the first failing group's errors are reported."""
+        item = make_item('F1', borrower_id='', credit_score=100, days_past_due=-1)
+
+        _, all_errors = PortfolioValidator.validate_item(item, raise_on_error=False)
+        is_valid, errors = PortfolioValidator.validate_item(item, raise_on_error=False, first_error_only=True)
+
+        assert not is_valid
+        assert errors == ["borrower_id is required"]
+        assert len(all_errors) == 3
+
+    def test_same_validity(self, items):
+        """Test validity matches full validation for every item."""
+        for item in items:
+            assert PortfolioValidator.validate_item(item, raise_on_error=False, first_error_only=True)[0] == \
+                PortfolioValidator.validate_item(item, raise_on_error=False)[0]
+
+    def test_filter_removes_invalid_items(self, items):
+        """Test filtering keeps the valid items and reports each invalid one."""
+        valid, invalid = validate_and_filter_portfolio(items, remove_invalid=True)
+
+        assert [item.item_id for item in valid] == ['V1', 'V2', 'V19']
+        assert [item_id for item_id, _ in invalid] == [item.item_id for item in items[2:18]]
+        assert all(errors for _, errors in invalid)
+
+
+class TestIterValidItems:
+    """Tests for streaming validation in batches."""
+
+    def test_batches(self, items, make_item):
+        """Test valid items are yielded in order in bounded batches."""
+        valid = [make_item(f'B{i}') for i in range(5)]
+        invalid = []
+
+        batches = list(iter_valid_items(iter(valid[:3] + items[2:4] + valid[3:]), batch_size=2,
+                                        invalid_items=invalid))
+
+        assert [[item.item_id for item in batch] for batch in batches] == [['B0', 'B1'], ['B2', 'B3'], ['B4']]
+        assert [item_id for item_id, _ in invalid] == ['V3', 'V4']
+
+    def test_raises_on_first_invalid(self, items):
+        """Test batches before the first invalid item are yielded before raising."""
+        batches = iter_valid_items(items, batch_size=2, remove_invalid=False)
+
+        assert [item.item_id for item in next(batches)] == ['V1', 'V2']
+        with pytest.raises(ValidationError, match="Invalid item V3"):
+            next(batches)
+
+class TestValidationCache:
+    """Tests for remembering items that passed validation."""
+
+    @pytest.fixture(autouse=True)
+    def _empty_cache(self):
+        """Start and end each test with an empty cache."""
+        PortfolioValidator.clear_cache()
+        yield
+        PortfolioValidator.clear_cache()
+
+    def test_cached_results_match(self, items):
+        """Test repeated cached validation gives the uncached results."""
+        expected = [PortfolioValidator.validate_item(item, raise_on_error=False) for item in items]
+
+        for _ in range(2):
+            assert [PortfolioValidator.validate_item(item, raise_on_error=False, use_cache=True)
+                    for item in items] == expected
+        assert len(validation._VALID_ITEM_KEYS) == 3
+
+    def test_changed_item_is_revalidated(self, items):
+        """Test an item changed after passing is checked again."""
+        item = items[0]
+        assert PortfolioValidator.validate_item(item, use_cache=True)[0]
+
+        item.credit_score = 900
+
+        assert not PortfolioValidator.validate_item(item, raise_on_error=False, use_cache=True)[0]
+
+    def test_size_limit(self, items, monkeypatch):
+        """Test the cache is emptied when it reaches its size limit."""
+        monkeypatch.setattr(validation, 'VALIDATION_CACHE_SIZE', 2)
+
+        valid_items, _ = validate_and_filter_portfolio(items, remove_invalid=True, use_cache=True)
+
+        assert len(valid_items) == 3
+        assert len(validation._VALID_ITEM_KEYS) == 1
+
+class TestReferenceDate:
+    """Tests for validating against a given date."""
+
+    def test_future_origination(self, make_item):
+        """Test origination dates are checked against the reference date."""
+        item = make_item('D1', origination_date=date(2030, 1, 1), maturity_date=date(2040, 1, 1),
+                         reporting_date=date(2031, 1, 1))
+
+        assert not PortfolioValidator.validate_item(item, raise_on_error=False, today=date(2029, 12, 31))[0]
+        assert PortfolioValidator.validate_item(item, raise_on_error=False, today=date(2030, 1, 1))[0]
+        assert PortfolioValidator.flag_invalid([item], today=date(2029, 12, 31)).tolist() == [True]
+        assert PortfolioValidator.flag_invalid([item], today=date(2030, 1, 1)).tolist() == [False]
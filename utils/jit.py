@@ -0,0 +1,27 @@
+"""Optional Numba JIT compilation support.
+
+Numba is an optional dependency. When it is installed, ``njit`` and
+``prange`` are re-exported from it; otherwise they degrade to a no-op
+decorator and the builtin ``range`` so kernels still run as plain Python.
+"""
+
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on environment
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Fallback for ``numba.njit`` that returns the function unchanged."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
+
+
+__all__ = ['njit', 'prange', 'NUMBA_AVAILABLE']
@@ -6,6 +6,9 @@ from typing import Optional
 
 import structlog
 
+# Minimum level emitted by the configured structlog filtering logger
+_log_level = logging.INFO
+
 
 def get_logger(name: Optional[str] = None) -> structlog.BoundLogger:
     """Get a configured structured logger.
@@ -37,16 +40,35 @@ def get_logger(name: Optional[str] = None) -> structlog.BoundLogger:
     return logger
 
 
+def is_enabled_for(level: int) -> bool:
+    """Check whether log messages at a level will be emitted.
+
+    Use to guard logging calls in hot paths so their arguments are only
+    evaluated when the message is actually logged.
+
+    Args:
+        level: Logging level (e.g. logging.DEBUG)
+
+    Returns:
+        True if messages at this level are emitted
+    """
+    return level >= _log_level
+
+
 def configure_logging(level: str = "INFO"):
     """Configure logging level.
 
     Args:
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
     """
+    global _log_level
+
     numeric_level = getattr(logging, level.upper(), None)
     if not isinstance(numeric_level, int):
         raise ValueError(f'Invalid log level: {level}')
 
+    _log_level = numeric_level
+
     logging.basicConfig(
         format="%(message)s",
         stream=sys.stdout,